@@ -5,8 +5,12 @@ Quantum Playground - 量子物理交互实验大厅
 Demo 模块从 demos/ 目录自动发现。
 """
 
+import threading
+
 import streamlit as st
-from demos import build_registry
+from demos import build_registry, run_warmups
+from demos.reactive import list_graphs
+from demos.session_store import current_session_id, get_store
 
 st.set_page_config(
     page_title="Quantum Playground",
@@ -19,6 +23,25 @@ DEMO_REGISTRY = build_registry()
 SLUGS = list(DEMO_REGISTRY.keys())
 NAMES = [v[0] for v in DEMO_REGISTRY.values()]
 
+WARMUP_STATUS = {
+    "running": "⏳ 预热中",
+    "done": "✅ 完成",
+    "over_budget": "⚠️ 超出预算",
+    "failed": "❌ 失败",
+}
+
+
+@st.cache_resource
+def start_warmup() -> dict[str, dict]:
+    """在后台线程中预热所有 demo 的缓存（每个服务进程只执行一次）"""
+    reports: dict[str, dict] = {}
+
+    threading.Thread(target=run_warmups, args=(reports,), name="demo-warmup", daemon=True).start()
+    return reports
+
+
+WARMUP_REPORTS = start_warmup()
+
 # --- 初始化 session_state ---
 if "current_demo" not in st.session_state:
     url_slug = st.query_params.get("demo", SLUGS[0] if SLUGS else "home")
@@ -48,3 +71,38 @@ st.sidebar.markdown("---")
 
 # --- 路由到选中的 demo ---
 DEMO_REGISTRY[st.session_state.current_demo][1]()
+
+# --- Sidebar: 缓存预热状态 ---
+st.sidebar.markdown("---")
+with st.sidebar.expander("⏱️ 缓存预热"):
+    for slug, report in list(WARMUP_REPORTS.items()):
+        st.caption(
+            f"{DEMO_REGISTRY[slug][0]}：{WARMUP_STATUS[report['status']]}，"
+            f"{report['completed']}/{report['total']} 个参数点，"
+            f"{report['elapsed']:.1f} s / {report['budget']:.0f} s"
+        )
+
+# --- Sidebar: 会话内存 ---
+with st.sidebar.expander("🧠 会话内存"):
+    metrics = get_store().metrics()
+    session = metrics["sessions"].get(current_session_id(), {"bytes": 0, "entries": 0})
+    st.caption(
+        f"当前会话：{session['bytes'] / 2**20:.1f} MB / {metrics['session_budget'] / 2**20:.0f} MB，"
+        f"{session['entries']} 个结果"
+    )
+    st.caption(
+        f"全部 {len(metrics['sessions'])} 个会话：{metrics['total_bytes'] / 2**20:.1f} MB / "
+        f"{metrics['global_budget'] / 2**20:.0f} MB"
+    )
+    st.caption(
+        f"命中 {metrics['hits']}，未命中 {metrics['misses']}，淘汰 {metrics['evictions']}"
+    )
+
+# --- Sidebar: 计算图 ---
+with st.sidebar.expander("🔧 计算图"):
+    graphs = list_graphs()
+    if not graphs:
+        st.caption("当前会话尚未构建计算图")
+    for name, graph in graphs.items():
+        st.caption(name)
+        st.dataframe(graph.describe(), hide_index=True, use_container_width=True)
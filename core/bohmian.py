@@ -0,0 +1,218 @@
+"""
+玻姆轨迹 - 高斯波包的粒子系综
+
+de Broglie–Bohm 图像中，粒子沿速度场
+    v(x, t) = (ℏ/m) Im(∂ₓΨ / Ψ)
+运动；初始位置按 |Ψ(x,0)|² 分布时，任意时刻的位置分布都是 |Ψ(x,t)|²。
+对自由高斯波包（参数同 core.gaussian_wavepacket），记 τ = ℏt/(2mσ²)，
+    v(x, t) = (ℏ/m) [k₀ + (x - x₀) τ / (2σ²)] / (1 + τ²)
+轨迹有解析解 x(t) = x₀ + ℏk₀t/m + (x(0) - x₀)√(1 + τ²)，用于检验积分器。
+
+积分器对整个系综数组做定步长 RK4，速度场可以是任意的逐点函数。
+系综按块（默认 core.execution 的 chunk_size 个粒子）依次积分，
+每块数组可放入缓存，记录时刻的位置以流的形式交给调用方；
+只保留用于绘图的少量轨迹与逐时刻的统计量，内存与粒子总数、步数都无关。
+一维轨迹互不交叉，初始位置排序后等间隔抽取的轨迹就是系综的分位数轨迹。
+积分缓冲区的精度见 core.precision；统计量总是以 float64 累加。
+"""
+
+from typing import Callable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .execution import get_config
+from .precision import resolve_dtypes
+
+# 速度场：v(x, t)，x 为粒子位置数组，t 为标量时间
+VelocityField = Callable[[NDArray[np.floating], float], NDArray[np.floating]]
+
+
+def gaussian_velocity_field(
+    x0: float = 0.0,
+    k0: float = 0.0,
+    sigma: float = 1.0,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+) -> VelocityField:
+    """
+    自由高斯波包的玻姆速度场 v(x, t)
+
+    参数:
+        x0, k0, sigma, mass, hbar: 同 core.gaussian_wavepacket.compute_wavefunction
+
+    返回:
+        速度场函数 v(x, t)
+    """
+    tau_rate = hbar / (2 * mass * sigma**2)
+
+    def velocity(x: NDArray[np.floating], t: float) -> NDArray[np.floating]:
+        tau = tau_rate * t
+        scale = hbar / (mass * (1 + tau**2))
+        return (x - x0) * (scale * tau / (2 * sigma**2)) + scale * k0
+
+    return velocity
+
+
+def gaussian_trajectory(
+    x_initial: NDArray[np.floating],
+    t: float,
+    x0: float = 0.0,
+    k0: float = 0.0,
+    sigma: float = 1.0,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+) -> NDArray[np.floating]:
+    """自由高斯波包中从 x_initial 出发的玻姆轨迹在时刻 t 的解析位置"""
+    tau = hbar * t / (2 * mass * sigma**2)
+    return x0 + hbar * k0 * t / mass + (np.asarray(x_initial) - x0) * np.sqrt(1 + tau**2)
+
+
+def sample_initial_positions(
+    num_particles: int,
+    x0: float = 0.0,
+    sigma: float = 1.0,
+    rng: np.random.Generator | None = None,
+) -> NDArray[np.floating]:
+    """
+    按 |Ψ(x,0)|² 抽样初始位置（高斯波包的 |Ψ|² 是均值 x₀、标准差 σ 的正态分布）
+
+    返回:
+        形状 (num_particles,) 的升序位置数组
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    return np.sort(rng.normal(x0, sigma, num_particles))
+
+
+def trajectory_steps(num_steps: int, record_every: int) -> NDArray[np.intp]:
+    """记录位置的步序号：每隔 record_every 步一次，第 0 步与最后一步总会记录"""
+    return np.unique(np.append(np.arange(0, num_steps + 1, record_every), num_steps))
+
+
+def iter_trajectory_snapshots(
+    x_initial: NDArray[np.floating],
+    velocity: VelocityField,
+    t_max: float,
+    num_steps: int,
+    record_every: int = 1,
+    chunk_size: int | None = None,
+    precision: str | None = None,
+) -> Iterator[tuple[int, int, NDArray[np.floating]]]:
+    """
+    逐块用定步长 RK4 积分粒子系综，在记录时刻产出当前位置
+
+    参数:
+        x_initial: 初始位置，形状 (N,)
+        velocity: 速度场 v(x, t)
+        t_max: 终止时间
+        num_steps: 时间步数，步长 t_max / num_steps
+        record_every: 每隔多少步产出一次位置（见 trajectory_steps）
+        chunk_size: 每块的粒子数，None 时使用 core.execution 的 chunk_size
+        precision: "float64" 或 "float32"，None 时使用全局设置
+
+    返回:
+        生成器，产出 (起始粒子下标, 记录序号, 位置数组)；
+        位置数组是积分缓冲区本身，继续迭代后会被覆盖，需要保留时请复制
+    """
+    real_dtype, _ = resolve_dtypes(precision)
+    chunk_size = chunk_size or get_config()["chunk_size"]
+    dt = t_max / num_steps
+    record_steps = set(trajectory_steps(num_steps, record_every).tolist())
+
+    for start in range(0, len(x_initial), chunk_size):
+        x = np.array(x_initial[start:start + chunk_size], dtype=real_dtype)
+        row = 0
+        yield start, row, x
+
+        for step in range(num_steps):
+            t = step * dt
+            k1 = velocity(x, t)
+            k2 = velocity(x + (0.5 * dt) * k1, t + 0.5 * dt)
+            k3 = velocity(x + (0.5 * dt) * k2, t + 0.5 * dt)
+            k4 = velocity(x + dt * k3, t + dt)
+
+            # x += dt/6 · (k1 + 2k2 + 2k3 + k4)，原地累加
+            k2 += k3
+            k2 *= 2
+            k1 += k2
+            k1 += k4
+            k1 *= dt / 6
+            x += k1
+
+            if step + 1 in record_steps:
+                row += 1
+                yield start, row, x
+
+
+def compute_gaussian_trajectories(
+    num_particles: int,
+    t_max: float,
+    num_steps: int = 1000,
+    record_every: int = 10,
+    num_plotted: int = 50,
+    x0: float = 0.0,
+    k0: float = 0.0,
+    sigma: float = 1.0,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+    seed: int | None = 0,
+    chunk_size: int | None = None,
+    precision: str | None = None,
+) -> dict[str, NDArray[np.floating]]:
+    """
+    积分高斯波包的玻姆轨迹系综，返回抽稀后的轨迹与逐时刻统计量
+
+    参数:
+        num_particles: 系综粒子数
+        t_max: 终止时间
+        num_steps: RK4 步数
+        record_every: 每隔多少步记录一次（时间方向的抽稀）
+        num_plotted: 保留用于绘图的轨迹数（系综方向的抽稀，取等间隔分位数）
+        x0, k0, sigma, mass, hbar: 同 core.gaussian_wavepacket.compute_wavefunction
+        seed: 初始位置抽样的随机种子
+        chunk_size: 每块的粒子数，None 时使用 core.execution 的 chunk_size
+        precision: 积分精度，"float64" 或 "float32"，None 时使用全局设置
+
+    返回:
+        字典：
+        - "t": 记录时刻，形状 (R,)
+        - "trajectories": 抽稀后的轨迹，形状 (R, num_plotted)
+        - "mean", "std": 全部粒子位置的均值与标准差，形状 (R,)
+        - "max_error": 全部粒子终点与解析轨迹的最大偏差（标量数组）
+    """
+    x_initial = sample_initial_positions(num_particles, x0, sigma, np.random.default_rng(seed))
+    velocity = gaussian_velocity_field(x0, k0, sigma, mass, hbar)
+    steps = trajectory_steps(num_steps, record_every)
+
+    plotted = np.linspace(0, num_particles - 1, min(num_plotted, num_particles)).round().astype(int)
+    trajectories = np.empty((len(steps), len(plotted)))
+    total = np.zeros(len(steps))
+    total_squared = np.zeros(len(steps))
+    max_error = 0.0
+
+    for start, row, x in iter_trajectory_snapshots(
+        x_initial, velocity, t_max, num_steps, record_every, chunk_size, precision
+    ):
+        stop = start + x.size
+        in_chunk = (plotted >= start) & (plotted < stop)
+        trajectories[row, in_chunk] = x[plotted[in_chunk] - start]
+
+        # 统计量以 float64 累加，float32 积分时先转换当前块
+        x_stats = x.astype(np.float64, copy=False)
+        total[row] += x_stats.sum()
+        total_squared[row] += np.dot(x_stats, x_stats)
+
+        if row == len(steps) - 1:
+            exact = gaussian_trajectory(x_initial[start:stop], t_max, x0, k0, sigma, mass, hbar)
+            max_error = max(max_error, float(np.max(np.abs(x - exact))))
+
+    mean = total / num_particles
+    std = np.sqrt(np.maximum(total_squared / num_particles - mean**2, 0.0))
+
+    return {
+        "t": steps * (t_max / num_steps),
+        "trajectories": trajectories,
+        "mean": mean,
+        "std": std,
+        "max_error": np.asarray(max_error),
+    }
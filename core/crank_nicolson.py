@@ -0,0 +1,195 @@
+"""
+Crank–Nicolson 含时求解器 - 硬墙盒子与非周期势中的批量波函数演化
+
+哈密顿量用 core.stationary_states.build_hamiltonian 离散
+（网格两端之外 ψ = 0，相当于无限高势墙），不需要周期边界，
+因此适用于分步 FFT 方法处理不了的盒子与任意势。
+
+Crank–Nicolson 格式
+    (1 + iΔt H/2ℏ) ψⁿ⁺¹ = (1 - iΔt H/2ℏ) ψⁿ
+记 A = 1 + iΔt H/2ℏ，右端算子 1 - iΔt H/2ℏ = 2 - A，于是
+    ψⁿ⁺¹ = 2 A⁻¹ψⁿ - ψⁿ
+每步只需一次三对角求解，不需要矩阵乘法。
+
+A 的循环约化分解（core.tridiagonal）只依赖 (网格, Δt, V)，按这些参数缓存；
+参数扫描时一次分解 S 个矩阵，占用 O(N·S) 的内存，缓存按字节预算淘汰最久未使用的分解。
+每步对一批 (N, B) 的波函数整体求解，代价 O(N·B)。
+传播子 (2 - A)A⁻¹ 对厄米的 H 严格幺正，范数只因舍入误差漂移，
+演化过程中逐帧检查。
+"""
+
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Iterator
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .execution import evaluate_columnwise
+from .precision import resolve_dtypes
+from .stationary_states import build_hamiltonian
+from .tridiagonal import Level, factorize, solve_factorized
+
+# 各精度下允许的范数相对漂移
+NORM_TOLERANCE = {
+    np.complex128: 1e-8,
+    np.complex64: 1e-3,
+}
+
+# 分解缓存的字节预算
+FACTORIZATION_CACHE_BYTES = 64 * 2**20
+
+# 分解结果：(各层约化数据, 最后一层的主元)
+Factorization = tuple[list[Level], NDArray[np.complexfloating]]
+
+# 分解缓存：(势能字节, N, Δx, Δt, m, ℏ, dtype) -> 分解结果，按访问顺序排列
+_factorization_cache: OrderedDict[tuple, Factorization] = OrderedDict()
+_factorization_bytes = 0
+_factorization_lock = threading.Lock()
+
+
+def _factorize_propagator(
+    potential_bytes: bytes,
+    num_points: int,
+    dx: float,
+    dt: float,
+    mass: float,
+    hbar: float,
+    complex_dtype: type[np.complexfloating],
+) -> Factorization:
+    """
+    分解 A = 1 + iΔt H/2ℏ
+
+    potential_bytes 为形状 (N, S) 的势能；S > 1 时同时分解 S 个矩阵，
+    每个波函数使用各自的势能。
+    """
+    potential = np.frombuffer(potential_bytes, dtype=float).reshape(num_points, -1)
+    x = dx * np.arange(num_points)
+
+    diags, offs = zip(*(build_hamiltonian(x, v, mass, hbar) for v in potential.T))
+    scale = 1j * dt / (2 * hbar)
+    diag = 1 + scale * np.stack(diags, axis=1)
+    off = scale * np.stack(offs, axis=1)
+
+    # 以 complex128 分解，再转换为计算精度
+    levels, last_pivot = factorize(diag, off)
+    levels = [tuple(part.astype(complex_dtype) for part in level) for level in levels]
+
+    return levels, last_pivot.astype(complex_dtype)
+
+
+def _factorization_nbytes(factorization: Factorization) -> int:
+    """分解结果占用的字节数"""
+    levels, last_pivot = factorization
+    return last_pivot.nbytes + sum(part.nbytes for level in levels for part in level)
+
+
+def _cached_propagator(*key) -> Factorization:
+    """
+    按 (网格, Δt, V) 缓存的 _factorize_propagator
+
+    缓存总字节数超过 FACTORIZATION_CACHE_BYTES 时淘汰最久未使用的分解
+    （至少保留刚计算的一项）。
+    """
+    global _factorization_bytes
+
+    with _factorization_lock:
+        factorization = _factorization_cache.get(key)
+        if factorization is not None:
+            _factorization_cache.move_to_end(key)
+            return factorization
+
+    factorization = _factorize_propagator(*key)
+
+    with _factorization_lock:
+        if key not in _factorization_cache:
+            _factorization_cache[key] = factorization
+            _factorization_bytes += _factorization_nbytes(factorization)
+        while _factorization_bytes > FACTORIZATION_CACHE_BYTES and len(_factorization_cache) > 1:
+            _, evicted = _factorization_cache.popitem(last=False)
+            _factorization_bytes -= _factorization_nbytes(evicted)
+
+    return factorization
+
+
+def _step_kernel(
+    psi: NDArray[np.complexfloating],
+    levels: list[Level],
+    last_pivot: NDArray[np.complexfloating],
+) -> NDArray[np.complexfloating]:
+    """一步 ψ ← 2A⁻¹ψ - ψ（对各列独立）"""
+    result = solve_factorized(levels, last_pivot, psi)
+    result *= 2
+    result -= psi
+    return result
+
+
+def evolve_crank_nicolson(
+    psi0: ArrayLike,
+    x: NDArray[np.floating],
+    potential: ArrayLike,
+    dt: float,
+    num_steps: int,
+    frame_every: int = 1,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+    precision: str | None = None,
+    num_threads: int | None = None,
+    norm_tolerance: float | None = None,
+) -> Iterator[tuple[float, NDArray[np.complexfloating], NDArray[np.floating]]]:
+    """
+    用 Crank–Nicolson 格式同时演化一批波函数，逐帧产出
+
+    参数:
+        psi0: 初始波函数，形状 (N,) 或 (N, B)，每列是一个独立的波函数
+        x: 均匀空间网格，形状 (N,)
+        potential: 势能，形状 (N,) 时所有波函数共用；
+                   形状 (N, B) 时每列使用各自的势能（参数扫描）
+        dt: 时间步长（格式无条件稳定，精度要求 Δt·E_max/ℏ 较小）
+        num_steps: 总步数
+        frame_every: 每隔多少步产出一帧
+        mass: 粒子质量 m
+        hbar: 约化普朗克常数 ℏ
+        precision: "float64" 或 "float32"，None 时使用全局设置
+        num_threads: 线程数，None 时使用 core.execution 的全局配置；
+                     所有波函数共用势能时按列分块并行
+        norm_tolerance: 允许的范数相对漂移，None 时按精度取 NORM_TOLERANCE
+
+    返回:
+        生成器，产出 (t, psi, norms) 元组：psi 形状与 psi0 相同，
+        norms 为各波函数的 ∫|ψ|²dx（psi0 为一维时是标量数组）；
+        第一帧为 t = 0
+
+    异常:
+        RuntimeError: 某个波函数的范数相对漂移超过 norm_tolerance
+    """
+    _, complex_dtype = resolve_dtypes(precision)
+    dx = float(x[1] - x[0])
+
+    psi0 = np.asarray(psi0)
+    psi = psi0.reshape(psi0.shape[0], -1).astype(complex_dtype)
+    potential = np.ascontiguousarray(potential, dtype=float).reshape(psi.shape[0], -1)
+
+    levels, last_pivot = _cached_propagator(
+        potential.tobytes(), psi.shape[0], dx, float(dt), mass, hbar, complex_dtype
+    )
+    step = partial(_step_kernel, levels=levels, last_pivot=last_pivot)
+    if potential.shape[1] == 1:
+        step = partial(evaluate_columnwise, step, num_threads=num_threads)
+
+    tolerance = norm_tolerance if norm_tolerance is not None else NORM_TOLERANCE[complex_dtype]
+    norms0 = np.sum(np.abs(psi) ** 2, axis=0) * dx
+
+    yield 0.0, psi.reshape(psi0.shape), norms0.reshape(psi0.shape[1:])
+
+    for n in range(1, num_steps + 1):
+        psi = step(psi)
+
+        if n % frame_every == 0 or n == num_steps:
+            norms = np.sum(np.abs(psi) ** 2, axis=0) * dx
+            drift = np.max(np.abs(norms - norms0) / np.maximum(norms0, np.finfo(float).tiny))
+            if drift > tolerance:
+                raise RuntimeError(f"第 {n} 步范数相对漂移 {drift:.2e} 超过容差 {tolerance:.0e}")
+
+            yield n * dt, psi.reshape(psi0.shape), norms.reshape(psi0.shape[1:])
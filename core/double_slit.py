@@ -4,7 +4,35 @@
 实现双缝干涉实验的强度分布计算，基于 Fraunhofer 衍射近似。
 """
 
+from functools import partial
+from typing import Iterator
+
 import numpy as np
+from numpy.typing import NDArray
+
+from .execution import evaluate_elementwise
+from .precision import resolve_dtypes
+from .progressive import progressive_evaluate
+
+
+def double_slit_intensity(
+    x: NDArray[np.floating],
+    wavelength: float,
+    slit_distance: float,
+    screen_distance: float,
+) -> NDArray[np.floating]:
+    """
+    逐点计算屏幕位置 x 处的归一化干涉强度 cos²(π d x / (λ L))。
+
+    这是 compute_double_slit 的计算内核，可直接用于任意形状的坐标数组。
+    """
+    # 计算相位差
+    # δ = 2π * d * sin(θ) / λ ≈ 2π * d * x / (λ * L) (小角度近似)
+    phase_difference = np.pi * slit_distance * x / (wavelength * screen_distance)
+
+    # 计算干涉强度（双缝干涉公式）
+    # I = I₀ * cos²(δ/2) = I₀ * cos²(π * d * x / (λ * L))
+    return np.cos(phase_difference) ** 2
 
 
 def compute_double_slit(
@@ -13,6 +41,8 @@ def compute_double_slit(
     screen_distance: float,
     x_range: float | None = None,
     num_points: int = 2000,
+    num_threads: int | None = None,
+    precision: str | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     计算双缝干涉实验中屏幕上的光强分布。
@@ -50,6 +80,12 @@ def compute_double_slit(
     num_points : int, optional
         屏幕上采样点的数量，默认为 2000。
         更多的点数会产生更平滑的曲线。
+    num_threads : int or None, optional
+        求值线程数，None 时使用 core.execution 的全局配置。
+        点数较少时总是串行求值。
+    precision : str or None, optional
+        "float64" 或 "float32"，None 时使用 core.precision 的全局设置。
+        float32 的误差界见 core.precision。
 
     Returns
     -------
@@ -72,16 +108,109 @@ def compute_double_slit(
         x_range = 10 * fringe_spacing
     
     # 生成屏幕坐标数组
-    x = np.linspace(-x_range, x_range, num_points)
+    real_dtype, _ = resolve_dtypes(precision)
+    x = np.linspace(-x_range, x_range, num_points, dtype=real_dtype)
     
-    # 计算相位差
-    # δ = 2π * d * sin(θ) / λ ≈ 2π * d * x / (λ * L) (小角度近似)
-    phase_difference = np.pi * slit_distance * x / (wavelength * screen_distance)
-    
-    # 计算干涉强度（双缝干涉公式）
-    # I = I₀ * cos²(δ/2) = I₀ * cos²(π * d * x / (λ * L))
-    intensity = np.cos(phase_difference) ** 2
+    # 逐点计算干涉强度，大网格自动分块并行
+    kernel = partial(
+        double_slit_intensity,
+        wavelength=real_dtype(wavelength),
+        slit_distance=real_dtype(slit_distance),
+        screen_distance=real_dtype(screen_distance),
+    )
+    intensity = evaluate_elementwise(kernel, x, num_threads=num_threads)
     
     # 强度已经自动归一化到 [0, 1] 范围（cos² 的值域）
     
     return x, intensity
+
+
+def iter_double_slit_refinements(
+    wavelength: float,
+    slit_distance: float,
+    screen_distance: float,
+    x_range: float | None = None,
+    num_points: int = 2000,
+    strides: list[int] | None = None,
+    precision: str | None = None,
+) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+    """
+    由粗到细地计算屏幕上的光强分布。
+
+    与 compute_double_slit 使用相同的网格与计算内核，但先在 1/16
+    （或更粗）分辨率的子网格上求值，再逐级加密，已计算的点直接复用。
+    最后一级的结果与 compute_double_slit 逐位相同。
+
+    Parameters
+    ----------
+    wavelength, slit_distance, screen_distance, x_range, num_points, precision
+        同 compute_double_slit。
+    strides : list[int] or None, optional
+        从粗到细的步长列表，None 时由 core.progressive.progressive_strides 决定。
+
+    Yields
+    ------
+    tuple[int, np.ndarray, np.ndarray]
+        每级产出 (stride, x, intensity)，x 与 intensity 为完整网格每隔 stride 个点的采样。
+    """
+    if x_range is None:
+        x_range = 10 * wavelength * screen_distance / slit_distance
+
+    real_dtype, _ = resolve_dtypes(precision)
+    x = np.linspace(-x_range, x_range, num_points, dtype=real_dtype)
+
+    kernel = partial(
+        double_slit_intensity,
+        wavelength=real_dtype(wavelength),
+        slit_distance=real_dtype(slit_distance),
+        screen_distance=real_dtype(screen_distance),
+    )
+    yield from progressive_evaluate(kernel, x, strides)
+
+
+def sample_double_slit_hits(
+    num_hits: int,
+    wavelength: float,
+    slit_distance: float,
+    screen_distance: float,
+    x_range: float,
+    coherence: float = 1.0,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    按干涉强度分布抽样单个光子在屏幕上的命中位置。
+
+    部分相干光的强度为 I(x) ∝ 1 + γ cos(2π d x / (λ L))，
+    γ = 1 时即 compute_double_slit 的 cos² 分布，γ = 0 时没有条纹。
+    用高分辨率网格上的累积分布做逆变换抽样。
+
+    Parameters
+    ----------
+    num_hits : int
+        抽样的光子数。
+    wavelength, slit_distance, screen_distance : float
+        同 compute_double_slit。
+    x_range : float
+        屏幕坐标范围 [-x_range, x_range]。
+    coherence : float, optional
+        相干度 γ（0 到 1），即条纹的理论可见度，默认为 1。
+    rng : np.random.Generator or None, optional
+        随机数生成器，None 时新建一个。
+
+    Returns
+    -------
+    np.ndarray
+        长度为 num_hits 的命中位置数组。
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+
+    # 每个条纹至少 64 个网格点，保证逆变换的插值误差远小于条纹间距
+    fringe_spacing = wavelength * screen_distance / slit_distance
+    num_grid = max(4096, int(64 * 2 * x_range / fringe_spacing))
+    x = np.linspace(-x_range, x_range, num_grid)
+
+    intensity = 1 + coherence * np.cos(2 * np.pi * x / fringe_spacing)
+    cdf = np.concatenate([[0.0], np.cumsum((intensity[1:] + intensity[:-1]) / 2)])
+    cdf /= cdf[-1]
+
+    return np.interp(rng.random(num_hits), cdf, x)
@@ -0,0 +1,208 @@
+"""
+计算执行后端
+
+为逐点（elementwise）计算内核提供可插拔的执行方式：
+小数组直接串行求值；大数组被切分为缓存大小的块，
+在线程池中并行求值。NumPy 的超越函数 ufunc（cos、exp 等）
+在计算期间会释放 GIL，因此多线程可以获得接近线性的加速。
+
+由于内核是逐点的，分块求值与整体求值的结果逐位相同。
+"""
+
+import os
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+# 默认每块元素数：2^16 个 float64 约 512 KB，可放入典型 L2 缓存
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# 低于此元素数时直接串行求值，避免线程调度开销
+DEFAULT_SERIAL_THRESHOLD = 1 << 18
+
+# NumPy >= 2.0 的 FFT 支持 out 参数，可在复用的缓冲区上原地变换
+FFT_SUPPORTS_OUT = int(np.__version__.split(".")[0]) >= 2
+
+
+
+def _default_num_threads() -> int:
+    """默认线程数：环境变量 QR_NUM_THREADS，未设置或无效时为 CPU 核数"""
+    value = os.environ.get("QR_NUM_THREADS", "").strip()
+    if value:
+        try:
+            num_threads = int(value)
+        except ValueError:
+            num_threads = 0
+        if num_threads >= 1:
+            return num_threads
+        warnings.warn(f"忽略无效的 QR_NUM_THREADS={value!r}，使用 CPU 核数", RuntimeWarning)
+
+    return os.cpu_count() or 1
+
+
+_config = {
+    "num_threads": _default_num_threads(),
+    "chunk_size": DEFAULT_CHUNK_SIZE,
+    "serial_threshold": DEFAULT_SERIAL_THRESHOLD,
+}
+
+# 共享线程池只创建一次，之后不再重建；
+# 单次调用的并行度由提交的任务数限制，而不是改变线程池大小
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def configure(
+    num_threads: int | None = None,
+    chunk_size: int | None = None,
+    serial_threshold: int | None = None,
+) -> None:
+    """
+    修改全局执行配置。
+
+    参数:
+        num_threads: 线程数；1 表示始终串行求值
+        chunk_size: 每块的元素数
+        serial_threshold: 低于此元素数时串行求值
+
+    未传入（None）的参数保持不变。
+    线程数也可通过环境变量 QR_NUM_THREADS 设置默认值。
+    """
+    if num_threads is not None:
+        if num_threads < 1:
+            raise ValueError("num_threads 必须 >= 1")
+        _config["num_threads"] = num_threads
+    if chunk_size is not None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size 必须 >= 1")
+        _config["chunk_size"] = chunk_size
+    if serial_threshold is not None:
+        _config["serial_threshold"] = serial_threshold
+
+
+def get_config() -> dict[str, int]:
+    """返回当前执行配置的副本"""
+    return dict(_config)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    获取共享线程池（首次调用时创建，线程安全）
+
+    线程池大小取创建时配置的线程数与 CPU 核数中的较大者；
+    之后 configure() 或单次调用传入更多线程时，多出的任务在池中排队。
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(_config["num_threads"], os.cpu_count() or 1),
+                thread_name_prefix="qr-exec",
+            )
+
+    return _executor
+
+
+def _run_in_pool(tasks: list[Callable[[], None]], num_threads: int) -> None:
+    """把 tasks 分成至多 num_threads 组提交到共享线程池，等待全部完成"""
+    groups = [tasks[w::num_threads] for w in range(min(num_threads, len(tasks)))]
+
+    def run_group(group: list[Callable[[], None]]) -> None:
+        for task in group:
+            task()
+
+    executor = _get_executor()
+    futures = [executor.submit(run_group, group) for group in groups]
+    for future in futures:
+        future.result()
+
+
+def evaluate_elementwise(
+    kernel: Callable[[NDArray], NDArray],
+    x: NDArray,
+    num_threads: int | None = None,
+) -> NDArray:
+    """
+    对数组 x 逐点求值 kernel(x)。
+
+    kernel 必须是逐点运算：输出形状与输入相同，且每个输出元素
+    只依赖于对应的输入元素。任意维度的网格都会按展平后的顺序分块，
+    因此 1D 与 2D 网格使用相同的执行路径。
+
+    参数:
+        kernel: 逐点计算函数
+        x: 输入数组（任意形状）
+        num_threads: 本次调用的线程数，None 时使用全局配置
+
+    返回:
+        与 x 同形状的结果数组，与串行调用 kernel(x) 的结果逐位相同
+    """
+    x = np.asarray(x)
+    num_threads = num_threads or _config["num_threads"]
+    chunk_size = _config["chunk_size"]
+
+    if num_threads <= 1 or x.size < max(_config["serial_threshold"], 2 * chunk_size):
+        return kernel(x)
+
+    flat = x.reshape(-1)
+    bounds = [(i, min(i + chunk_size, flat.size)) for i in range(0, flat.size, chunk_size)]
+
+    # 先求值第一块以确定输出 dtype
+    first = kernel(flat[bounds[0][0]:bounds[0][1]])
+    out = np.empty(flat.size, dtype=first.dtype)
+    out[bounds[0][0]:bounds[0][1]] = first
+
+    def run(start: int, stop: int) -> None:
+        out[start:stop] = kernel(flat[start:stop])
+
+    _run_in_pool([partial(run, start, stop) for start, stop in bounds[1:]], num_threads)
+
+    return out.reshape(x.shape)
+
+
+def evaluate_columnwise(
+    kernel: Callable[[NDArray], NDArray],
+    x: NDArray,
+    num_threads: int | None = None,
+) -> NDArray:
+    """
+    对二维数组 x 按列分块求值 kernel(x)。
+
+    kernel 必须对各列独立运算：输出形状与输入相同，且每一列的输出
+    只依赖于同一列的输入（例如对一批右端项求解同一个线性方程组）。
+    列被切分为 num_threads 个连续的块，在共享线程池中并行求值；
+    与 evaluate_elementwise 使用同一个线程池，交替调用不会重建线程池。
+
+    参数:
+        kernel: 按列独立的计算函数
+        x: 输入数组，形状 (n, B)
+        num_threads: 本次调用的线程数，None 时使用全局配置
+
+    返回:
+        与 x 同形状的结果数组，与串行调用 kernel(x) 的结果逐位相同
+    """
+    x = np.asarray(x)
+    # 并行度只限制列块的个数，不影响线程池大小
+    num_threads = min(num_threads or _config["num_threads"], x.shape[1])
+
+    if num_threads <= 1 or x.size < _config["serial_threshold"]:
+        return kernel(x)
+
+    bounds = np.linspace(0, x.shape[1], num_threads + 1).astype(int)
+
+    first = kernel(x[:, bounds[0]:bounds[1]])
+    out = np.empty(x.shape, dtype=first.dtype)
+    out[:, bounds[0]:bounds[1]] = first
+
+    def run(start: int, stop: int) -> None:
+        out[:, start:stop] = kernel(x[:, start:stop])
+
+    _run_in_pool([partial(run, start, stop) for start, stop in zip(bounds[1:-1], bounds[2:])], num_threads)
+
+    return out
@@ -0,0 +1,297 @@
+"""
+干涉条纹分析 - 从数据中测量条纹周期、相位与可见度
+
+条纹模型：
+    I(x) = M [1 + V cos(2π f x + φ)] × 缓变包络
+其中 f = 1/P 为条纹空间频率，φ 为 x = 0 处的相位，
+V = (I_max - I_min)/(I_max + I_min) 为可见度。
+
+测量步骤：
+1. 减去加权均值后乘（周期）Hann 窗，抑制直流与截断带来的频谱泄漏
+2. FFT 找到最强的非直流谱峰
+3. 对峰值附近三个点的对数幅度做抛物线插值（Hann 窗下的高斯插值），
+   得到亚 bin 精度的频率
+4. 在插值后的频率处直接求窗函数加权的 DTFT，得到振幅与相位：
+       S(f) = Σ wₙ (Iₙ - M) e^{-2πi f xₙ} ≈ (M V / 2) e^{iφ} Σ wₙ
+   直方图计数是条纹在宽 Δx 的 bin 上的平均，振幅衰减为 sinc(f Δx) 倍，
+   测量可见度时除以该因子
+
+谱峰落在搜索范围的下边界（min_bin）时，窗口内不足约两个条纹周期，
+峰值可能来自更低的频率或包络的泄漏，此时不给出测量值（resolved = False）。
+
+StreamingFringeAnalyzer 维护计数直方图及其加窗频谱，
+新到的计数按线性关系只把增量的频谱加到累计频谱上，
+每次更新的代价只取决于直方图的 bin 数与本批数据量，与累计的总计数无关。
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+# 搜索谱峰时跳过的低频 bin 数（直流与缓变包络）
+DEFAULT_MIN_BIN = 2
+
+
+def _hann(n: int) -> NDArray[np.floating]:
+    """周期 Hann 窗 0.5 - 0.5cos(2πn/N)，其 DFT 只有 bin 0 与 bin ±1 非零"""
+    return 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(n) / n)
+
+
+def _interpolate_peak(left: float, center: float, right: float) -> float:
+    """对三个相邻 bin 的幅度做对数抛物线插值，返回峰值相对中心 bin 的偏移（-0.5 到 0.5）"""
+    left, center, right = np.log(np.maximum([left, center, right], np.finfo(float).tiny))
+    denominator = left - 2 * center + right
+    if denominator >= 0:
+        return 0.0
+
+    return float(np.clip(0.5 * (left - right) / denominator, -0.5, 0.5))
+
+
+def _measure(
+    frequency: float,
+    weighted: NDArray[np.floating],
+    mean: float,
+    window_sum: float,
+    x: NDArray[np.floating],
+    bin_width: float = 0.0,
+) -> dict[str, float]:
+    """在给定频率处求 DTFT，换算为周期、相位与可见度；bin_width > 0 时校正 bin 平均的衰减"""
+    spectrum = np.dot(weighted, np.exp(-2j * np.pi * frequency * x))
+    amplitude = 2 * np.abs(spectrum) / window_sum / np.sinc(frequency * bin_width)
+
+    return {
+        "period": float(1 / frequency) if frequency > 0 else np.inf,
+        "frequency": float(frequency),
+        "phase": float(np.angle(spectrum)),
+        "visibility": float(amplitude / mean) if mean > 0 else 0.0,
+        "mean": float(mean),
+        "resolved": True,
+    }
+
+
+def _unresolved(mean: float) -> dict[str, float]:
+    """窗口内条纹周期不足时的结果：只给出均值"""
+    return {
+        "period": np.nan,
+        "frequency": np.nan,
+        "phase": np.nan,
+        "visibility": np.nan,
+        "mean": float(mean),
+        "resolved": False,
+    }
+
+
+def analyze_fringes(
+    profile: ArrayLike,
+    dx: float = 1.0,
+    x0: float = 0.0,
+    min_bin: int = DEFAULT_MIN_BIN,
+    binned: bool = False,
+) -> dict[str, float]:
+    """
+    从一维强度分布中估计条纹周期、相位与可见度
+
+    参数:
+        profile: 等间隔采样的强度（或直方图计数）
+        dx: 采样间隔
+        x0: 第一个采样点的坐标，相位以 x = 0 为参考
+        min_bin: 搜索谱峰时跳过的低频 bin 数
+        binned: profile 是否为宽 dx 的 bin 上的平均（直方图），是时校正可见度的 sinc 衰减
+
+    返回:
+        {"period", "frequency", "phase", "visibility", "mean", "resolved"} 字典；
+        phase 满足 I(x) ∝ 1 + V cos(2π x / period + phase)；
+        窗口内条纹不足时 resolved 为 False，其余测量值为 nan
+    """
+    profile = np.asarray(profile, dtype=float)
+    n = profile.size
+
+    window = _hann(n)
+    window_sum = window.sum()
+    mean = np.dot(window, profile) / window_sum
+    weighted = window * (profile - mean)
+
+    magnitude = np.abs(np.fft.rfft(weighted))
+    k = min_bin + int(np.argmax(magnitude[min_bin:-1]))
+    if k == min_bin:
+        return _unresolved(mean)
+    offset = _interpolate_peak(magnitude[k - 1], magnitude[k], magnitude[k + 1])
+
+    frequency = (k + offset) / (n * dx)
+    x = x0 + dx * np.arange(n)
+
+    return _measure(frequency, weighted, mean, window_sum, x, dx if binned else 0.0)
+
+
+def analyze_fringes_2d(
+    image: ArrayLike,
+    dx: float = 1.0,
+    dy: float = 1.0,
+    x0: float = 0.0,
+    y0: float = 0.0,
+    min_bin: int = DEFAULT_MIN_BIN,
+) -> dict[str, float]:
+    """
+    从二维图像（例如探测器图像）中估计条纹周期、方向、相位与可见度
+
+    条纹模型为 I(x, y) ∝ 1 + V cos(2π(fx·x + fy·y) + φ)，
+    条纹可以沿任意方向；图像布局为 image[y, x]。
+
+    参数:
+        image: 二维强度数组
+        dx, dy: x、y 方向的采样间隔
+        x0, y0: image[0, 0] 对应的坐标
+        min_bin: 搜索谱峰时跳过的低频半径（bin）
+
+    返回:
+        {"period", "frequency", "frequency_x", "frequency_y", "angle",
+         "phase", "visibility", "mean", "resolved"} 字典；
+        angle 为条纹波矢与 x 轴的夹角（弧度），条纹线与之垂直；
+        谱峰落在屏蔽半径的边缘时 resolved 为 False，其余测量值为 nan
+    """
+    image = np.asarray(image, dtype=float)
+    ny, nx = image.shape
+
+    window = np.outer(_hann(ny), _hann(nx))
+    window_sum = window.sum()
+    mean = np.sum(window * image) / window_sum
+    weighted = window * (image - mean)
+
+    magnitude = np.abs(np.fft.rfft2(weighted))
+
+    # 屏蔽直流附近（ky 含负频率，按环绕距离计算）
+    ky = np.fft.fftfreq(ny) * ny
+    kx = np.arange(magnitude.shape[1])
+    near_dc = np.hypot(ky[:, np.newaxis], kx[np.newaxis, :]) < min_bin
+    masked = np.where(near_dc, 0.0, magnitude)
+    iy, ix = np.unravel_index(int(np.argmax(masked)), masked.shape)
+    if np.hypot(ky[iy], ix) < min_bin + 1:
+        return {**_unresolved(mean), "frequency_x": np.nan, "frequency_y": np.nan, "angle": np.nan}
+
+    offset_y = _interpolate_peak(
+        magnitude[(iy - 1) % ny, ix], magnitude[iy, ix], magnitude[(iy + 1) % ny, ix]
+    )
+    if 0 < ix < magnitude.shape[1] - 1:
+        offset_x = _interpolate_peak(magnitude[iy, ix - 1], magnitude[iy, ix], magnitude[iy, ix + 1])
+    else:
+        offset_x = 0.0
+
+    frequency_y = (ky[iy] + offset_y) / (ny * dy)
+    frequency_x = (ix + offset_x) / (nx * dx)
+
+    # 二维 DTFT 可分离：先沿 x、再沿 y 求和
+    x = x0 + dx * np.arange(nx)
+    y = y0 + dy * np.arange(ny)
+    spectrum = np.exp(-2j * np.pi * frequency_y * y) @ (
+        weighted @ np.exp(-2j * np.pi * frequency_x * x)
+    )
+    amplitude = 2 * np.abs(spectrum) / window_sum
+    frequency = float(np.hypot(frequency_x, frequency_y))
+
+    return {
+        "period": 1 / frequency if frequency > 0 else np.inf,
+        "frequency": frequency,
+        "frequency_x": float(frequency_x),
+        "frequency_y": float(frequency_y),
+        "angle": float(np.arctan2(frequency_y, frequency_x)),
+        "phase": float(np.angle(spectrum)),
+        "visibility": float(amplitude / mean) if mean > 0 else 0.0,
+        "mean": float(mean),
+        "resolved": True,
+    }
+
+
+class StreamingFringeAnalyzer:
+    """
+    随计数增长增量更新的条纹分析器
+
+    直方图的加窗频谱与计数是线性关系：
+        rfft(w · (counts + Δ)) = rfft(w · counts) + rfft(w · Δ)
+    因此每批新数据只需变换增量。批量较小时直接对有计数变化的 bin
+    做稀疏 DFT，代价 O(变化的 bin 数 × 频率数)。
+    加窗均值 Σw·counts 同样累加维护。可见度按 bin 宽度做 sinc 校正。
+
+    参数:
+        num_bins: 直方图 bin 数
+        x_min, x_max: 直方图覆盖的坐标范围
+        min_bin: 搜索谱峰时跳过的低频 bin 数
+    """
+
+    def __init__(
+        self,
+        num_bins: int,
+        x_min: float,
+        x_max: float,
+        min_bin: int = DEFAULT_MIN_BIN,
+    ):
+        self.num_bins = num_bins
+        self.x_min = x_min
+        self.x_max = x_max
+        self.min_bin = min_bin
+
+        self.dx = (x_max - x_min) / num_bins
+        self.centers = x_min + self.dx * (np.arange(num_bins) + 0.5)
+        self.counts = np.zeros(num_bins, dtype=np.int64)
+        self.total = 0
+
+        self._window = _hann(num_bins)
+        self._window_sum = self._window.sum()
+        self._weighted_sum = 0.0
+        self._spectrum = np.zeros(num_bins // 2 + 1, dtype=complex)
+        self._frequencies = np.arange(num_bins // 2 + 1)
+
+    def add_hits(self, positions: ArrayLike) -> None:
+        """加入一批命中位置（范围外的命中被忽略）"""
+        positions = np.asarray(positions, dtype=float)
+        bins = np.floor((positions - self.x_min) / self.dx).astype(np.int64)
+        bins = bins[(bins >= 0) & (bins < self.num_bins)]
+
+        self.add_counts(np.bincount(bins, minlength=self.num_bins))
+
+    def add_counts(self, delta: ArrayLike) -> None:
+        """加入一批直方图计数增量（长度为 num_bins）"""
+        delta = np.asarray(delta, dtype=np.int64)
+        self.counts += delta
+        self.total += int(delta.sum())
+
+        changed = np.flatnonzero(delta)
+        weighted = self._window[changed] * delta[changed]
+        self._weighted_sum += weighted.sum()
+
+        # 稀疏 DFT 的代价与变化 bin 数成正比，超过 log2(N) 个时整体变换更快
+        if changed.size < np.log2(self.num_bins):
+            phases = np.exp(
+                -2j * np.pi * np.outer(self._frequencies, changed) / self.num_bins
+            )
+            self._spectrum += phases @ weighted
+        else:
+            self._spectrum += np.fft.rfft(self._window * delta)
+
+    def estimate(self) -> dict[str, float]:
+        """
+        用当前累计的计数估计条纹参数
+
+        返回:
+            同 analyze_fringes，另含 "total"（累计计数）；
+            尚无计数或条纹未分辨时周期等测量值为 nan
+        """
+        if self.total == 0:
+            return {**_unresolved(0.0), "total": 0}
+
+        mean = self._weighted_sum / self._window_sum
+
+        # 累计频谱中减去均值分量 rfft(w · mean)，周期 Hann 窗只影响 bin 0 与 bin 1
+        spectrum = self._spectrum.copy()
+        spectrum[0] -= mean * self.num_bins / 2
+        spectrum[1] += mean * self.num_bins / 4
+        magnitude = np.abs(spectrum)
+        k = self.min_bin + int(np.argmax(magnitude[self.min_bin:-1]))
+        if k == self.min_bin:
+            return {**_unresolved(mean), "total": self.total}
+        offset = _interpolate_peak(magnitude[k - 1], magnitude[k], magnitude[k + 1])
+        frequency = (k + offset) / (self.num_bins * self.dx)
+
+        weighted = self._window * (self.counts - mean)
+        result = _measure(frequency, weighted, mean, self._window_sum, self.centers, self.dx)
+        result["total"] = self.total
+
+        return result
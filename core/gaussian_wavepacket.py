@@ -1,42 +1,173 @@
 """
 高斯波包时间演化 - 核心计算模块
 
-计算初始静止高斯波包随时间演化的概率密度。
-给定 σ=1, m=1, ℏ=1 时的波函数表达式。
+计算自由粒子高斯波包随时间演化的波函数、概率密度与解析可观测量。
+参数 x₀（初始中心）、k₀（初始波数）、σ（初始宽度）、m、ℏ 均可指定；
+默认值 x₀=0, k₀=0, σ=1, m=1, ℏ=1 对应初始静止的标准波包。
 """
 
+from functools import partial
+from typing import Iterator
+
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
+
+from .execution import evaluate_elementwise
+from .precision import resolve_dtypes
+from .progressive import progressive_evaluate
+
+
+def _density_kernel(
+    x: NDArray[np.floating],
+    prefactor: float,
+    center: float,
+    width_squared: float,
+) -> NDArray[np.floating]:
+    """逐点计算 prefactor * exp(-(x - center)²/(2 width²))"""
+    # exp(-(x - ⟨x⟩)²/(4σ²(1 + iτ))) 的模平方
+    # = exp(-(x - ⟨x⟩)²/(2σ²(1 + τ²)))
+    gaussian = np.exp(-(x - center)**2 / (2 * width_squared))
+
+    return prefactor * gaussian
+
+
+def compute_wavefunction(
+    x: ArrayLike,
+    t: ArrayLike,
+    x0: float = 0.0,
+    k0: float = 0.0,
+    sigma: float = 1.0,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+    precision: str | None = None,
+) -> NDArray[np.complexfloating]:
+    """
+    计算复波函数 Ψ(x, t) 的解析表达式
+
+    初始波函数：
+    Ψ(x, 0) = (2πσ²)^{-1/4} exp(-(x - x₀)²/(4σ²) + i k₀ (x - x₀))
+
+    自由演化后（τ = ℏt / (2mσ²)）：
+    Ψ(x, t) = (2πσ²)^{-1/4} (1 + iτ)^{-1/2}
+              × exp([-(x - x₀)²/(4σ²) + i k₀ (x - x₀) - i σ² k₀² τ] / (1 + iτ))
+
+    参数:
+        x: 空间坐标数组
+        t: 时间，标量或数组；为数组时结果形状为 t.shape + x.shape，
+           即一次广播求值整个 (t × x) 网格
+        x0: 初始中心位置
+        k0: 初始平均波数（动量 ℏk₀）
+        sigma: 初始位置宽度 σ
+        mass: 粒子质量 m
+        hbar: 约化普朗克常数 ℏ
+        precision: "float64" 或 "float32"，None 时使用全局设置
+
+    返回:
+        复波函数数组 Ψ(x, t)
+    """
+    real_dtype, complex_dtype = resolve_dtypes(precision)
+    x = np.asarray(x, dtype=real_dtype)
+    t = np.asarray(t, dtype=real_dtype)
+    t = t.reshape(t.shape + (1,) * x.ndim)
+
+    tau = hbar * t / (2 * mass * sigma**2)
+    one_plus_itau = (1 + 1j * tau).astype(complex_dtype)
+
+    dx = x - real_dtype(x0)
+    exponent = (
+        -dx**2 / real_dtype(4 * sigma**2)
+        + 1j * real_dtype(k0) * dx
+        - 1j * real_dtype(sigma**2 * k0**2) * tau
+    ) / one_plus_itau
+
+    prefactor = real_dtype((2 * np.pi * sigma**2) ** (-0.25)) / np.sqrt(one_plus_itau)
+
+    return (prefactor * np.exp(exponent)).astype(complex_dtype, copy=False)
+
+
+def compute_observables(
+    t: ArrayLike,
+    x0: float = 0.0,
+    k0: float = 0.0,
+    sigma: float = 1.0,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+) -> dict[str, NDArray[np.floating]]:
+    """
+    计算一组时刻的解析可观测量，无需在空间网格上求值
+
+    - ⟨x⟩(t) = x₀ + ℏk₀t/m
+    - Δx(t) = σ √(1 + τ²)，τ = ℏt / (2mσ²)
+    - ⟨p⟩ = ℏk₀，Δp = ℏ / (2σ)（自由演化中守恒）
+    - 归一化 ∫|Ψ|² dx = 1
+
+    参数:
+        t: 时间数组
+        x0, k0, sigma, mass, hbar: 同 compute_wavefunction
+
+    返回:
+        {"mean_x", "delta_x", "mean_p", "delta_p", "norm"} 字典，
+        每项为与 t 同形状的数组，计算量为 O(T)
+    """
+    t = np.asarray(t, dtype=float)
+    tau = hbar * t / (2 * mass * sigma**2)
+
+    return {
+        "mean_x": x0 + hbar * k0 * t / mass,
+        "delta_x": sigma * np.sqrt(1 + tau**2),
+        "mean_p": np.full_like(t, hbar * k0),
+        "delta_p": np.full_like(t, hbar / (2 * sigma)),
+        "norm": np.ones_like(t),
+    }
 
 
 def compute_probability_density(
     x: NDArray[np.floating],
     t: float,
+    x0: float = 0.0,
+    k0: float = 0.0,
+    sigma: float = 1.0,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+    num_threads: int | None = None,
+    precision: str | None = None,
 ) -> NDArray[np.floating]:
     """
     计算给定时刻的概率密度 |Ψ(x,t)|²
 
-    波函数（概率振幅部分）：
-    Ψ(x, t) = (2π)^{-1/4} (1 + it/2)^{-1/2} exp(-x²/(4(1 + t²/4)))
+    默认参数下的波函数（概率振幅部分）：
+    Ψ(x, t) = (2π)^{-1/4} (1 + it/2)^{-1/2} exp(-x²/(4(1 + it/2)))
+
+    一般情况下 |Ψ|² 是均值 ⟨x⟩(t)、方差 Δx(t)² 的高斯分布，
+    见 compute_observables。
 
     参数:
         x: 空间坐标数组
         t: 时间
+        x0, k0, sigma, mass, hbar: 同 compute_wavefunction
+        num_threads: 求值线程数，None 时使用 core.execution 的全局配置
+        precision: "float64" 或 "float32"，None 时使用全局设置
 
     返回:
-        概率密度数组 |Ψ(x,t)|²
+        概率密度数组 |Ψ(x,t)|²，dtype 由 precision 决定
     """
-    # 计算 |1 + it/2|² = 1 + t²/4
-    norm_factor_squared = 1 + t**2 / 4
+    real_dtype, _ = resolve_dtypes(precision)
+    x = np.asarray(x, dtype=real_dtype)
 
-    # |(1 + it/2)^{-1/2}|² = (1 + t²/4)^{-1/2}
-    prefactor = (2 * np.pi) ** (-0.5) * norm_factor_squared ** (-0.5)
+    # τ = ℏt / (2mσ²)，|1 + iτ|² = 1 + τ²
+    tau = hbar * t / (2 * mass * sigma**2)
+    norm_factor_squared = 1 + tau**2
 
-    # exp(-x²/(4(1 + t²/4))) 的模平方就是它自身（因为是实数）
-    # |exp(-x²/(4(1 + t²/4)))|² = exp(-x²/(2(1 + t²/4)))
-    gaussian = np.exp(-x**2 / (2 * norm_factor_squared))
+    # |(1 + iτ)^{-1/2}|² = (1 + τ²)^{-1/2}
+    prefactor = (2 * np.pi * sigma**2) ** (-0.5) * norm_factor_squared ** (-0.5)
 
-    return prefactor * gaussian
+    kernel = partial(
+        _density_kernel,
+        prefactor=real_dtype(prefactor),
+        center=real_dtype(x0 + hbar * k0 * t / mass),
+        width_squared=real_dtype(sigma**2 * norm_factor_squared),
+    )
+    return evaluate_elementwise(kernel, x, num_threads=num_threads)
 
 
 def compute_wavepacket_evolution(
@@ -44,6 +175,7 @@ def compute_wavepacket_evolution(
     x_min: float = -10.0,
     x_max: float = 10.0,
     num_points: int = 500,
+    precision: str | None = None,
 ) -> tuple[NDArray[np.floating], dict[float, NDArray[np.floating]]]:
     """
     计算多个时刻的概率密度分布
@@ -53,14 +185,49 @@ def compute_wavepacket_evolution(
         x_min: x 轴最小值
         x_max: x 轴最大值
         num_points: 采样点数
+        precision: "float64" 或 "float32"，None 时使用全局设置
 
     返回:
         (x数组, {时间: 概率密度数组} 字典)
     """
-    x = np.linspace(x_min, x_max, num_points)
+    real_dtype, _ = resolve_dtypes(precision)
+    x = np.linspace(x_min, x_max, num_points, dtype=real_dtype)
     densities = {}
 
     for t in t_values:
-        densities[t] = compute_probability_density(x, t)
+        densities[t] = compute_probability_density(x, t, precision=precision)
 
     return x, densities
+
+
+def iter_wavepacket_refinements(
+    t_values: list[float],
+    x_min: float = -10.0,
+    x_max: float = 10.0,
+    num_points: int = 500,
+    strides: list[int] | None = None,
+    precision: str | None = None,
+) -> Iterator[tuple[int, NDArray[np.floating], dict[float, NDArray[np.floating]]]]:
+    """
+    由粗到细地计算多个时刻的概率密度分布
+
+    所有时刻共用同一组嵌套子网格：每一级只在新增的采样点上求值，
+    已计算的点直接复用。最后一级的结果与 compute_wavepacket_evolution 逐位相同。
+
+    参数:
+        t_values, x_min, x_max, num_points, precision: 同 compute_wavepacket_evolution
+        strides: 从粗到细的步长列表，None 时由 core.progressive.progressive_strides 决定
+
+    返回:
+        生成器，每级产出 (stride, x数组, {时间: 概率密度数组} 字典)
+    """
+    real_dtype, _ = resolve_dtypes(precision)
+    x = np.linspace(x_min, x_max, num_points, dtype=real_dtype)
+
+    def kernel(x_new: NDArray[np.floating]) -> NDArray[np.floating]:
+        return np.stack([
+            compute_probability_density(x_new, t, precision=precision) for t in t_values
+        ])
+
+    for stride, x_level, values in progressive_evaluate(kernel, x, strides):
+        yield stride, x_level, dict(zip(t_values, values))
@@ -0,0 +1,234 @@
+"""
+相空间视图 - 动量空间概率密度与 Wigner 准概率分布
+
+提供两类计算：
+- 解析高斯波包（参数同 core.gaussian_wavepacket）的 |φ(p,t)|² 与 W(x,p,t)
+- 任意采样波函数 ψ(x) 的 |φ(p)|² 与 W(x,p)（基于 FFT）
+
+Wigner 函数定义：
+    W(x, p) = 1/(πℏ) ∫ ψ*(x + y) ψ(x - y) e^{2ipy/ℏ} dy
+
+所有 Wigner 图像的布局均为 W[..., p 索引, x 索引]，可直接作为热图的 z。
+计算精度见 core.precision，precision=None 时使用全局设置。
+"""
+
+from typing import Iterable, Iterator
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .execution import FFT_SUPPORTS_OUT
+from .precision import resolve_dtypes
+
+
+def compute_momentum_density(
+    p: ArrayLike,
+    t: ArrayLike = 0.0,
+    k0: float = 0.0,
+    sigma: float = 1.0,
+    hbar: float = 1.0,
+    precision: str | None = None,
+) -> NDArray[np.floating]:
+    """
+    解析高斯波包的动量空间概率密度 |φ(p,t)|²
+
+    自由演化只改变动量分量的相位，因此 |φ|² 与时间无关：
+    均值 ℏk₀、标准差 σ_p = ℏ/(2σ) 的高斯分布。
+
+    参数:
+        p: 动量坐标数组
+        t: 时间，标量或数组；为数组时结果形状为 t.shape + p.shape
+        k0, sigma, hbar: 同 core.gaussian_wavepacket.compute_wavefunction
+        precision: "float64" 或 "float32"，None 时使用全局设置
+
+    返回:
+        动量概率密度数组
+    """
+    real_dtype, _ = resolve_dtypes(precision)
+    p = np.asarray(p, dtype=real_dtype)
+    t = np.asarray(t, dtype=real_dtype)
+
+    sigma_p = hbar / (2 * sigma)
+    density = (2 * np.pi * sigma_p**2) ** (-0.5) * np.exp(
+        -(p - hbar * k0) ** 2 / (2 * sigma_p**2)
+    )
+
+    return np.broadcast_to(density, t.shape + p.shape).copy()
+
+
+def compute_wigner(
+    x: ArrayLike,
+    p: ArrayLike,
+    t: ArrayLike = 0.0,
+    x0: float = 0.0,
+    k0: float = 0.0,
+    sigma: float = 1.0,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+    precision: str | None = None,
+) -> NDArray[np.floating]:
+    """
+    解析高斯波包的 Wigner 函数 W(x, p, t)
+
+    初始时刻：
+    W₀(x, p) = 1/(πℏ) exp(-(x - x₀)²/(2σ²) - 2σ²(p - ℏk₀)²/ℏ²)
+
+    自由粒子的 Wigner 函数沿经典轨道平移：W(x, p, t) = W₀(x - pt/m, p)。
+
+    参数:
+        x: 位置坐标数组，长度 N
+        p: 动量坐标数组，长度 P
+        t: 时间，标量或数组；为数组时结果形状为 t.shape + (P, N)
+        x0, k0, sigma, mass, hbar: 同 core.gaussian_wavepacket.compute_wavefunction
+        precision: "float64" 或 "float32"，None 时使用全局设置
+
+    返回:
+        Wigner 函数图像 W[..., p, x]
+    """
+    real_dtype, _ = resolve_dtypes(precision)
+    x = np.asarray(x, dtype=real_dtype)
+    p = np.asarray(p, dtype=real_dtype)
+    t = np.asarray(t, dtype=real_dtype)
+    t = t.reshape(t.shape + (1, 1))
+
+    p_col = p[:, np.newaxis]
+    shifted_x = x[np.newaxis, :] - p_col * t / mass - x0
+
+    return np.exp(
+        -shifted_x**2 / (2 * sigma**2)
+        - 2 * sigma**2 * (p_col - hbar * k0) ** 2 / hbar**2
+    ) / (np.pi * hbar)
+
+
+def sampled_momentum_density(
+    psi: NDArray[np.complexfloating],
+    x: NDArray[np.floating],
+    hbar: float = 1.0,
+    precision: str | None = None,
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """
+    计算采样波函数的动量空间概率密度 |φ(p)|²
+
+    φ(p) = (2πℏ)^{-1/2} ∫ ψ(x) e^{-ipx/ℏ} dx，沿最后一个轴做一次批量 FFT，
+    因此 psi 可以是单个波函数 (N,) 或一组时间帧 (T, N)。
+
+    参数:
+        psi: 均匀网格 x 上的波函数
+        x: 空间坐标数组（均匀间隔）
+        hbar: 约化普朗克常数 ℏ
+        precision: "float64" 或 "float32"，None 时使用全局设置
+
+    返回:
+        (p 数组, |φ(p)|² 数组)，p 按升序排列
+    """
+    _, complex_dtype = resolve_dtypes(precision)
+    num_points = x.shape[-1]
+    dx = float(x[1] - x[0])
+
+    p = np.fft.fftshift(np.fft.fftfreq(num_points, d=dx)) * 2 * np.pi * hbar
+    spectrum = np.fft.fftshift(np.fft.fft(np.asarray(psi, dtype=complex_dtype), axis=-1), axes=-1)
+    density = dx**2 / (2 * np.pi * hbar) * np.abs(spectrum) ** 2
+
+    return p, density
+
+
+def wigner_momentum_grid(
+    x: NDArray[np.floating],
+    hbar: float = 1.0,
+) -> NDArray[np.floating]:
+    """
+    返回 sampled_wigner 输出所对应的动量网格
+
+    网格间距为 πℏ/(N·dx)，覆盖 [-πℏ/(2dx), πℏ/(2dx))。
+    """
+    dx = x[1] - x[0]
+    return np.fft.fftshift(np.fft.fftfreq(x.shape[-1], d=dx)) * np.pi * hbar
+
+
+def iter_wigner_frames(
+    psi_frames: Iterable[NDArray[np.complexfloating]],
+    x: NDArray[np.floating],
+    hbar: float = 1.0,
+    precision: str | None = None,
+) -> Iterator[NDArray[np.floating]]:
+    """
+    逐帧计算采样波函数的 Wigner 函数
+
+    每一帧构造关联矩阵 C[n, m] = ψ*(x_{n-m}) ψ(x_{n+m})，
+    并对所有行做一次批量 FFT（没有逐行的 Python 循环）。
+    下标数组与关联/FFT 缓冲区只分配一次，在所有帧之间复用。
+
+    注意：y = m·dx 的采样使可表示的动量范围减半，ψ 的动量成分需落在
+    ±πℏ/(2dx) 之内，否则 Wigner 图像会出现混叠。
+
+    参数:
+        psi_frames: 波函数序列，每个元素形状为 (N,)
+        x: 空间坐标数组（均匀间隔），长度 N
+        hbar: 约化普朗克常数 ℏ
+        precision: "float64" 或 "float32"，None 时使用全局设置；
+                   决定关联矩阵与 FFT 缓冲区的 dtype
+
+    返回:
+        生成器，逐帧产出 W[p, x] 图像（形状 (N, N)），
+        动量网格见 wigner_momentum_grid
+    """
+    _, complex_dtype = resolve_dtypes(precision)
+    num_points = x.shape[-1]
+    dx = float(x[1] - x[0])
+    scale = dx / (np.pi * hbar)
+
+    # m 按 FFT 顺序排列：0, 1, ..., N/2-1, -N/2, ..., -1
+    n = np.arange(num_points)[:, np.newaxis]
+    m = np.fft.fftfreq(num_points, d=1.0 / num_points).astype(np.intp)[np.newaxis, :]
+
+    # 越界下标指向末尾补零的位置
+    index_plus = n + m
+    index_minus = n - m
+    index_plus[(index_plus < 0) | (index_plus >= num_points)] = num_points
+    index_minus[(index_minus < 0) | (index_minus >= num_points)] = num_points
+
+    padded = np.zeros(num_points + 1, dtype=complex_dtype)
+    correlation = np.empty((num_points, num_points), dtype=complex_dtype)
+    shifted = np.empty((num_points, num_points), dtype=complex_dtype)
+
+    for psi in psi_frames:
+        padded[:num_points] = psi
+        np.take(padded, index_plus, out=shifted)
+        np.take(padded.conj(), index_minus, out=correlation)
+        correlation *= shifted
+
+        if FFT_SUPPORTS_OUT:
+            np.fft.fft(correlation, axis=-1, out=correlation)
+            spectrum = correlation
+        else:
+            spectrum = np.fft.fft(correlation, axis=-1)
+
+        # W[x, p] -> W[p, x]，并把 p 轴平移为升序
+        yield scale * np.fft.fftshift(spectrum.real.T, axes=0)
+
+
+def sampled_wigner(
+    psi: NDArray[np.complexfloating],
+    x: NDArray[np.floating],
+    hbar: float = 1.0,
+    precision: str | None = None,
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """
+    计算采样波函数的 Wigner 函数
+
+    参数:
+        psi: 单个波函数 (N,) 或一组时间帧 (T, N)
+        x: 空间坐标数组（均匀间隔）
+        hbar: 约化普朗克常数 ℏ
+        precision: "float64" 或 "float32"，None 时使用全局设置
+
+    返回:
+        (p 数组, W 数组)，W 形状为 (N, N) 或 (T, N, N)，布局 W[..., p, x]
+    """
+    psi = np.asarray(psi)
+    p = wigner_momentum_grid(x, hbar)
+
+    frames = psi[np.newaxis] if psi.ndim == 1 else psi
+    wigner = np.stack(list(iter_wigner_frames(frames, x, hbar, precision)))
+
+    return p, wigner[0] if psi.ndim == 1 else wigner
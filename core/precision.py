@@ -0,0 +1,106 @@
+"""
+数值精度设置
+
+所有计算内核默认使用 float64 / complex128。对于绘图与蒙特卡洛直方图，
+float32 / complex64 的精度已经足够，同时内存与带宽减半、向量化吞吐约翻倍。
+
+精度可以全局设置（set_precision），也可以在每次调用时通过
+precision 参数覆盖；precision=None 表示使用全局设置。
+
+误差界（ε = 2⁻²⁴ ≈ 6.0e-8 为 float32 单位舍入误差）：
+
+- compute_double_slit：强度 I = cos²(δ)，δ = π d x / (λ L)。
+  相位在 float32 下的绝对误差不超过 4ε|δ|，因此
+      |I₃₂ - I₆₄| ≤ 4ε|δ| + 8ε。
+  在演示页面的全部滑块范围内（|δ| ≤ 524），绝对误差 ≤ 1.3e-4。
+
+- compute_probability_density：ρ = A exp(-u)，u = (x - ⟨x⟩)² / (2Δx²)。
+  相对误差不超过 (3u + 4)ε，由于 u·exp(-u) ≤ 1/e，
+      |ρ₃₂ - ρ₆₄| ≤ 6ε · max(ρ)，
+  即绝对误差 ≤ 1.5e-7（max(ρ) ≤ (2π)^{-1/2}）。
+  当 u 超过约 100 时 float32 结果下溢为 0，对应的 float64 值小于 1e-43。
+
+- core.phase_space.compute_wigner：W = exp(-u)/(πℏ)，平移后的坐标 x - pt/m
+  的舍入误差约为 ε(|x| + |p|t/m)，因此
+      |W₃₂ - W₆₄| ≤ 2ε(|x| + |p|t/m)/σ · max(W) + 6ε · max(W)。
+  compute_momentum_density 与 compute_probability_density 的误差界相同（≤ 6ε · max）。
+  sampled_momentum_density、sampled_wigner 的 FFT 误差为 O(ε log N) · max。
+
+- core.interference.compute_interference_density：两两展开
+  |Ψ|² = Σ|ψⱼ|² + 2Σ|ψⱼ||ψₖ|cos(θⱼ - θₖ) 中，振幅的误差同高斯密度（≤ 6ε · max），
+  余弦自变量的绝对误差约为 2εΘ，Θ = maxⱼ [|k₀ⱼ|R + R²/(8σ²)] 为相位的最大值，
+  R = max|x - x₀ⱼ|，因此
+      |ρ₃₂ - ρ₆₄| ≤ (12 + 4Θ)ε · max(ρ)。
+  双波包演示的滑块范围内 Θ ≤ 300，即相对误差 ≤ 7.3e-5（实测约 3e-6）。
+
+- core.double_slit_2d.simulate_double_slit_2d：每步一对 FFT 与两次逐点乘法，
+  舍入误差随步数线性累积，
+      |ρ₃₂ - ρ₆₄| ≤ 2 · num_steps · ε · log₂N · max(ρ)
+  （演示参数 600 步、N = 256 时 ≤ 5.7e-4，实测约 5e-5）；输出帧总是 float32。
+
+- core.bohmian：RK4 每步的位置舍入误差不超过 ε|x|，沿轨迹线性累积，
+      |x₃₂ - x₆₄| ≤ num_steps · ε · max|x|；
+  均值与标准差总是以 float64 累加。
+
+- core.crank_nicolson：范数漂移按精度检查，容差见 NORM_TOLERANCE。
+
+以下模块固定使用 float64，不接入精度设置：
+
+- core.tunneling：透射系数可小到 1e-30 以下，T 由传递矩阵元的平方和求倒数得到，
+  float32 的相对误差在深势垒下会被放大到 O(1)；计算量只有 O(层数 × 能量点)，
+  float32 也没有可观的收益。
+- core.stationary_states、core.tridiagonal 的本征值求解：二分法与逆迭代需要
+  能分辨相邻能级的间距，近简并能级（双势阱）的间距远小于 float32 的分辨率。
+- core.oscillatory：Filon 矩量的递推每步除以 H，|H| 略大于级数阈值时
+  会放大舍入误差，float32 下这部分误差已超过求积误差本身。
+
+测试 tests/test_precision.py 在演示页面的滑块范围内（端点与内部的采样点）检查上述误差界。
+"""
+
+import numpy as np
+
+# 精度名称 -> (实数 dtype, 复数 dtype)
+PRECISIONS: dict[str, tuple[type[np.floating], type[np.complexfloating]]] = {
+    "float64": (np.float64, np.complex128),
+    "float32": (np.float32, np.complex64),
+}
+
+_precision = "float64"
+
+
+def set_precision(precision: str) -> None:
+    """
+    设置全局计算精度。
+
+    参数:
+        precision: "float64" 或 "float32"
+    """
+    global _precision
+
+    if precision not in PRECISIONS:
+        raise ValueError(f"未知精度 {precision!r}，可选值：{', '.join(PRECISIONS)}")
+    _precision = precision
+
+
+def get_precision() -> str:
+    """返回当前全局计算精度名称"""
+    return _precision
+
+
+def resolve_dtypes(
+    precision: str | None = None,
+) -> tuple[type[np.floating], type[np.complexfloating]]:
+    """
+    解析单次调用的精度。
+
+    参数:
+        precision: 精度名称，None 时使用全局设置
+
+    返回:
+        (实数 dtype, 复数 dtype)
+    """
+    if precision is None:
+        precision = _precision
+    if precision not in PRECISIONS:
+        raise ValueError(f"未知精度 {precision!r}，可选值：{', '.join(PRECISIONS)}")
+    return PRECISIONS[precision]
@@ -0,0 +1,105 @@
+"""
+渐进式求值 - 由粗到细地计算逐点内核
+
+在嵌套的等间隔子网格上依次求值：先以步长 16（1/16 分辨率）
+计算，再依次缩小步长直到 1。每一级只计算上一级未覆盖的新采样点，
+已经算过的点直接复用，因此所有级别的总计算量与一次完整求值相同。
+
+首级的点数有上限（默认 1024），无论最终分辨率多大，
+第一张粗略结果都能在几毫秒内得到，界面可以先绘制再逐级细化。
+"""
+
+from typing import Callable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+# 首级相对完整网格的最小降采样倍数
+DEFAULT_COARSE_FACTOR = 16
+
+# 相邻两级之间步长的缩小倍数
+DEFAULT_REFINE_RATIO = 4
+
+# 首级最多的采样点数，保证首张结果的耗时与最终分辨率无关
+DEFAULT_MAX_FIRST_POINTS = 1024
+
+
+def progressive_strides(
+    num_points: int,
+    coarse_factor: int = DEFAULT_COARSE_FACTOR,
+    ratio: int = DEFAULT_REFINE_RATIO,
+    max_first_points: int = DEFAULT_MAX_FIRST_POINTS,
+) -> list[int]:
+    """
+    计算各级的采样步长
+
+    步长为 ratio 的幂，首级步长不小于 coarse_factor，
+    且首级点数不超过 max_first_points。
+
+    参数:
+        num_points: 完整网格的点数
+        coarse_factor: 首级最小降采样倍数
+        ratio: 相邻两级步长之比
+        max_first_points: 首级最多点数
+
+    返回:
+        从粗到细的步长列表，最后一项为 1；例如 num_points=2000 时为 [16, 4, 1]
+    """
+    if ratio < 2:
+        raise ValueError("ratio 必须 >= 2")
+
+    strides = [1]
+    while strides[-1] < coarse_factor or -(-num_points // strides[-1]) > max_first_points:
+        if strides[-1] >= num_points:
+            break
+        strides.append(strides[-1] * ratio)
+
+    return strides[::-1]
+
+
+def progressive_evaluate(
+    kernel: Callable[[NDArray], NDArray],
+    x: NDArray,
+    strides: list[int] | None = None,
+) -> Iterator[tuple[int, NDArray, NDArray]]:
+    """
+    在嵌套子网格 x[::s] 上由粗到细地求值 kernel
+
+    kernel 沿最后一维逐点计算：输入一维坐标数组，
+    返回形状为 (..., len(输入)) 的数组，每一列只依赖于对应的坐标。
+    这样同一个内核既可以计算单条曲线，也可以一次计算多条曲线（例如多个时刻）。
+
+    参数:
+        kernel: 沿最后一维逐点的计算函数
+        x: 一维坐标数组（完整分辨率）
+        strides: 从粗到细的步长列表，最后一项必须为 1；None 时使用 progressive_strides
+
+    返回:
+        生成器，每级产出 (stride, x[::stride], values)；
+        values 是完整结果缓冲区的视图 out[..., ::stride]，
+        后续级别只写入新的采样点，已产出的值不会再改变
+    """
+    x = np.asarray(x)
+    num_points = x.shape[-1]
+
+    if strides is None:
+        strides = progressive_strides(num_points)
+    if strides[-1] != 1:
+        raise ValueError("最后一级的步长必须为 1")
+
+    out = None
+    previous = None
+
+    for stride in strides:
+        indices = np.arange(0, num_points, stride)
+        if previous is not None:
+            # 只保留上一级网格之外的新采样点
+            indices = indices[indices % previous != 0]
+
+        values = kernel(x[indices])
+        if out is None:
+            out = np.empty(values.shape[:-1] + (num_points,), dtype=values.dtype)
+        out[..., indices] = values
+
+        previous = stride
+        yield stride, x[::stride], out[..., ::stride]
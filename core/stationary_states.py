@@ -0,0 +1,160 @@
+"""
+一维束缚态（定态）求解器
+
+在均匀网格上用二阶有限差分离散哈密顿量
+    H = -ℏ²/(2m) d²/dx² + V(x)
+得到对称三对角矩阵（网格两端之外 ψ = 0，相当于无限高势墙）。
+
+只计算最低的 k 个本征对：
+1. 向量化 Sturm 计数 + 二分法确定各本征值所在区间
+2. 以区间中点为位移做逆迭代，得到本征矢
+3. 在逆迭代得到的子空间内做 Rayleigh-Ritz，给出最终本征值与本征矢
+   （近简并的本征对，如双势阱的隧穿劈裂，也能正确分开）
+
+子空间比所需的 k 维多 NUM_GUARD_STATES 个保护向量：第 k 个能级若与未请求的
+第 k+1 个能级近简并，两者的逆迭代向量会混合，只有把后者也放进子空间，
+Rayleigh-Ritz 才能把它们分开；保护向量对应的结果最后丢弃。
+
+所有步骤都基于 core.tridiagonal 的循环约化，内存为 O(k·N)，
+不会构造 N×N 的稠密矩阵。
+"""
+
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .tridiagonal import count_eigenvalues_below, factorize, solve_factorized
+
+# 逆迭代子空间中额外的保护向量个数
+NUM_GUARD_STATES = 2
+
+
+def build_hamiltonian(
+    x: NDArray[np.floating],
+    potential: NDArray[np.floating] | Callable[[NDArray[np.floating]], NDArray[np.floating]],
+    mass: float = 1.0,
+    hbar: float = 1.0,
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """
+    构造有限差分哈密顿量的三对角表示
+
+    参数:
+        x: 均匀空间网格
+        potential: 网格上的势能数组，或接受 x 返回势能数组的函数
+        mass: 粒子质量 m
+        hbar: 约化普朗克常数 ℏ
+
+    返回:
+        (对角线, 次对角线)
+    """
+    dx = x[1] - x[0]
+    v = potential(x) if callable(potential) else np.asarray(potential, dtype=float)
+
+    kinetic = hbar**2 / (2 * mass * dx**2)
+    diag = 2 * kinetic + v
+    off = np.full(x.shape[0] - 1, -kinetic)
+
+    return diag, off
+
+
+def _bisect_lowest(
+    diag: NDArray[np.floating],
+    off: NDArray[np.floating],
+    num_states: int,
+    rel_tol: float,
+) -> NDArray[np.floating]:
+    """二分法求最低 num_states 个本征值的近似位置"""
+    # Gershgorin 下界
+    radius = np.zeros_like(diag)
+    radius[:-1] += np.abs(off)
+    radius[1:] += np.abs(off)
+    lower = float(np.min(diag - radius))
+
+    # 从下界出发倍增步长，找到包含全部所需本征值的上界
+    step = max(float(np.abs(off).max()) * 1e-6, 1e-12)
+    upper = lower + step
+    while count_eigenvalues_below(diag, off, [upper])[0] < num_states:
+        step *= 4
+        upper = lower + step
+
+    index = np.arange(num_states)
+    lo = np.full(num_states, lower)
+    hi = np.full(num_states, upper)
+    tol = rel_tol * (upper - lower)
+
+    # 对所有本征值同时二分：count(mid) > j 说明第 j 个本征值小于 mid
+    while np.max(hi - lo) > tol:
+        mid = 0.5 * (lo + hi)
+        above = count_eigenvalues_below(diag, off, mid) > index
+        hi = np.where(above, mid, hi)
+        lo = np.where(above, lo, mid)
+
+    return 0.5 * (lo + hi)
+
+
+def solve_bound_states(
+    x: NDArray[np.floating],
+    potential: NDArray[np.floating] | Callable[[NDArray[np.floating]], NDArray[np.floating]],
+    num_states: int = 5,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+    rel_tol: float = 1e-3,
+    num_iterations: int = 3,
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """
+    求解最低的若干个束缚态
+
+    参数:
+        x: 均匀空间网格
+        potential: 网格上的势能数组，或接受 x 返回势能数组的函数
+        num_states: 求解的本征态个数 k
+        mass: 粒子质量 m
+        hbar: 约化普朗克常数 ℏ
+        rel_tol: 二分法的相对区间宽度，只需把位移定位到各本征值附近，
+            最终精度由逆迭代与 Rayleigh-Ritz 保证
+        num_iterations: 逆迭代次数
+
+    返回:
+        (energies, wavefunctions)：
+        - energies: 形状 (k,) 的本征能量，升序
+        - wavefunctions: 形状 (k, N) 的实本征函数，满足 ∫|ψ|² dx = 1，
+          符号约定为最左侧的波瓣为正
+    """
+    dx = x[1] - x[0]
+    diag, off = build_hamiltonian(x, potential, mass, hbar)
+    num_states = min(num_states, x.shape[0])
+    subspace_size = min(num_states + NUM_GUARD_STATES, x.shape[0])
+
+    shifts = _bisect_lowest(diag, off, subspace_size, rel_tol)
+
+    # 对每个位移分解一次 (H - σI)，逆迭代中重复使用
+    levels, last_pivot = factorize(
+        diag[:, np.newaxis] - shifts[np.newaxis, :],
+        off[:, np.newaxis],
+    )
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((x.shape[0], subspace_size))
+
+    for _ in range(num_iterations):
+        vectors = solve_factorized(levels, last_pivot, vectors)
+        # 近简并的本征值会收敛到同一方向，用 QR 保持正交
+        vectors, _ = np.linalg.qr(vectors)
+
+    # Rayleigh-Ritz：在子空间内对角化 k×k 矩阵 VᵀHV
+    h_vectors = diag[:, np.newaxis] * vectors
+    h_vectors[:-1] += off[:, np.newaxis] * vectors[1:]
+    h_vectors[1:] += off[:, np.newaxis] * vectors[:-1]
+    energies, rotation = np.linalg.eigh(vectors.T @ h_vectors)
+    energies, rotation = energies[:num_states], rotation[:, :num_states]
+
+    wavefunctions = (vectors @ rotation).T / np.sqrt(dx)
+
+    # 符号约定：第一个显著分量为正
+    magnitude = np.abs(wavefunctions)
+    first = np.argmax(magnitude > 1e-3 * magnitude.max(axis=1, keepdims=True), axis=1)
+    signs = np.sign(wavefunctions[np.arange(num_states), first])
+    wavefunctions *= signs[:, np.newaxis]
+
+    return energies, wavefunctions
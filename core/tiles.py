@@ -0,0 +1,303 @@
+"""
+多分辨率瓦片金字塔 - 可缩放的 (t, x) 时空密度图
+
+把时空区域 [t_min, t_max] × [x_min, x_max] 划分为固定大小的瓦片：
+时间方向第 lt 级有 2^lt 块、空间方向第 lx 级有 2^lx 块，
+每块都是 tile_size × tile_size 个采样点（取格子中心）。
+两个方向的级别相互独立（各向异性金字塔），只放大 x 时不会在 t 方向多算。
+
+瓦片有两种来源：
+- 解析内核 kernel(t, x) -> (len(t), len(x))：按需计算，放入按字节预算的 LRU 缓存
+- 数值解的预计算数组（TilePyramid.from_array）：重采样到最细一级，
+  逐级两两平均得到更粗的级别，瓦片直接从对应级别的数组中切出
+
+render_view 按视图的像素数选择级别，只取出与视图相交的瓦片并拼接、裁剪，
+平移或缩放时只有新进入视野的瓦片需要计算，传给浏览器的数据量只取决于像素数。
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+from numpy.typing import NDArray
+
+# 每块瓦片的边长（采样点数）
+DEFAULT_TILE_SIZE = 128
+
+# 解析内核的最大级别（每个方向最多 2^DEFAULT_MAX_LEVEL 块）
+DEFAULT_MAX_LEVEL = 10
+
+# 解析瓦片缓存的默认字节预算
+DEFAULT_CACHE_BYTES = 64 * 2**20
+
+# 瓦片内核：kernel(t, x)，返回形状 (len(t), len(x)) 的数组
+TileKernel = Callable[[NDArray[np.floating], NDArray[np.floating]], NDArray[np.floating]]
+
+
+def _resample_axis(
+    values: NDArray[np.floating],
+    coords: NDArray[np.floating],
+    new_coords: NDArray[np.floating],
+    axis: int,
+) -> NDArray[np.floating]:
+    """沿 axis 把 values 从升序坐标 coords 线性插值到 new_coords"""
+    values = np.moveaxis(values, axis, 0)
+    index = np.clip(np.searchsorted(coords, new_coords) - 1, 0, len(coords) - 2)
+    weight = np.clip((new_coords - coords[index]) / (coords[index + 1] - coords[index]), 0.0, 1.0)
+    weight = weight.reshape((-1,) + (1,) * (values.ndim - 1))
+
+    resampled = values[index] * (1 - weight) + values[index + 1] * weight
+    return np.moveaxis(resampled, 0, axis)
+
+
+class TilePyramid:
+    """
+    (t, x) 时空密度图的瓦片金字塔（线程安全）
+
+    参数:
+        kernel: 解析内核 kernel(t, x)；from_array 构造时为 None
+        t_range, x_range: 覆盖的时空区域 (最小值, 最大值)
+        tile_size: 每块瓦片的边长（采样点数）
+        max_level: 每个方向的最大级别，整数或 (时间, 空间) 元组
+        cache_bytes: 解析瓦片缓存的字节预算，超出时淘汰最久未使用的瓦片
+    """
+
+    def __init__(
+        self,
+        kernel: TileKernel | None,
+        t_range: tuple[float, float],
+        x_range: tuple[float, float],
+        tile_size: int = DEFAULT_TILE_SIZE,
+        max_level: int | tuple[int, int] = DEFAULT_MAX_LEVEL,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ):
+        self.kernel = kernel
+        self.t_range = (float(t_range[0]), float(t_range[1]))
+        self.x_range = (float(x_range[0]), float(x_range[1]))
+        self.tile_size = tile_size
+        self.max_level = (max_level, max_level) if isinstance(max_level, int) else tuple(max_level)
+        self.cache_bytes = cache_bytes
+
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple[int, int, int, int], NDArray] = OrderedDict()
+        self._cached_bytes = 0
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0}
+
+        # 正在计算的瓦片：key -> 计算完成时触发的事件
+        self._pending: dict[tuple[int, int, int, int], threading.Event] = {}
+
+        # from_array 构造时：(lt, lx) -> 该级别的完整数组
+        self._levels: dict[tuple[int, int], NDArray] = {}
+
+    @classmethod
+    def from_array(
+        cls,
+        values: NDArray[np.floating],
+        t: NDArray[np.floating],
+        x: NDArray[np.floating],
+        tile_size: int = DEFAULT_TILE_SIZE,
+    ) -> "TilePyramid":
+        """
+        由数值解的预计算结果构造金字塔
+
+        每个方向的最细级别取 tile_size · 2^L 不超过原始点数的最大 L（至少为 0），
+        原始数据线性插值到最细级别的格子中心，更粗的级别按需两两平均得到。
+
+        参数:
+            values: 形状 (len(t), len(x)) 的数组
+            t, x: 升序的采样坐标
+
+        返回:
+            覆盖 [t[0], t[-1]] × [x[0], x[-1]] 的金字塔
+        """
+        levels = tuple(
+            max(int(np.floor(np.log2(n / tile_size))), 0) if n >= tile_size else 0
+            for n in values.shape
+        )
+        pyramid = cls(None, (t[0], t[-1]), (x[0], x[-1]), tile_size, levels)
+
+        finest = _resample_axis(values, t, pyramid.sample_coords("t", levels[0]), axis=0)
+        finest = _resample_axis(finest, x, pyramid.sample_coords("x", levels[1]), axis=1)
+        pyramid._levels[levels] = finest.astype(np.float32)
+
+        return pyramid
+
+    def sample_coords(self, axis: str, level: int, start: int = 0, num_tiles: int | None = None) -> NDArray[np.floating]:
+        """
+        某个方向第 level 级的采样坐标（格子中心）
+
+        参数:
+            axis: "t" 或 "x"
+            level: 级别
+            start, num_tiles: 从第 start 块起的 num_tiles 块，None 时到末尾
+        """
+        lo, hi = self.t_range if axis == "t" else self.x_range
+        count = 2**level * self.tile_size
+        step = (hi - lo) / count
+        stop = count if num_tiles is None else (start + num_tiles) * self.tile_size
+
+        return lo + step * (np.arange(start * self.tile_size, stop) + 0.5)
+
+    def get_tile(self, lt: int, lx: int, it: int, ix: int) -> tuple[NDArray, bool]:
+        """
+        取出一块瓦片
+
+        多个线程同时请求同一块未缓存的瓦片时，只有一个线程计算，其余线程等待它的结果。
+
+        参数:
+            lt, lx: 时间、空间方向的级别
+            it, ix: 时间、空间方向的瓦片序号
+
+        返回:
+            (瓦片, 是否由本次调用计算)：瓦片形状 (tile_size, tile_size)（调用方不应修改）
+        """
+        if self.kernel is None:
+            return self._array_tile(lt, lx, it, ix), False
+
+        key = (lt, lx, it, ix)
+        while True:
+            with self._lock:
+                tile = self._cache.get(key)
+                if tile is not None:
+                    self._cache.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return tile, False
+
+                pending = self._pending.get(key)
+                if pending is None:
+                    self._pending[key] = threading.Event()
+                    self._counters["misses"] += 1
+                    break
+
+            # 其他线程正在计算这块瓦片：等待后重新查找缓存
+            # （计算失败或瓦片已被淘汰时，由本线程接手计算）
+            pending.wait()
+
+        try:
+            t = self.sample_coords("t", lt, it, 1)
+            x = self.sample_coords("x", lx, ix, 1)
+            tile = np.asarray(self.kernel(t, x), dtype=np.float32)
+
+            with self._lock:
+                self._cache[key] = tile
+                self._cached_bytes += tile.nbytes
+                while self._cached_bytes > self.cache_bytes and len(self._cache) > 1:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cached_bytes -= evicted.nbytes
+                    self._counters["evictions"] += 1
+        finally:
+            with self._lock:
+                self._pending.pop(key).set()
+
+        return tile, True
+
+    def _array_level(self, lt: int, lx: int) -> NDArray:
+        """数组来源的第 (lt, lx) 级完整数组，由更细一级两两平均得到并保存"""
+        with self._lock:
+            level = self._levels.get((lt, lx))
+        if level is not None:
+            return level
+
+        if lt < self.max_level[0]:
+            finer = self._array_level(lt + 1, lx)
+            level = 0.5 * (finer[0::2] + finer[1::2])
+        else:
+            finer = self._array_level(lt, lx + 1)
+            level = 0.5 * (finer[:, 0::2] + finer[:, 1::2])
+
+        with self._lock:
+            self._levels[(lt, lx)] = level
+        return level
+
+    def _array_tile(self, lt: int, lx: int, it: int, ix: int) -> NDArray:
+        """从数组来源的对应级别中切出瓦片"""
+        n = self.tile_size
+        return self._array_level(lt, lx)[it * n:(it + 1) * n, ix * n:(ix + 1) * n]
+
+    def choose_levels(
+        self,
+        t_view: tuple[float, float],
+        x_view: tuple[float, float],
+        num_t_pixels: int,
+        num_x_pixels: int,
+    ) -> tuple[int, int]:
+        """每个方向选择采样间距不大于像素间距的最低级别（不超过 max_level）"""
+        levels = []
+        for (lo, hi), (view_lo, view_hi), pixels, max_level in (
+            (self.t_range, t_view, num_t_pixels, self.max_level[0]),
+            (self.x_range, x_view, num_x_pixels, self.max_level[1]),
+        ):
+            needed = pixels * (hi - lo) / (max(view_hi - view_lo, 1e-300) * self.tile_size)
+            levels.append(int(np.clip(np.ceil(np.log2(max(needed, 1.0))), 0, max_level)))
+
+        return levels[0], levels[1]
+
+    def render_view(
+        self,
+        t_view: tuple[float, float],
+        x_view: tuple[float, float],
+        num_t_pixels: int,
+        num_x_pixels: int,
+    ) -> dict:
+        """
+        拼接覆盖视图的瓦片，裁剪到视图范围
+
+        参数:
+            t_view, x_view: 视图范围 (最小值, 最大值)，超出金字塔区域的部分被截去
+            num_t_pixels, num_x_pixels: 视图在两个方向的像素数
+
+        返回:
+            字典：
+            - "t", "x": 裁剪后图像的采样坐标
+            - "values": 形状 (len(t), len(x)) 的图像
+            - "levels": (时间级别, 空间级别)
+            - "tiles": 视图用到的瓦片数
+            - "computed": 其中由本次调用新计算的瓦片数（数组来源恒为 0），
+              不包含其他会话同时计算的瓦片
+        """
+        lt, lx = self.choose_levels(t_view, x_view, num_t_pixels, num_x_pixels)
+        ranges = []
+        for (lo, hi), (view_lo, view_hi), level in (
+            (self.t_range, t_view, lt),
+            (self.x_range, x_view, lx),
+        ):
+            size = (hi - lo) / 2**level
+            first = int(np.clip(np.floor((view_lo - lo) / size), 0, 2**level - 1))
+            last = int(np.clip(np.ceil((view_hi - lo) / size) - 1, first, 2**level - 1))
+            ranges.append((first, last - first + 1))
+
+        (t_first, t_count), (x_first, x_count) = ranges
+        n = self.tile_size
+        computed = 0
+
+        mosaic = np.empty((t_count * n, x_count * n), dtype=np.float32)
+        for i in range(t_count):
+            for j in range(x_count):
+                tile, is_new = self.get_tile(lt, lx, t_first + i, x_first + j)
+                mosaic[i * n:(i + 1) * n, j * n:(j + 1) * n] = tile
+                computed += is_new
+
+        t = self.sample_coords("t", lt, t_first, t_count)
+        x = self.sample_coords("x", lx, x_first, x_count)
+        t_keep = (t >= t_view[0]) & (t <= t_view[1])
+        x_keep = (x >= x_view[0]) & (x <= x_view[1])
+
+        return {
+            "t": t[t_keep],
+            "x": x[x_keep],
+            "values": mosaic[np.ix_(t_keep, x_keep)],
+            "levels": (lt, lx),
+            "tiles": t_count * x_count,
+            "computed": computed,
+        }
+
+    def metrics(self) -> dict[str, int]:
+        """返回瓦片缓存的使用情况：{"tiles", "bytes", "cache_bytes", "hits", "misses", "evictions"}"""
+        with self._lock:
+            return {
+                "tiles": len(self._cache),
+                "bytes": self._cached_bytes,
+                "cache_bytes": self.cache_bytes,
+                **self._counters,
+            }
@@ -0,0 +1,167 @@
+"""
+对称三对角矩阵的向量化算法
+
+基于奇偶循环约化（cyclic reduction）：每一层消去偶数下标的未知量，
+剩下的奇数下标未知量仍构成三对角系统，规模减半。
+全部 log₂N 层都是整块的 NumPy 数组运算，没有逐行的 Python 循环，
+总计算量为 O(N)。
+
+矩阵由对角线 diag（长度 n）与次对角线 off（长度 n-1）表示，
+可在第二个轴上批量处理多个矩阵或多个右端项：
+    diag: (n, S) 或 (n, 1)，off: (n-1, S) 或 (n-1, 1)，右端项: (n, B)
+第二个轴按 NumPy 规则广播。
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+# 约化过程中的一层：(消去的主元, 左侧耦合, 右侧耦合, 左乘子, 右乘子)
+Level = tuple[NDArray, NDArray, NDArray, NDArray, NDArray]
+
+
+def _pivot_floor(off: NDArray) -> float:
+    """零主元的替代值（与 LAPACK 的 pivmin 相同的思路）"""
+    scale = float(np.max(np.abs(off) ** 2)) if off.size else 1.0
+    return np.finfo(float).tiny * max(scale, 1.0)
+
+
+def count_eigenvalues_below(
+    diag: NDArray[np.floating],
+    off: NDArray[np.floating],
+    shifts: NDArray[np.floating],
+) -> NDArray[np.intp]:
+    """
+    统计对称三对角矩阵 T 小于各个 shift 的特征值个数
+
+    由 Sylvester 惯性定理，T - σI 的任意对称 LDLᵀ 分解中负主元的个数
+    等于小于 σ 的特征值个数。循环约化正是奇偶重排后的 LDLᵀ 分解，
+    因此统计各层消去主元的符号即可，这相当于向量化的 Sturm 序列计数。
+
+    参数:
+        diag: 对角线，形状 (n,)
+        off: 次对角线，形状 (n-1,)
+        shifts: 一组位移 σ，形状 (S,)
+
+    返回:
+        形状 (S,) 的整数数组
+    """
+    pivmin = _pivot_floor(off)
+    shifts = np.asarray(shifts, dtype=float)
+
+    # 计数只需主元符号，按 (S, n) 布局使最内层循环沿网格方向连续
+    a = diag[np.newaxis, :] - shifts[:, np.newaxis]
+    b2 = (off**2)[np.newaxis, :]
+    count = np.zeros(shifts.shape, dtype=np.intp)
+
+    while a.shape[1] > 1:
+        pivots = a[:, 0::2]
+        pivots = np.where(np.abs(pivots) < pivmin, -pivmin, pivots)
+        count += np.count_nonzero(pivots < 0, axis=1)
+
+        num_odd = a.shape[1] // 2
+        left2 = b2[:, 0::2]
+        right2 = b2[:, 1::2]
+        num_right = right2.shape[1]
+
+        new_a = a[:, 1::2] - left2 / pivots[:, :num_odd]
+        new_a[:, :num_right] -= right2 / pivots[:, 1:num_right + 1]
+        new_b2 = right2[:, :num_odd - 1] * left2[:, 1:num_odd] / pivots[:, 1:num_odd] ** 2
+
+        a, b2 = new_a, new_b2
+
+    count += a[:, 0] < 0
+
+    return count
+
+
+def factorize(
+    diag: NDArray,
+    off: NDArray,
+) -> tuple[list[Level], NDArray]:
+    """
+    对（一批）三对角矩阵做循环约化分解
+
+    分解只依赖矩阵本身，之后可对任意多个右端项重复调用 solve_factorized，
+    每次求解为 O(N)。
+
+    参数:
+        diag: 对角线，形状 (n, S)
+        off: 次对角线，形状 (n-1, S)
+
+    返回:
+        (各层约化数据, 最后一层 1×1 系统的主元)
+    """
+    pivmin = _pivot_floor(off)
+    levels: list[Level] = []
+    a, b = diag, off
+
+    while a.shape[0] > 1:
+        pivots = a[0::2]
+        pivots = np.where(pivots == 0, pivmin, pivots)
+
+        num_odd = a.shape[0] // 2
+        left = b[0::2]
+        right = b[1::2]
+        num_right = right.shape[0]
+
+        left_factor = left / pivots[:num_odd]
+        right_factor = right / pivots[1:num_right + 1]
+
+        new_a = a[1::2] - left * left_factor
+        new_a[:num_right] -= right * right_factor
+        new_b = -right_factor[:num_odd - 1] * left[1:num_odd]
+
+        levels.append((pivots, left, right, left_factor, right_factor))
+        a, b = new_a, new_b
+
+    return levels, a
+
+
+def solve_factorized(
+    levels: list[Level],
+    last_pivot: NDArray,
+    rhs: NDArray,
+) -> NDArray:
+    """
+    用 factorize 的结果求解三对角方程组
+
+    参数:
+        levels, last_pivot: factorize 的返回值
+        rhs: 右端项，形状 (n, B)，B 与分解时的 S 相同或可广播
+
+    返回:
+        解，形状 (n, B)
+    """
+    reduced: list[NDArray] = []
+    r = rhs
+
+    # 前向约化右端项
+    for _, _, right, left_factor, right_factor in levels:
+        even = r[0::2]
+        num_odd = left_factor.shape[0]
+        num_right = right.shape[0]
+
+        new_r = r[1::2] - left_factor * even[:num_odd]
+        new_r[:num_right] -= right_factor * even[1:num_right + 1]
+
+        reduced.append(even)
+        r = new_r
+
+    x = r / last_pivot
+
+    # 回代偶数下标的未知量
+    for (pivots, left, right, _, _), even in zip(reversed(levels), reversed(reduced)):
+        num_odd = x.shape[0]
+        num_right = right.shape[0]
+
+        x_even = even.astype(np.result_type(even, x, pivots))
+        x_even[:num_odd] -= left * x
+        x_even[1:num_right + 1] -= right * x[:num_right]
+        x_even /= pivots
+
+        full = np.empty((x_even.shape[0] + num_odd,) + x.shape[1:], dtype=x.dtype)
+        full[0::2] = x_even
+        full[1::2] = x
+        x = full
+
+    return x
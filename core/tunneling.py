@@ -0,0 +1,205 @@
+"""
+一维势垒散射 - 传递矩阵法计算透射与反射谱
+
+势能为分段常数：第 j 层宽度为 dⱼ、势能为 Vⱼ，两侧为势能 V_left、V_right
+的半无限区域（细分的连续势可以看作很多薄层）。
+
+这里使用 (ψ, ψ') 表象的传递矩阵：ψ 与 ψ' 在界面处连续，
+因此不需要界面矩阵，穿过一层就是一个实数 2×2 矩阵
+    E > Vⱼ:  [[cos kd,  sin kd / k], [-k sin kd, cos kd]],  k = √(2m(E - Vⱼ)) / ℏ
+    E < Vⱼ:  [[cosh κd, sinh κd / κ], [κ sinh κd, cosh κd]], κ = √(2m(Vⱼ - E)) / ℏ
+总矩阵 M = M_N ··· M₁ 行列式为 1。入射波从左侧入射、两侧均为传播区时
+    T = 4 k_L k_R / [(k_L k_R M₁₂ - M₂₁)² + (k_L M₂₂ + k_R M₁₁)²],  R = 1 - T
+
+每个能量的计算互相独立，所有运算都沿能量轴向量化：
+逐层扫描时只维护形状 (E,) 的四个矩阵元，不生成 (层数 × 能量) 的中间数组。
+能量排好序后，每层的传播区与倏逝区是能量数组的两段连续切片，
+三角函数与指数函数只在各自的切片上求值。
+倏逝层的 cosh/sinh 以 e^{κd} 为单位存储，连乘的对数尺度单独累加，
+厚势垒也不会溢出。
+所有运算固定使用 float64，不接入 core.precision 的精度设置（原因见该模块说明）。
+"""
+
+from functools import lru_cache, partial
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .execution import evaluate_elementwise
+
+# 每隔多少层对累积矩阵做一次归一
+RENORMALIZE_EVERY = 16
+
+
+@lru_cache(maxsize=32)
+def _prepare_layers(
+    potential_bytes: bytes,
+    widths_bytes: bytes,
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """
+    与能量无关的层预处理（按势能缓存，只改变能量范围时直接复用）
+
+    合并势能相同的相邻层：分段常数势的平台、细分势中的平坦区域都只保留一层，
+    并去掉宽度为 0 的层。
+
+    返回:
+        (合并后各层势能, 合并后各层宽度)
+    """
+    potential = np.frombuffer(potential_bytes, dtype=float)
+    widths = np.frombuffer(widths_bytes, dtype=float)
+
+    nonempty = widths > 0
+    potential, widths = potential[nonempty], widths[nonempty]
+
+    keep = np.ones(potential.size, dtype=bool)
+    keep[1:] = potential[1:] != potential[:-1]
+    run_index = np.cumsum(keep) - 1
+
+    return potential[keep], np.bincount(run_index, weights=widths, minlength=int(keep.sum()))
+
+
+def _transmission_kernel(
+    energies: NDArray[np.floating],
+    potential: NDArray[np.floating],
+    widths: NDArray[np.floating],
+    v_left: float,
+    v_right: float,
+    k_factor: float,
+) -> NDArray[np.floating]:
+    """
+    对一段已排序的能量计算透射系数 T（逐点内核）
+
+    k_factor = 2m/ℏ²；能量低于 v_left 的项为 nan，低于 v_right 的项为 0。
+    """
+    n = energies.size
+    m11, m12 = np.ones(n), np.zeros(n)
+    m21, m22 = np.zeros(n), np.ones(n)
+    log_scale = np.zeros(n)
+
+    a, b, c = np.empty(n), np.empty(n), np.empty(n)
+    q = np.empty(n)
+    p1, p2 = np.empty(n), np.empty(n)
+
+    for j, (v, d) in enumerate(zip(potential, widths)):
+        split = int(np.searchsorted(energies, v, side="right"))
+        np.sqrt(k_factor * np.abs(energies - v), out=q)
+
+        # 倏逝段 E ≤ V：以 e^{κd} 为单位的 cosh、sinh
+        if split:
+            kappa = q[:split]
+            decay = np.exp(-2 * kappa * d)
+            a[:split] = 0.5 * (1 + decay)
+            sinh = 0.5 * (1 - decay)
+            b[:split] = np.divide(sinh, kappa, out=np.full(split, d), where=kappa > 0)
+            c[:split] = kappa * sinh
+            log_scale[:split] += kappa * d
+
+        # 传播段 E > V
+        if split < n:
+            k = q[split:]
+            phase = k * d
+            a[split:] = np.cos(phase)
+            sin = np.sin(phase)
+            b[split:] = sin / k
+            c[split:] = -k * sin
+
+        # 层矩阵 [[a, b], [c, a]] 左乘累积矩阵
+        for top, bottom in ((m11, m21), (m12, m22)):
+            np.multiply(a, top, out=p1)
+            p1 += b * bottom
+            np.multiply(c, top, out=p2)
+            bottom *= a
+            bottom += p2
+            top[:] = p1
+
+        if j % RENORMALIZE_EVERY == RENORMALIZE_EVERY - 1:
+            norm = np.maximum(np.maximum(np.abs(m11), np.abs(m12)), np.maximum(np.abs(m21), np.abs(m22)))
+            for element in (m11, m12, m21, m22):
+                element /= norm
+            log_scale += np.log(norm)
+
+    k_left = np.sqrt(k_factor * np.maximum(energies - v_left, 0.0))
+    k_right = np.sqrt(k_factor * np.maximum(energies - v_right, 0.0))
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore", under="ignore"):
+        denominator = (k_left * k_right * m12 - m21) ** 2 + (k_left * m22 + k_right * m11) ** 2
+        transmission = 4 * k_left * k_right * np.exp(-2 * log_scale) / denominator
+
+    transmission = np.where(energies > v_right, transmission, 0.0)
+    return np.where(energies > v_left, transmission, np.nan)
+
+
+def transmission_spectrum(
+    energies: ArrayLike,
+    potential: ArrayLike,
+    widths: ArrayLike,
+    v_left: float = 0.0,
+    v_right: float = 0.0,
+    mass: float = 1.0,
+    hbar: float = 1.0,
+    num_threads: int | None = None,
+) -> dict[str, NDArray[np.floating]]:
+    """
+    计算一组能量下的透射系数与反射系数
+
+    参数:
+        energies: 能量数组，形状 (E,)，无需排序
+        potential: 各层势能 Vⱼ，形状 (L,)
+        widths: 各层宽度 dⱼ，形状 (L,) 或标量
+        v_left, v_right: 左右两侧半无限区域的势能
+        mass: 粒子质量 m
+        hbar: 约化普朗克常数 ℏ
+        num_threads: 求值线程数，None 时使用 core.execution 的全局配置；
+                     大量能量点时沿能量轴分块并行
+
+    返回:
+        {"energy", "transmission", "reflection"} 字典，每项形状 (E,)；
+        能量低于 v_left 时没有入射波，两项均为 nan
+    """
+    energies = np.atleast_1d(np.asarray(energies, dtype=float))
+    potential = np.ascontiguousarray(potential, dtype=float)
+    widths = np.ascontiguousarray(np.broadcast_to(widths, potential.shape), dtype=float)
+
+    merged_potential, merged_widths = _prepare_layers(potential.tobytes(), widths.tobytes())
+
+    order = np.argsort(energies, kind="stable")
+    kernel = partial(
+        _transmission_kernel,
+        potential=merged_potential,
+        widths=merged_widths,
+        v_left=float(v_left),
+        v_right=float(v_right),
+        k_factor=2 * mass / hbar**2,
+    )
+
+    transmission = np.empty_like(energies)
+    transmission[order] = evaluate_elementwise(kernel, energies[order], num_threads=num_threads)
+
+    return {
+        "energy": energies,
+        "transmission": transmission,
+        "reflection": 1 - transmission,
+    }
+
+
+def discretize_potential(
+    potential_fn,
+    x_min: float,
+    x_max: float,
+    num_layers: int,
+) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+    """
+    把连续势 V(x) 在 [x_min, x_max] 上离散为 num_layers 个等宽薄层
+
+    参数:
+        potential_fn: 接受坐标数组、返回势能数组的函数
+        x_min, x_max: 散射区范围
+        num_layers: 层数
+
+    返回:
+        (各层势能, 各层宽度)，势能取各层中点的值
+    """
+    width = (x_max - x_min) / num_layers
+    midpoints = x_min + width * (np.arange(num_layers) + 0.5)
+
+    return np.asarray(potential_fn(midpoints), dtype=float), np.full(num_layers, width)
@@ -29,7 +29,10 @@ def show():
 | 实验名称 | 说明 |
 |---------|------|
 | **双缝干涉** | 探索波粒二象性的经典实验，观察干涉条纹如何随参数变化 |
-| **高斯波包** | 观察自由粒子高斯波包随时间的量子扩散过程 |
+| **高斯波包** | 观察自由粒子高斯波包随时间的量子扩散过程，以及玻姆轨迹系综的展开 |
+| **一维定态** | 求解任意势阱中的束缚态，观察能级与本征函数 |
+| **双波包干涉** | 两个展宽的高斯波包相干叠加，观察干涉条纹的形成 |
+| **量子隧穿** | 计算任意势垒的透射谱，观察隧穿与共振透射 |
 
 ### 项目特点
 
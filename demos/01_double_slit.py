@@ -4,86 +4,113 @@
 通过调整波长、双缝间距和屏幕距离，观察干涉条纹的变化。
 """
 
+import time
+
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-from core.double_slit import compute_double_slit
-
-
-def get_name() -> str:
-    """返回 demo 的中文名称（含 emoji）"""
-    return "🌊 双缝干涉"
-
-
-def show():
-    """渲染双缝干涉演示页面"""
-    
-    # --- Sidebar: 控制面板 ---
-    st.sidebar.subheader("⚙️ 实验参数")
-    
-    wavelength = st.sidebar.slider(
-        "波长 λ",
+from core.double_slit import (
+    compute_double_slit,
+    iter_double_slit_refinements,
+    sample_double_slit_hits,
+)
+from core.double_slit_2d import frame_coords, simulate_double_slit_2d
+from core.fringe_analysis import StreamingFringeAnalyzer
+from demos.session_store import get_store
+
+# 侧边栏滑块定义：参数名 -> st.slider 参数
+# 静态导出（demos.static_export）也从这里读取参数空间
+SLIDERS = {
+    "wavelength": dict(
+        label="波长 λ",
         min_value=0.3,
         max_value=1.0,
         value=0.5,
         step=0.01,
-        help="光的波长（任意单位）。波长越大，条纹间距越大。"
-    )
-    
-    slit_distance = st.sidebar.slider(
-        "双缝间距 d",
+        help="光的波长（任意单位）。波长越大，条纹间距越大。",
+    ),
+    "slit_distance": dict(
+        label="双缝间距 d",
         min_value=1.0,
         max_value=5.0,
         value=2.0,
         step=0.1,
-        help="两条狭缝之间的距离。间距越大，条纹越密。"
-    )
-    
-    screen_distance = st.sidebar.slider(
-        "屏幕距离 L",
+        help="两条狭缝之间的距离。间距越大，条纹越密。",
+    ),
+    "screen_distance": dict(
+        label="屏幕距离 L",
         min_value=5.0,
         max_value=20.0,
         value=10.0,
         step=0.5,
-        help="狭缝到观察屏的距离。距离越远，条纹越宽。"
-    )
-    
-    x_range = st.sidebar.slider(
-        "x 轴范围",
+        help="狭缝到观察屏的距离。距离越远，条纹越宽。",
+    ),
+    "x_range": dict(
+        label="x 轴范围",
         min_value=5.0,
         max_value=50.0,
         value=25.0,
         step=1.0,
         help="调整显示的屏幕坐标范围 [-x, x]",
-    )
-    
-    # 计算条纹间距
-    fringe_spacing = wavelength * screen_distance / slit_distance
-    
-    st.sidebar.markdown("---")
-    st.sidebar.metric("条纹间距 Δx", f"{fringe_spacing:.2f}")
-    
-    # --- Main Area: 可视化 ---
-    st.title(get_name())
-    st.markdown("""
-这是一个经典的**双缝干涉**交互演示。调整左侧参数，实时观察干涉条纹的变化。
+    ),
+}
 
-> 💡 **物理原理**：当相干光通过两条狭缝时，在屏幕上形成明暗相间的干涉条纹。
-> 条纹间距与波长成正比，与双缝间距成反比。
-""")
+# 屏幕上的采样点数；更高的分辨率由粗到细渐进绘制
+NUM_POINTS = 2000
+NUM_POINTS_OPTIONS = [2_000, 20_000, 200_000]
+
+# 单光子累积直方图的 bin 数
+NUM_HIT_BINS = 1000
+
+# 预热参数点：默认滑块位置，以及不同双缝间距下的二维模拟
+WARMUP_POINTS = [
+    {**{name: spec["value"] for name, spec in SLIDERS.items()}, "slit_distance": d}
+    for d in (2.0, 1.0, 3.0, 4.0, 5.0)
+]
+WARMUP_BUDGET = 60.0
 
-    # 计算干涉强度分布
-    x, intensity = compute_double_slit(
+
+def get_name() -> str:
+    """返回 demo 的中文名称（含 emoji）"""
+    return "🌊 双缝干涉"
+
+
+@st.cache_data(show_spinner=False)
+def _compute_profile(
+    wavelength: float,
+    slit_distance: float,
+    screen_distance: float,
+    x_range: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """按滑块位置缓存的干涉强度分布"""
+    return compute_double_slit(
         wavelength=wavelength,
         slit_distance=slit_distance,
         screen_distance=screen_distance,
         x_range=x_range,
+        num_points=NUM_POINTS,
     )
 
-    st.divider()
 
-    # 绘制干涉图样
-    st.subheader("📊 干涉强度分布")
+@st.cache_data(show_spinner="正在预计算二维波包演化...")
+def _simulate_2d(slit_distance: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """预计算二维双缝模拟的全部帧，供页面回放；返回 (时间, 帧, 像素中心坐标)"""
+    frames = list(simulate_double_slit_2d(
+        num_points=256,
+        box_size=40.0,
+        slit_distance=slit_distance,
+        slit_width=min(1.0, slit_distance / 2),
+        num_steps=600,
+        frame_every=20,
+        downsample=2,
+    ))
+    times = np.array([t for t, _ in frames])
+    densities = np.stack([frame for _, frame in frames])
+    return times, densities, frame_coords(256, 40.0, 2)
 
+
+def _intensity_figure(x: np.ndarray, intensity: np.ndarray) -> go.Figure:
+    """绘制干涉强度分布曲线"""
     fig = go.Figure()
 
     fig.add_trace(go.Scatter(
@@ -118,7 +145,84 @@ def show():
         ),
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+def warmup(
+    wavelength: float,
+    slit_distance: float,
+    screen_distance: float,
+    x_range: float,
+) -> None:
+    """预计算一个参数点的强度分布与二维模拟"""
+    _compute_profile(wavelength, slit_distance, screen_distance, x_range)
+    _simulate_2d(slit_distance)
+
+
+def show():
+    """渲染双缝干涉演示页面"""
+    
+    # --- Sidebar: 控制面板 ---
+    st.sidebar.subheader("⚙️ 实验参数")
+    
+    wavelength = st.sidebar.slider(**SLIDERS["wavelength"])
+    slit_distance = st.sidebar.slider(**SLIDERS["slit_distance"])
+    screen_distance = st.sidebar.slider(**SLIDERS["screen_distance"])
+    x_range = st.sidebar.slider(**SLIDERS["x_range"])
+    num_points = st.sidebar.select_slider(
+        "采样点数",
+        options=NUM_POINTS_OPTIONS,
+        value=NUM_POINTS,
+        help="默认点数命中缓存；更高的分辨率先显示粗略结果，再逐级细化",
+    )
+    
+    # 计算条纹间距
+    fringe_spacing = wavelength * screen_distance / slit_distance
+    
+    st.sidebar.markdown("---")
+    st.sidebar.metric("条纹间距 Δx", f"{fringe_spacing:.2f}")
+    
+    # --- Main Area: 可视化 ---
+    st.title(get_name())
+    st.markdown("""
+这是一个经典的**双缝干涉**交互演示。调整左侧参数，实时观察干涉条纹的变化。
+
+> 💡 **物理原理**：当相干光通过两条狭缝时，在屏幕上形成明暗相间的干涉条纹。
+> 条纹间距与波长成正比，与双缝间距成反比。
+""")
+
+    st.divider()
+
+    # 绘制干涉图样
+    st.subheader("📊 干涉强度分布")
+
+    if num_points == NUM_POINTS:
+        x, intensity = _compute_profile(wavelength, slit_distance, screen_distance, x_range)
+        st.plotly_chart(_intensity_figure(x, intensity), use_container_width=True)
+    else:
+        # 高分辨率结果只对当前用户有意义，存入带内存预算的会话存储
+        store = get_store()
+        key = ("double_slit", wavelength, slit_distance, screen_distance, x_range, num_points)
+        stored = store.get(key)
+
+        if stored is not None:
+            st.plotly_chart(_intensity_figure(*stored), use_container_width=True)
+        else:
+            # 由粗到细渐进计算，每一级原地替换图表
+            chart = st.empty()
+            status = st.empty()
+            start = time.perf_counter()
+            refinements = iter_double_slit_refinements(
+                wavelength, slit_distance, screen_distance, x_range, num_points
+            )
+            for stride, x, intensity in refinements:
+                chart.plotly_chart(_intensity_figure(x, intensity), use_container_width=True)
+                if stride > 1:
+                    status.caption(f"⏳ 1/{stride} 分辨率（{len(x):,} 点），继续细化中...")
+                else:
+                    elapsed = time.perf_counter() - start
+                    status.caption(f"✅ 完整分辨率 {len(x):,} 点，用时 {elapsed:.2f} s")
+            store.put(key, (x, intensity))
 
     # 显示当前参数信息
     st.divider()
@@ -138,6 +242,150 @@ def show():
     with info_col4:
         st.metric("条纹间距", f"{fringe_spacing:.2f}")
 
+    # 二维含时模拟
+    st.divider()
+    st.subheader("🎬 波包穿过双缝")
+    st.markdown("""
+上面的曲线是稳态的 Fraunhofer 公式。下面用二维含时薛定谔方程模拟一个**波包真正穿过双缝**的过程：
+挡板为硬墙，计算区域边缘为吸收层。模拟只依赖双缝间距 d，结果会被缓存并可逐帧回放。
+""")
+
+    if st.checkbox("运行二维模拟", value=False):
+        times, densities, axis = _simulate_2d(slit_distance)
+
+        frame_index = st.slider(
+            "时间帧",
+            min_value=0,
+            max_value=len(times) - 1,
+            value=len(times) - 1,
+            step=1,
+        )
+
+        fig2d = go.Figure(go.Heatmap(
+            x=axis,
+            y=axis,
+            z=densities[frame_index],
+            colorscale="Viridis",
+            showscale=False,
+            hovertemplate="x: %{x:.1f}<br>y: %{y:.1f}<br>|ψ|²: %{z:.2e}<extra></extra>",
+        ))
+        fig2d.update_layout(
+            title=f"t = {times[frame_index]:.2f}",
+            xaxis_title="x",
+            yaxis_title="y（传播方向）",
+            yaxis_scaleanchor="x",
+            margin=dict(l=60, r=20, t=40, b=60),
+            height=550,
+            template="plotly_white",
+        )
+
+        st.plotly_chart(fig2d, use_container_width=True)
+
+    # 单光子累积与条纹测量
+    st.divider()
+    st.subheader("🎯 单光子累积与条纹测量")
+    st.markdown("""
+光子一个一个地打到屏幕上，直方图逐渐显现出条纹。条纹周期、相位与可见度由
+**加窗 FFT 峰值估计**从计数中直接测得，每批新光子只增量更新频谱，而不是重新分析全部数据。
+""")
+
+    hit_col1, hit_col2, hit_col3 = st.columns(3)
+
+    with hit_col1:
+        coherence = st.slider(
+            "相干度 γ",
+            min_value=0.0,
+            max_value=1.0,
+            value=1.0,
+            step=0.05,
+            help="部分相干光的条纹可见度，γ = 0 时条纹消失",
+        )
+
+    with hit_col2:
+        batch_size = st.select_slider(
+            "每批光子数",
+            options=[1_000, 10_000, 100_000],
+            value=100_000,
+        )
+
+    with hit_col3:
+        num_batches = st.slider("批次数", min_value=1, max_value=50, value=20)
+
+    # 参数改变时重新开始累积
+    hit_params = (wavelength, slit_distance, screen_distance, x_range, coherence)
+    if st.session_state.get("fringe_analyzer_params") != hit_params:
+        st.session_state.fringe_analyzer_params = hit_params
+        st.session_state.fringe_analyzer = StreamingFringeAnalyzer(
+            NUM_HIT_BINS, -x_range, x_range
+        )
+    analyzer = st.session_state.fringe_analyzer
+
+    run_col, reset_col = st.columns([1, 5])
+    with run_col:
+        emit = st.button("发射光子", type="primary")
+    with reset_col:
+        if st.button("清空屏幕"):
+            analyzer = st.session_state.fringe_analyzer = StreamingFringeAnalyzer(
+                NUM_HIT_BINS, -x_range, x_range
+            )
+
+    hist_chart = st.empty()
+    measure_cols = st.columns(4)
+    measure_placeholders = [col.empty() for col in measure_cols]
+
+    def render_hits() -> None:
+        """绘制当前直方图与测量结果"""
+        fig_hits = go.Figure(go.Bar(
+            x=analyzer.centers,
+            y=analyzer.counts,
+            marker=dict(color="#1f77b4", line=dict(width=0)),
+            hovertemplate="x: %{x:.2f}<br>计数: %{y}<extra></extra>",
+        ))
+        fig_hits.update_layout(
+            xaxis_title="屏幕位置 x",
+            yaxis_title="计数",
+            bargap=0,
+            margin=dict(l=60, r=20, t=40, b=60),
+            height=350,
+            template="plotly_white",
+        )
+        hist_chart.plotly_chart(fig_hits, use_container_width=True)
+
+        result = analyzer.estimate()
+        measure_placeholders[0].metric("累计光子数", f"{result['total']:,}")
+        if result["total"] > 0 and not result["resolved"]:
+            measure_placeholders[1].metric(
+                "测得条纹间距", "未分辨", "视野内不足两个条纹", delta_color="off"
+            )
+            measure_placeholders[2].metric("测得可见度", "—")
+            measure_placeholders[3].metric("条纹相位 φ", "—")
+        elif result["total"] > 0:
+            measure_placeholders[1].metric(
+                "测得条纹间距",
+                f"{result['period']:.3f}",
+                f"{result['period'] - fringe_spacing:+.3f}",
+                delta_color="off",
+            )
+            measure_placeholders[2].metric(
+                "测得可见度",
+                f"{result['visibility']:.3f}",
+                f"{result['visibility'] - coherence:+.3f}",
+                delta_color="off",
+            )
+            measure_placeholders[3].metric("条纹相位 φ", f"{result['phase']:+.3f}")
+
+    if emit:
+        rng = np.random.default_rng()
+        for _ in range(num_batches):
+            analyzer.add_hits(sample_double_slit_hits(
+                batch_size, wavelength, slit_distance, screen_distance, x_range, coherence, rng
+            ))
+            render_hits()
+    else:
+        render_hits()
+
+    st.caption("测量值下方的差值相对于理论值 λL/d 与 γ。")
+
     # --- Main Area: 物理解释 ---
     st.divider()
     st.header("📖 物理原理")
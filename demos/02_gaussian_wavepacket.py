@@ -4,15 +4,209 @@
 可视化初始静止高斯波包在不同时刻的概率密度分布。
 """
 
+import time
+
+import numpy as np
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
-from core.gaussian_wavepacket import compute_wavepacket_evolution
+from plotly.colors import qualitative
+from core.bohmian import compute_gaussian_trajectories
+from core.gaussian_wavepacket import (
+    compute_observables,
+    compute_wavepacket_evolution,
+    iter_wavepacket_refinements,
+)
+from demos.reactive import get_graph
+from demos.session_store import get_store
+
+# 预设时间点；静态导出（demos.static_export）也从这里读取
+PRESET_OPTIONS = {
+    "短时演化 (0, 1, 2, 3)": [0, 1, 2, 3],
+    "中等演化 (0, 2, 4, 6, 8)": [0, 2, 4, 6, 8],
+    "长时演化 (0, 5, 10, 15, 20)": [0, 5, 10, 15, 20],
+    "细粒度 (0, 0.5, 1, 1.5, 2, 2.5, 3)": [0, 0.5, 1, 1.5, 2, 2.5, 3],
+}
+
+X_RANGE_SLIDER = dict(
+    label="x 轴范围",
+    min_value=5.0,
+    max_value=30.0,
+    value=15.0,
+    step=1.0,
+    help="调整显示的空间范围 [-x, x]",
+)
+
+# 每条密度曲线的采样点数；更高的分辨率由粗到细渐进绘制
+NUM_POINTS = 500
+NUM_POINTS_OPTIONS = [500, 5_000, 50_000]
+
+# 默认分辨率在 x 轴范围的最大值上计算一次，x 轴范围只是视图设置；
+# 点数按范围放大，点密度与 NUM_POINTS 个点覆盖最小范围时相同
+FULL_RANGE_POINTS = 3000
+
+# 玻姆轨迹：系综粒子数选项、RK4 步数与绘制的轨迹条数
+NUM_TRAJECTORIES_OPTIONS = [1_000, 10_000, 100_000]
+NUM_TRAJECTORY_STEPS = 1000
+NUM_PLOTTED_TRAJECTORIES = 40
+
+# 预热参数点：各预设的密度曲线
+WARMUP_POINTS = [
+    {"t_values": tuple(sorted(t_values))}
+    for t_values in PRESET_OPTIONS.values()
+]
+WARMUP_BUDGET = 10.0
 
 def get_name() -> str:
     """返回 demo 的中文名称（含 emoji）"""
     return "📦 高斯波包"
 
+
+@st.cache_data(show_spinner=False)
+def _compute_densities(
+    t_values: tuple[float, ...],
+) -> tuple[np.ndarray, dict[float, np.ndarray]]:
+    """按时间点缓存的概率密度，覆盖 x 轴范围滑块的最大范围"""
+    x_max = X_RANGE_SLIDER["max_value"]
+    return compute_wavepacket_evolution(
+        t_values=list(t_values),
+        x_min=-x_max,
+        x_max=x_max,
+        num_points=FULL_RANGE_POINTS,
+    )
+
+
+def _density_figure(
+    x: np.ndarray,
+    densities: dict[float, np.ndarray],
+    t_values: list[float],
+) -> go.Figure:
+    """绘制各时刻的概率密度曲线"""
+    colors = qualitative.Plotly
+
+    fig = go.Figure()
+
+    for i, t in enumerate(sorted(t_values)):
+        color = colors[i % len(colors)]
+        fig.add_trace(go.Scatter(
+            x=x,
+            y=densities[t],
+            mode="lines",
+            line=dict(color=color, width=2),
+            name=f"t = {t}",
+            hovertemplate=f"t={t}<br>x: %{{x:.2f}}<br>|Ψ|²: %{{y:.4f}}<extra></extra>",
+        ))
+
+    fig.update_layout(
+        xaxis_title="位置 x",
+        yaxis_title="概率密度 |Ψ(x,t)|²",
+        hovermode="x unified",
+        margin=dict(l=60, r=20, t=40, b=60),
+        height=500,
+        template="plotly_white",
+        legend=dict(
+            title="时间 t",
+            yanchor="top",
+            y=0.99,
+            xanchor="right",
+            x=0.99,
+        ),
+        xaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor="rgba(128, 128, 128, 0.2)",
+            zeroline=True,
+            zerolinewidth=1,
+            zerolinecolor="rgba(128, 128, 128, 0.5)",
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor="rgba(128, 128, 128, 0.2)",
+        ),
+    )
+
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _compute_trajectories(num_particles: int, t_max: float) -> tuple[dict[str, np.ndarray], float]:
+    """按 (粒子数, 终止时间) 缓存的玻姆轨迹系综"""
+    start = time.perf_counter()
+    result = compute_gaussian_trajectories(
+        num_particles,
+        t_max,
+        num_steps=NUM_TRAJECTORY_STEPS,
+        num_plotted=NUM_PLOTTED_TRAJECTORIES,
+    )
+    return result, time.perf_counter() - start
+
+
+def _trajectory_figure(result: dict[str, np.ndarray], x_range: float) -> go.Figure:
+    """绘制抽稀后的玻姆轨迹与解析宽度 ±σ(t)"""
+    t = result["t"]
+    trajectories = result["trajectories"]
+
+    # 所有轨迹合并为一条以 None 分隔的折线，避免成百条 trace
+    num_lines = trajectories.shape[1]
+    x_lines = np.vstack([trajectories, np.full((1, num_lines), np.nan)]).T.ravel()
+    t_lines = np.tile(np.append(t, np.nan), num_lines)
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=x_lines,
+        y=t_lines,
+        mode="lines",
+        line=dict(color="rgba(31, 119, 180, 0.6)", width=1),
+        name="玻姆轨迹",
+        hoverinfo="skip",
+    ))
+
+    # 解析宽度 Δx(t)，与轨迹使用相同的默认波包参数
+    width = compute_observables(t)["delta_x"]
+    for sign, show in ((1, True), (-1, False)):
+        fig.add_trace(go.Scatter(
+            x=sign * width,
+            y=t,
+            mode="lines",
+            line=dict(color="#d62728", width=2, dash="dash"),
+            name="±σ(t)",
+            showlegend=show,
+            hovertemplate="x: %{x:.2f}<br>t: %{y:.2f}<extra></extra>",
+        ))
+
+    fig.update_layout(
+        xaxis_title="位置 x",
+        yaxis_title="时间 t",
+        xaxis_range=[-x_range, x_range],
+        margin=dict(l=60, r=20, t=40, b=60),
+        height=450,
+        template="plotly_white",
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="right",
+            x=0.99,
+        ),
+    )
+
+    return fig
+
+
+def warmup(t_values: tuple[float, ...]) -> None:
+    """预计算一组时间点的概率密度"""
+    _compute_densities(t_values)
+
+
+def _build_graph(graph) -> None:
+    """默认分辨率的计算图：密度只依赖时间点，图表依赖密度与时间点"""
+    graph.add_node("densities", _compute_densities, inputs=["t_values"])
+    graph.add_node(
+        "figure",
+        lambda result, t_values: _density_figure(*result, list(t_values)),
+        inputs=["densities", "t_values"],
+    )
+
 def show():
     """渲染高斯波包演化演示页面"""
     
@@ -29,17 +223,11 @@ def show():
     )
     
     if input_method == "预设时间点":
-        preset_options = {
-            "短时演化 (0, 1, 2, 3)": [0, 1, 2, 3],
-            "中等演化 (0, 2, 4, 6, 8)": [0, 2, 4, 6, 8],
-            "长时演化 (0, 5, 10, 15, 20)": [0, 5, 10, 15, 20],
-            "细粒度 (0, 0.5, 1, 1.5, 2, 2.5, 3)": [0, 0.5, 1, 1.5, 2, 2.5, 3],
-        }
         selected_preset = st.sidebar.selectbox(
             "选择预设",
-            list(preset_options.keys()),
+            list(PRESET_OPTIONS.keys()),
         )
-        t_values = preset_options[selected_preset]
+        t_values = PRESET_OPTIONS[selected_preset]
     else:
         custom_input = st.sidebar.text_input(
             "输入时间点（逗号分隔）",
@@ -57,15 +245,21 @@ def show():
     
     st.sidebar.markdown("---")
     
-    x_range = st.sidebar.slider(
-        "x 轴范围",
-        min_value=5.0,
-        max_value=30.0,
-        value=15.0,
-        step=1.0,
-        help="调整显示的空间范围 [-x, x]",
+    x_range = st.sidebar.slider(**X_RANGE_SLIDER)
+    num_points = st.sidebar.select_slider(
+        "采样点数",
+        options=NUM_POINTS_OPTIONS,
+        value=NUM_POINTS,
+        help="默认点数命中缓存；更高的分辨率先显示粗略结果，再逐级细化",
     )
     
+    num_trajectories = st.sidebar.select_slider(
+        "轨迹数",
+        options=NUM_TRAJECTORIES_OPTIONS,
+        value=NUM_TRAJECTORIES_OPTIONS[1],
+        help="玻姆轨迹系综的粒子数；图中只绘制其中等间隔分位数的若干条",
+    )
+
     st.sidebar.markdown("---")
     st.sidebar.caption(f"时间点：{', '.join(f't={t}' for t in sorted(t_values))}")
     
@@ -78,64 +272,75 @@ def show():
 > 波包的宽度与时间的关系反映了位置-动量不确定性。
 """)
 
-    # 计算概率密度
-    x, densities = compute_wavepacket_evolution(
-        t_values=sorted(t_values),
-        x_min=-x_range,
-        x_max=x_range,
-        num_points=500,
-    )
-
     st.divider()
 
     # 绘制概率密度图
     st.subheader("📊 概率密度分布 $|\\Psi(x,t)|^2$")
 
-    colors = px.colors.qualitative.Plotly
+    t_sorted = sorted(t_values)
 
-    fig = go.Figure()
+    if num_points == NUM_POINTS:
+        # x 轴范围只影响视图：改变它时不重算密度、不重建图表
+        graph = get_graph("gaussian_wavepacket", _build_graph)
+        graph.set_inputs(t_values=tuple(t_sorted))
+        fig = graph.get("figure")
+        fig.update_layout(xaxis_range=[-x_range, x_range])
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        # 高分辨率结果只对当前用户有意义，存入带内存预算的会话存储
+        store = get_store()
+        key = ("gaussian_wavepacket", tuple(t_sorted), x_range, num_points)
+        stored = store.get(key)
+
+        if stored is not None:
+            st.plotly_chart(_density_figure(*stored, t_sorted), use_container_width=True)
+        else:
+            # 由粗到细渐进计算，每一级原地替换图表
+            chart = st.empty()
+            status = st.empty()
+            start = time.perf_counter()
+            refinements = iter_wavepacket_refinements(t_sorted, -x_range, x_range, num_points)
+            for stride, x, densities in refinements:
+                figure = _density_figure(x, densities, t_sorted)
+                chart.plotly_chart(figure, use_container_width=True)
+                if stride > 1:
+                    status.caption(f"⏳ 1/{stride} 分辨率（{len(x):,} 点），继续细化中...")
+                else:
+                    elapsed = time.perf_counter() - start
+                    status.caption(f"✅ 完整分辨率 {len(x):,} 点，用时 {elapsed:.2f} s")
+            store.put(key, (x, densities))
+
+    # 玻姆轨迹
+    t_max = float(t_sorted[-1])
+    if t_max > 0:
+        st.divider()
+        st.subheader("🧵 玻姆轨迹")
+        st.markdown(
+            "按 $|\\Psi(x,0)|^2$ 抽样初始位置，沿速度场 "
+            "$v = \\frac{\\hbar}{m}\\,\\mathrm{Im}\\,\\frac{\\partial_x \\Psi}{\\Psi}$ 积分。"
+            "轨迹互不交叉，整个系综随波包一起展开。"
+        )
 
-    for i, t in enumerate(sorted(t_values)):
-        color = colors[i % len(colors)]
-        fig.add_trace(go.Scatter(
-            x=x,
-            y=densities[t],
-            mode="lines",
-            line=dict(color=color, width=2),
-            name=f"t = {t}",
-            hovertemplate=f"t={t}<br>x: %{{x:.2f}}<br>|Ψ|²: %{{y:.4f}}<extra></extra>",
-        ))
+        with st.spinner("积分轨迹中..."):
+            trajectories, elapsed = _compute_trajectories(num_trajectories, t_max)
+        st.plotly_chart(_trajectory_figure(trajectories, x_range), use_container_width=True)
 
-    fig.update_layout(
-        xaxis_title="位置 x",
-        yaxis_title="概率密度 |Ψ(x,t)|²",
-        hovermode="x unified",
-        margin=dict(l=60, r=20, t=40, b=60),
-        height=500,
-        template="plotly_white",
-        legend=dict(
-            title="时间 t",
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-        ),
-        xaxis=dict(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor="rgba(128, 128, 128, 0.2)",
-            zeroline=True,
-            zerolinewidth=1,
-            zerolinecolor="rgba(128, 128, 128, 0.5)",
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridwidth=1,
-            gridcolor="rgba(128, 128, 128, 0.2)",
-        ),
-    )
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric("粒子数 × 步数", f"{num_trajectories:,} × {NUM_TRAJECTORY_STEPS:,}")
+
+        with col2:
+            expected = compute_observables(t_max)["delta_x"]
+            st.metric(
+                f"t = {t_max:g} 时系综宽度",
+                f"{trajectories['std'][-1]:.3f}",
+                f"解析 σ(t) = {expected:.3f}",
+                delta_color="off",
+            )
 
-    st.plotly_chart(fig, use_container_width=True)
+        with col3:
+            st.metric("计算耗时", f"{elapsed * 1000:.0f} ms")
 
     # 观察说明
     st.divider()
@@ -0,0 +1,216 @@
+"""
+一维定态 - 交互演示模块
+
+选择势能形状，求解最低的若干个束缚态，观察能级与本征函数。
+"""
+
+import time
+
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+from core.stationary_states import solve_bound_states
+
+# 势能名称 -> (势能函数, 参数说明)
+POTENTIALS = {
+    "谐振子": (lambda x, s: 0.5 * s**2 * x**2, "角频率 ω"),
+    "有限深方势阱": (lambda x, s: np.where(np.abs(x) < 2.0, 0.0, s), "势阱深度 V₀"),
+    "双势阱": (lambda x, s: s * (x**2 - 4.0) ** 2 / 16, "势垒高度 V_b"),
+    "线性势（量子弹跳球）": (lambda x, s: s * np.abs(x), "力 F"),
+}
+
+# 绘图时每条曲线最多的点数
+MAX_PLOT_POINTS = 2000
+
+# 预热参数点：各势能在默认设置下的求解结果
+WARMUP_POINTS = [
+    dict(potential_name=name, strength=2.0, x_max=8.0, num_points=10_000, num_states=5)
+    for name in POTENTIALS
+]
+WARMUP_BUDGET = 10.0
+
+
+def get_name() -> str:
+    """返回 demo 的中文名称（含 emoji）"""
+    return "🎯 一维定态"
+
+
+@st.cache_data(show_spinner=False)
+def _solve(
+    potential_name: str,
+    strength: float,
+    x_max: float,
+    num_points: int,
+    num_states: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, float]:
+    """按 (势能, 网格) 缓存的束缚态求解"""
+    x = np.linspace(-x_max, x_max, num_points)
+    v = POTENTIALS[potential_name][0](x, strength)
+
+    start = time.perf_counter()
+    energies, wavefunctions = solve_bound_states(x, v, num_states)
+    elapsed = time.perf_counter() - start
+
+    return x, v, energies, wavefunctions, elapsed
+
+
+def warmup(
+    potential_name: str,
+    strength: float,
+    x_max: float,
+    num_points: int,
+    num_states: int,
+) -> None:
+    """预计算一个 (势能, 网格) 组合的束缚态"""
+    _solve(potential_name, strength, x_max, num_points, num_states)
+
+
+def show():
+    """渲染一维定态演示页面"""
+
+    # --- Sidebar: 控制面板 ---
+    st.sidebar.subheader("⚙️ 势能设置")
+
+    potential_name = st.sidebar.selectbox("势能形状", list(POTENTIALS.keys()))
+
+    strength = st.sidebar.slider(
+        POTENTIALS[potential_name][1],
+        min_value=0.5,
+        max_value=10.0,
+        value=2.0,
+        step=0.5,
+        help="势能的强度参数",
+    )
+
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("📐 数值设置")
+
+    num_states = st.sidebar.slider(
+        "本征态个数 k",
+        min_value=1,
+        max_value=10,
+        value=5,
+        step=1,
+    )
+
+    x_max = st.sidebar.slider(
+        "计算区间 [-x, x]",
+        min_value=4.0,
+        max_value=20.0,
+        value=8.0,
+        step=1.0,
+        help="区间两端为无限高势墙",
+    )
+
+    num_points = st.sidebar.select_slider(
+        "网格点数 N",
+        options=[1_000, 10_000, 100_000],
+        value=10_000,
+        help="三对角求解器的内存与计算量均为 O(k·N)",
+    )
+
+    # --- Main Area: 可视化 ---
+    st.title(get_name())
+    st.markdown("""
+这是一个**一维定态薛定谔方程**的交互演示。选择势能形状，观察束缚态的能级与波函数。
+
+> 💡 **物理原理**：束缚在势阱中的粒子只能取分立的能量，
+> 每个能级对应一个驻波形式的本征函数，第 n 个激发态有 n 个节点。
+""")
+
+    x, v, energies, wavefunctions, elapsed = _solve(
+        potential_name, strength, x_max, num_points, num_states
+    )
+
+    st.divider()
+    st.subheader("📊 能级与本征函数")
+
+    stride = max(1, num_points // MAX_PLOT_POINTS)
+    x_plot = x[::stride]
+
+    # 波函数缩放到平均能级间距的一半左右；
+    # 双势阱中近简并的能级对间距极小，按最小间距缩放会把波函数压成直线
+    spacing = (energies[-1] - energies[0]) / (len(energies) - 1) if len(energies) > 1 else 1.0
+    scale = 0.4 * spacing / np.abs(wavefunctions).max()
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=x_plot,
+        y=v[::stride],
+        mode="lines",
+        line=dict(color="black", width=2),
+        name="V(x)",
+        hovertemplate="x: %{x:.2f}<br>V: %{y:.3f}<extra></extra>",
+    ))
+
+    for n, (energy, psi) in enumerate(zip(energies, wavefunctions)):
+        fig.add_trace(go.Scatter(
+            x=x_plot,
+            y=energy + scale * psi[::stride],
+            mode="lines",
+            line=dict(width=1.5),
+            name=f"n = {n}, E = {energy:.4f}",
+            hovertemplate=f"n={n}<br>x: %{{x:.2f}}<extra></extra>",
+        ))
+
+    fig.update_layout(
+        xaxis_title="位置 x",
+        yaxis_title="能量 E",
+        yaxis_range=[min(v.min(), energies[0]) - 0.5 * spacing, energies[-1] + spacing],
+        margin=dict(l=60, r=20, t=40, b=60),
+        height=550,
+        template="plotly_white",
+        xaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor="rgba(128, 128, 128, 0.2)",
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor="rgba(128, 128, 128, 0.2)",
+        ),
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("基态能量 E₀", f"{energies[0]:.6f}")
+
+    with col2:
+        st.metric("网格点数", f"{num_points:,}")
+
+    with col3:
+        st.metric("求解耗时", f"{elapsed * 1000:.0f} ms")
+
+    # --- Main Area: 物理解释 ---
+    st.divider()
+    st.header("📖 物理原理")
+
+    st.markdown(r"""
+**定态薛定谔方程**：
+
+$$-\frac{\hbar^2}{2m}\frac{d^2\psi}{dx^2} + V(x)\psi = E\psi$$
+
+在间距为 $\Delta x$ 的网格上用二阶差分近似二阶导数，方程变为三对角矩阵的本征值问题：
+
+$$H_{ii} = \frac{\hbar^2}{m\Delta x^2} + V(x_i), \qquad H_{i,i\pm1} = -\frac{\hbar^2}{2m\Delta x^2}$$
+
+**谐振子**的精确能级为 $E_n = \hbar\omega\left(n + \frac{1}{2}\right)$，可用于检验数值结果。
+
+**双势阱**中，两个阱内的局域态通过隧穿耦合，能级成对出现且劈裂极小，
+对应的本征函数分别是对称与反对称的组合。
+""")
+
+    st.header("🔬 深入理解")
+
+    st.markdown("""
+### 为什么只求最低几个态？
+
+稠密矩阵对角化的计算量为 $O(N^3)$，十万个网格点时完全不可行。
+这里利用哈密顿量的三对角结构：先用 Sturm 计数与二分法定位能级，
+再用逆迭代求本征函数，内存和计算量都只有 $O(k \\cdot N)$。
+""")
@@ -0,0 +1,317 @@
+"""
+双波包干涉 - 交互演示模块
+
+两个高斯波包相向展宽并重叠，观察干涉条纹如何随时间出现。
+"""
+
+import time
+
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+from core.gaussian_wavepacket import compute_probability_density
+from core.interference import compute_interference_density, fringe_spacing
+from core.tiles import TilePyramid
+
+# 时空干涉图视图的像素数（时间 × 空间），决定所用瓦片的级别
+NUM_T = 400
+NUM_X = 1000
+
+# 每组波包参数的瓦片缓存字节预算
+TILE_CACHE_BYTES = 32 * 2**20
+
+# 可选的视图宽度（空间方向，最宽为整个空间范围）
+VIEW_WIDTHS = [60.0, 30.0, 15.0, 8.0, 4.0, 2.0, 1.0]
+
+# 观察时间范围 [0, T_MAX] 与空间范围 [-X_MAX, X_MAX]
+T_MAX = 10.0
+X_MAX = 30.0
+
+# 预热参数点：默认设置下的时空干涉图
+WARMUP_POINTS = [
+    dict(separation=8.0, k0=0.0, phase=0.0),
+    dict(separation=8.0, k0=1.0, phase=0.0),
+]
+WARMUP_BUDGET = 10.0
+
+
+def get_name() -> str:
+    """返回 demo 的中文名称（含 emoji）"""
+    return "👥 双波包干涉"
+
+
+def _packets(separation: float, k0: float, phase: float) -> list[dict]:
+    """两个相向运动的波包，右侧波包带相对相位 phase"""
+    return [
+        dict(x0=-separation / 2, k0=k0),
+        dict(x0=separation / 2, k0=-k0, weight=np.exp(1j * phase)),
+    ]
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _get_pyramid(separation: float, k0: float, phase: float) -> TilePyramid:
+    """按波包参数缓存的时空干涉图瓦片金字塔（各会话共享，瓦片按需计算）"""
+    packets = _packets(separation, k0, phase)
+
+    return TilePyramid(
+        lambda t, x: compute_interference_density(x, t, packets),
+        t_range=(0.0, T_MAX),
+        x_range=(-X_MAX, X_MAX),
+        cache_bytes=TILE_CACHE_BYTES,
+    )
+
+
+def _render_view(
+    separation: float,
+    k0: float,
+    phase: float,
+    t_view: tuple[float, float],
+    x_view: tuple[float, float],
+) -> tuple[dict, float]:
+    """取出覆盖视图的瓦片，返回 render_view 的结果与耗时"""
+    start = time.perf_counter()
+    view = _get_pyramid(separation, k0, phase).render_view(t_view, x_view, NUM_T, NUM_X)
+    return view, time.perf_counter() - start
+
+
+def warmup(separation: float, k0: float, phase: float) -> None:
+    """预计算一组波包参数下整张时空干涉图的瓦片"""
+    _render_view(separation, k0, phase, (0.0, T_MAX), (-X_MAX, X_MAX))
+
+
+def show():
+    """渲染双波包干涉演示页面"""
+
+    # --- Sidebar: 控制面板 ---
+    st.sidebar.subheader("⚙️ 波包参数")
+    st.sidebar.info("$\\sigma=1$, $m=1$, $\\hbar=1$")
+
+    separation = st.sidebar.slider(
+        "初始间距 d",
+        min_value=2.0,
+        max_value=16.0,
+        value=8.0,
+        step=0.5,
+        help="两个波包初始中心之间的距离",
+    )
+
+    k0 = st.sidebar.slider(
+        "相向波数 k₀",
+        min_value=0.0,
+        max_value=3.0,
+        value=0.0,
+        step=0.25,
+        help="左侧波包波数为 +k₀，右侧为 -k₀；k₀ = 0 时两个波包静止，只靠展宽重叠",
+    )
+
+    phase = st.sidebar.slider(
+        "相对相位 φ / π",
+        min_value=0.0,
+        max_value=2.0,
+        value=0.0,
+        step=0.25,
+        help="右侧波包的复振幅为 e^{iφ}；φ = π 时中心处为暗纹",
+    ) * np.pi
+
+    st.sidebar.markdown("---")
+
+    t_slice = st.sidebar.slider(
+        "观察时刻 t",
+        min_value=0.0,
+        max_value=T_MAX,
+        value=T_MAX / 2,
+        step=0.1,
+    )
+
+    st.sidebar.subheader("🔍 视图")
+
+    x_width = st.sidebar.select_slider(
+        "视图宽度 Δx",
+        options=VIEW_WIDTHS,
+        value=VIEW_WIDTHS[0],
+        help="缩小视图宽度即放大，瓦片按视图的分辨率取用，只计算视野内新出现的瓦片",
+    )
+
+    x_center = st.sidebar.slider(
+        "视图中心 x",
+        min_value=-X_MAX,
+        max_value=X_MAX,
+        value=0.0,
+        step=0.25,
+        disabled=x_width >= 2 * X_MAX,
+    )
+
+    t_view = st.sidebar.slider(
+        "时间窗口",
+        min_value=0.0,
+        max_value=T_MAX,
+        value=(0.0, T_MAX),
+        step=0.1,
+    )
+
+    x_center = float(np.clip(x_center, -X_MAX + x_width / 2, X_MAX - x_width / 2))
+    x_view = (x_center - x_width / 2, x_center + x_width / 2)
+    if t_view[1] <= t_view[0]:
+        t_view = (t_view[0], t_view[0] + 0.1)
+
+    # --- Main Area: 可视化 ---
+    st.title(get_name())
+    st.markdown("""
+这是一个**两个高斯波包相干叠加**的交互演示。两个波包随时间展宽并相互重叠，
+在重叠区域形成干涉条纹——这正是双缝实验中条纹的来源。
+
+> 💡 **物理原理**：叠加的是复振幅而不是概率。
+> 两个波包的相位差随位置线性变化，概率密度 |ψ₁ + ψ₂|² 中出现余弦形的干涉项。
+""")
+
+    view, elapsed = _render_view(separation, k0, phase, t_view, x_view)
+
+    st.divider()
+    st.subheader("🗺️ 时空干涉图 $|\\Psi(x,t)|^2$")
+
+    fig_map = go.Figure(go.Heatmap(
+        x=view["x"],
+        y=view["t"],
+        z=view["values"],
+        colorscale="Viridis",
+        showscale=False,
+        hovertemplate="x: %{x:.2f}<br>t: %{y:.2f}<br>|Ψ|²: %{z:.4f}<extra></extra>",
+    ))
+    if t_view[0] <= t_slice <= t_view[1]:
+        fig_map.add_hline(y=t_slice, line=dict(color="white", width=1, dash="dash"))
+    fig_map.update_layout(
+        xaxis_title="位置 x",
+        yaxis_title="时间 t",
+        xaxis_range=x_view,
+        yaxis_range=t_view,
+        margin=dict(l=60, r=20, t=40, b=60),
+        height=450,
+        template="plotly_white",
+    )
+
+    st.plotly_chart(fig_map, use_container_width=True)
+
+    level_t, level_x = view["levels"]
+    cache = _get_pyramid(separation, k0, phase).metrics()
+    st.caption(
+        f"瓦片级别 (t, x) = ({level_t}, {level_x})，"
+        f"图像 {view['values'].shape[0]} × {view['values'].shape[1]}；"
+        f"瓦片缓存 {cache['tiles']} 块 / {cache['bytes'] / 2**20:.1f} MB，"
+        f"命中 {cache['hits']}，淘汰 {cache['evictions']}"
+    )
+
+    st.subheader(f"📊 t = {t_slice:.1f} 时的概率密度")
+
+    x = np.linspace(*x_view, NUM_X)
+    packets = _packets(separation, k0, phase)
+    coherent = compute_interference_density(x, t_slice, packets)[0]
+    incoherent = sum(
+        abs(p.get("weight", 1.0)) ** 2
+        * compute_probability_density(x, t_slice, x0=p["x0"], k0=p["k0"])
+        for p in packets
+    )
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=coherent,
+        mode="lines",
+        line=dict(color="#1f77b4", width=2),
+        name="相干叠加 |ψ₁ + ψ₂|²",
+        hovertemplate="x: %{x:.2f}<br>|Ψ|²: %{y:.4f}<extra></extra>",
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=x,
+        y=incoherent,
+        mode="lines",
+        line=dict(color="gray", width=1.5, dash="dash"),
+        name="非相干叠加 |ψ₁|² + |ψ₂|²",
+        hovertemplate="x: %{x:.2f}<br>ρ: %{y:.4f}<extra></extra>",
+    ))
+
+    fig.update_layout(
+        xaxis_title="位置 x",
+        yaxis_title="概率密度",
+        hovermode="x unified",
+        margin=dict(l=60, r=20, t=40, b=60),
+        height=400,
+        template="plotly_white",
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="right",
+            x=0.99,
+        ),
+        xaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor="rgba(128, 128, 128, 0.2)",
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor="rgba(128, 128, 128, 0.2)",
+        ),
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        spacing = fringe_spacing(t_slice, separation, delta_k=-2 * k0)
+        st.metric("条纹间距 2π/Δk", f"{spacing:.2f}" if np.isfinite(spacing) else "∞")
+
+    with col2:
+        st.metric(
+            "瓦片 / 新计算",
+            f"{view['tiles']} / {view['computed']}",
+            help="视图用到的瓦片数，以及其中本次新计算的瓦片数（其余来自缓存）",
+        )
+
+    with col3:
+        st.metric("计算耗时", f"{elapsed * 1000:.0f} ms")
+
+    # --- Main Area: 物理解释 ---
+    st.divider()
+    st.header("📖 物理原理")
+
+    st.markdown(r"""
+**叠加态**：
+
+$$\Psi(x, t) = \psi_1(x, t) + e^{i\varphi}\,\psi_2(x, t)$$
+
+**概率密度**：
+
+$$|\Psi|^2 = |\psi_1|^2 + |\psi_2|^2 + 2|\psi_1||\psi_2|\cos(\theta_1 - \theta_2 - \varphi)$$
+
+最后一项就是干涉项。两个静止波包（$k_0 = 0$）的相位差随位置线性变化，斜率为
+
+$$\Delta k(t) = \frac{d\,\tau}{2\sigma^2(1 + \tau^2)}, \qquad \tau = \frac{\hbar t}{2m\sigma^2}$$
+
+因此条纹间距为 $2\pi/\Delta k$。当 $t \to \infty$ 时趋于
+
+$$\Delta x \approx \frac{2\pi\hbar t}{m d} = \frac{\lambda_{\text{dB}} L}{d}$$
+
+与双缝干涉的条纹间距公式形式完全相同：波包的传播时间对应屏幕距离，初始间距对应双缝间距。
+""")
+
+    st.header("🔬 深入理解")
+
+    st.markdown("""
+### 相干与非相干
+
+虚线是两个概率密度的简单相加，相当于"知道粒子来自哪个波包"的情况。
+一旦能够区分路径，干涉项就消失了——这正是双缝实验中测量破坏干涉的原因。
+
+### 计算方法
+
+每个解析波包的指数可以拆成只依赖时间的因子与只依赖位置的因子，
+共享的部分只计算一次，每块瓦片在一次分块广播中完成。
+
+时空干涉图按多分辨率瓦片组织：时间、空间两个方向各自按视图的像素数选择级别，
+只计算与视图相交、尚未缓存的瓦片。平移与缩放时大部分瓦片来自缓存，
+传给浏览器的图像大小只取决于像素数，与放大倍数无关。
+""")
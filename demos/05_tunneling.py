@@ -0,0 +1,262 @@
+"""
+量子隧穿 - 交互演示模块
+
+选择势垒形状，观察粒子的透射系数与反射系数如何随能量变化。
+"""
+
+import time
+
+import numpy as np
+import streamlit as st
+import plotly.graph_objects as go
+from core.tunneling import discretize_potential, transmission_spectrum
+
+# 能谱的采样点数
+NUM_ENERGIES = 4000
+
+# 光滑势垒的离散层数
+NUM_LAYERS = 1000
+
+
+def _rectangular(height: float, width: float) -> tuple[np.ndarray, np.ndarray]:
+    """单个方势垒"""
+    return np.array([height]), np.array([width])
+
+
+def _double_barrier(height: float, width: float) -> tuple[np.ndarray, np.ndarray]:
+    """两个方势垒夹一个势阱，势阱宽度为势垒宽度的 3 倍"""
+    return np.array([height, 0.0, height]), np.array([width, 3 * width, width])
+
+
+def _gaussian(height: float, width: float) -> tuple[np.ndarray, np.ndarray]:
+    """高斯形势垒，离散为 NUM_LAYERS 个薄层"""
+    return discretize_potential(
+        lambda x: height * np.exp(-x**2 / (2 * (width / 2) ** 2)),
+        -3 * width,
+        3 * width,
+        NUM_LAYERS,
+    )
+
+
+def _superlattice(height: float, width: float) -> tuple[np.ndarray, np.ndarray]:
+    """10 个周期的势垒-势阱超晶格"""
+    return np.tile([height, 0.0], 10), np.tile([width, 2 * width], 10)
+
+
+# 势垒名称 -> 构造函数 (height, width) -> (各层势能, 各层宽度)
+BARRIERS = {
+    "方势垒": _rectangular,
+    "双势垒（共振隧穿）": _double_barrier,
+    "高斯势垒": _gaussian,
+    "超晶格": _superlattice,
+}
+
+# 预热参数点：各势垒在默认设置下的透射谱
+WARMUP_POINTS = [
+    dict(barrier_name=name, height=1.0, width=1.0, e_max=3.0)
+    for name in BARRIERS
+]
+WARMUP_BUDGET = 10.0
+
+
+def get_name() -> str:
+    """返回 demo 的中文名称（含 emoji）"""
+    return "🚧 量子隧穿"
+
+
+@st.cache_data(show_spinner=False)
+def _compute_spectrum(
+    barrier_name: str,
+    height: float,
+    width: float,
+    e_max: float,
+) -> tuple[np.ndarray, np.ndarray, dict[str, np.ndarray], float]:
+    """按 (势垒, 能量范围) 缓存的透射谱"""
+    potential, widths = BARRIERS[barrier_name](height, width)
+    energies = np.linspace(e_max / NUM_ENERGIES, e_max, NUM_ENERGIES)
+
+    start = time.perf_counter()
+    spectrum = transmission_spectrum(energies, potential, widths)
+    elapsed = time.perf_counter() - start
+
+    return potential, widths, spectrum, elapsed
+
+
+def warmup(barrier_name: str, height: float, width: float, e_max: float) -> None:
+    """预计算一个势垒的透射谱"""
+    _compute_spectrum(barrier_name, height, width, e_max)
+
+
+def show():
+    """渲染量子隧穿演示页面"""
+
+    # --- Sidebar: 控制面板 ---
+    st.sidebar.subheader("⚙️ 势垒设置")
+    st.sidebar.info("$m=1$, $\\hbar=1$")
+
+    barrier_name = st.sidebar.selectbox("势垒形状", list(BARRIERS.keys()))
+
+    height = st.sidebar.slider(
+        "势垒高度 V₀",
+        min_value=0.2,
+        max_value=5.0,
+        value=1.0,
+        step=0.1,
+    )
+
+    width = st.sidebar.slider(
+        "势垒宽度 a",
+        min_value=0.2,
+        max_value=5.0,
+        value=1.0,
+        step=0.1,
+    )
+
+    e_max = st.sidebar.slider(
+        "能量上限 E_max",
+        min_value=0.5,
+        max_value=10.0,
+        value=3.0,
+        step=0.5,
+        help="只改变能量范围时，与能量无关的层预处理会被复用",
+    )
+
+    # --- Main Area: 可视化 ---
+    st.title(get_name())
+    st.markdown("""
+这是一个**量子隧穿**的交互演示。经典粒子无法越过比自身能量更高的势垒，
+量子粒子却有一定概率穿过去，而且能量高于势垒时也可能被反射。
+
+> 💡 **物理原理**：波函数在势垒内部以指数形式衰减而不是突然消失，
+> 只要势垒不太厚，势垒另一侧就会留下非零的振幅。
+""")
+
+    potential, widths, spectrum, elapsed = _compute_spectrum(barrier_name, height, width, e_max)
+
+    st.divider()
+    st.subheader("📊 透射谱与反射谱")
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=spectrum["energy"],
+        y=spectrum["transmission"],
+        mode="lines",
+        line=dict(color="#1f77b4", width=2),
+        name="透射系数 T",
+        hovertemplate="E: %{x:.3f}<br>T: %{y:.4f}<extra></extra>",
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=spectrum["energy"],
+        y=spectrum["reflection"],
+        mode="lines",
+        line=dict(color="#d62728", width=1.5, dash="dash"),
+        name="反射系数 R",
+        hovertemplate="E: %{x:.3f}<br>R: %{y:.4f}<extra></extra>",
+    ))
+
+    fig.add_vline(x=height, line=dict(color="gray", width=1, dash="dot"))
+
+    fig.update_layout(
+        xaxis_title="能量 E",
+        yaxis_title="系数",
+        yaxis_range=[0, 1.05],
+        hovermode="x unified",
+        margin=dict(l=60, r=20, t=40, b=60),
+        height=450,
+        template="plotly_white",
+        legend=dict(
+            yanchor="middle",
+            y=0.5,
+            xanchor="right",
+            x=0.99,
+        ),
+        xaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor="rgba(128, 128, 128, 0.2)",
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridwidth=1,
+            gridcolor="rgba(128, 128, 128, 0.2)",
+        ),
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # 势能剖面（阶梯图）
+    edges = np.concatenate([[0.0], np.cumsum(widths)])
+    edges -= edges[-1] / 2
+    margin = 0.2 * (edges[-1] - edges[0])
+    profile_x = np.concatenate([[edges[0] - margin], np.repeat(edges, 2), [edges[-1] + margin]])
+    profile_v = np.concatenate([[0.0, 0.0], np.repeat(potential, 2), [0.0, 0.0]])
+
+    fig_v = go.Figure(go.Scatter(
+        x=profile_x,
+        y=profile_v,
+        mode="lines",
+        line=dict(color="black", width=2),
+        fill="tozeroy",
+        fillcolor="rgba(128, 128, 128, 0.2)",
+        hovertemplate="x: %{x:.2f}<br>V: %{y:.3f}<extra></extra>",
+    ))
+    fig_v.update_layout(
+        title="势能剖面 V(x)",
+        xaxis_title="位置 x",
+        yaxis_title="V",
+        margin=dict(l=60, r=20, t=40, b=60),
+        height=250,
+        template="plotly_white",
+    )
+
+    st.plotly_chart(fig_v, use_container_width=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if height / 2 <= e_max:
+            t_half = np.interp(height / 2, spectrum["energy"], spectrum["transmission"])
+            st.metric("E = V₀/2 处的透射", f"{t_half:.2e}")
+        else:
+            st.metric("E = V₀/2 处的透射", "—")
+
+    with col2:
+        st.metric("层数 × 能量点数", f"{len(potential)} × {NUM_ENERGIES:,}")
+
+    with col3:
+        st.metric("计算耗时", f"{elapsed * 1000:.0f} ms")
+
+    # --- Main Area: 物理解释 ---
+    st.divider()
+    st.header("📖 物理原理")
+
+    st.markdown(r"""
+**方势垒的透射系数**（$E < V_0$）：
+
+$$T = \left[1 + \frac{V_0^2 \sinh^2(\kappa a)}{4E(V_0 - E)}\right]^{-1}, \qquad \kappa = \frac{\sqrt{2m(V_0 - E)}}{\hbar}$$
+
+势垒较厚时 $T \approx e^{-2\kappa a}$，随宽度指数衰减。
+
+**传递矩阵法**：把势能看作许多常数层，每层内波函数与其导数 $(\psi, \psi')$
+的变化由一个 $2\times2$ 矩阵描述，整个势垒的效果就是这些矩阵的乘积。
+任意形状的势垒都可以用足够多的薄层逼近。
+
+**共振隧穿**：双势垒中间的势阱存在准束缚态，
+入射能量与之重合时透射系数接近 1，即使单个势垒的透射很小。
+""")
+
+    st.header("🔬 深入理解")
+
+    st.markdown("""
+### 能量高于势垒时的反射
+
+经典粒子只要能量高于势垒就一定通过；量子粒子在势能突变处仍会部分反射，
+透射谱在 $E > V_0$ 时出现振荡，势垒宽度恰为半波长整数倍时 $T = 1$。
+
+### 超晶格与能带
+
+周期排列的势垒让透射谱出现一组组几乎完全透射的"通带"和几乎完全反射的"禁带"，
+这就是晶体中电子能带结构的一维模型。
+""")
@@ -6,27 +6,48 @@ Demos package - 量子物理交互演示模块
 1. 文件名以 NN_ 开头（NN 为两位数字，决定顺序）
 2. 暴露 get_name() 函数返回中文名称
 3. 暴露 show() 函数渲染页面
+
+可选的预热钩子（服务启动时在后台执行，使部署后的第一次访问同样命中缓存）：
+4. WARMUP_POINTS: list[dict]，常用参数点，每项对应页面缓存函数的一个缓存键
+5. warmup(**point) 函数，预计算单个参数点（通常直接调用页面使用的缓存函数）
+6. WARMUP_BUDGET: float，预热的时间预算（秒），超出后跳过剩余参数点，
+   默认为 DEFAULT_WARMUP_BUDGET
+
+导入预算：所有 demo 在应用启动时都会被导入，即使用户从不打开它们。
+模块顶层只导入渲染页面必需的轻量依赖；plotly.express、matplotlib 等
+重量级依赖在用到它们的函数内部导入。demos.import_profile 测量每个 demo
+的冷启动导入耗时与内存，可选地声明：
+7. IMPORT_BUDGET_MS / IMPORT_BUDGET_MB: float，覆盖默认的导入预算
 """
 
 import importlib
+import logging
 import re
+import time
 from pathlib import Path
+from types import ModuleType
 from typing import Callable
 
 # Demo 信息类型: (slug, name, show_func)
 DemoInfo = tuple[str, str, Callable[[], None]]
 
+logger = logging.getLogger(__name__)
 
-def discover_demos() -> list[DemoInfo]:
+# 未声明 WARMUP_BUDGET 时的预热时间预算（秒）
+DEFAULT_WARMUP_BUDGET = 30.0
+
+
+def find_demo_files() -> list[tuple[int, str, str]]:
     """
-    自动发现 demos 目录下的所有 demo 模块。
-    
-    返回按文件名数字排序的 demo 列表，每项为 (slug, name, show_func)。
+    列出 demos 目录下文件名满足约定的 demo 文件（不导入）。
+
+    返回按文件名数字排序的 (order, slug, module_name) 列表，
+    module_name 形如 "01_double_slit"。
     """
     demos_dir = Path(__file__).parent
     demo_pattern = re.compile(r"^(\d+)_(.+)\.py$")
     
-    demos: list[tuple[int, str, str, Callable[[], None]]] = []
+    files: list[tuple[int, str, str]] = []
     
     for file in demos_dir.iterdir():
         if not file.is_file():
@@ -36,27 +57,43 @@ def discover_demos() -> list[DemoInfo]:
         if not match:
             continue
         
-        order = int(match.group(1))
-        slug = match.group(2)
-        module_name = file.stem  # e.g., "01_double_slit"
-        
+        files.append((int(match.group(1)), match.group(2), file.stem))
+    
+    return sorted(files)
+
+
+def _load_demo_modules() -> list[tuple[str, ModuleType]]:
+    """
+    导入 demos 目录下所有满足约定的 demo 模块。
+
+    返回按文件名数字排序的 (slug, module) 列表。
+    """
+    modules: list[tuple[int, str, ModuleType]] = []
+    
+    for order, slug, module_name in find_demo_files():
         try:
             module = importlib.import_module(f"demos.{module_name}")
             
             if not hasattr(module, "get_name") or not hasattr(module, "show"):
                 continue
             
-            name = module.get_name()
-            show_func = module.show
-            demos.append((order, slug, name, show_func))
+            modules.append((order, slug, module))
         except Exception:
             continue
     
     # 按数字排序
-    demos.sort(key=lambda x: x[0])
+    modules.sort(key=lambda x: x[0])
     
-    # 返回 (slug, name, show_func)
-    return [(slug, name, show_func) for _, slug, name, show_func in demos]
+    return [(slug, module) for _, slug, module in modules]
+
+
+def discover_demos() -> list[DemoInfo]:
+    """
+    自动发现 demos 目录下的所有 demo 模块。
+    
+    返回按文件名数字排序的 demo 列表，每项为 (slug, name, show_func)。
+    """
+    return [(slug, module.get_name(), module.show) for slug, module in _load_demo_modules()]
 
 
 def build_registry() -> dict[str, tuple[str, Callable[[], None]]]:
@@ -67,3 +104,64 @@ def build_registry() -> dict[str, tuple[str, Callable[[], None]]]:
     """
     demos = discover_demos()
     return {slug: (name, show_func) for slug, name, show_func in demos}
+
+
+def run_warmups(reports: dict[str, dict] | None = None) -> dict[str, dict]:
+    """
+    依次执行所有 demo 的预热钩子。
+
+    每个 demo 按 WARMUP_POINTS 的顺序预计算，累计耗时超过 WARMUP_BUDGET
+    后跳过剩余参数点；单个参数点出错不会影响其他 demo。
+
+    参数:
+        reports: 写入结果的字典，传入共享字典可在执行过程中读取进度
+
+    返回: {slug: {"status", "completed", "total", "elapsed", "budget", "error"}, ...}
+    """
+    if reports is None:
+        reports = {}
+
+    for slug, module in _load_demo_modules():
+        if not hasattr(module, "warmup"):
+            continue
+
+        points = getattr(module, "WARMUP_POINTS", [{}])
+        budget = getattr(module, "WARMUP_BUDGET", DEFAULT_WARMUP_BUDGET)
+        report = {
+            "status": "running",
+            "completed": 0,
+            "total": len(points),
+            "elapsed": 0.0,
+            "budget": budget,
+            "error": None,
+        }
+        reports[slug] = report
+
+        start = time.perf_counter()
+        for point in points:
+            if time.perf_counter() - start > budget:
+                break
+            try:
+                module.warmup(**point)
+            except Exception as exc:
+                report["error"] = f"{type(exc).__name__}: {exc}"
+                break
+            report["completed"] += 1
+            report["elapsed"] = time.perf_counter() - start
+
+        report["elapsed"] = time.perf_counter() - start
+        if report["error"]:
+            report["status"] = "failed"
+        elif report["completed"] < report["total"]:
+            report["status"] = "over_budget"
+        else:
+            report["status"] = "done"
+
+        logger.log(
+            logging.INFO if report["status"] == "done" else logging.WARNING,
+            "Warmup %s: %s, %d/%d points, %.2f s%s",
+            slug, report["status"], report["completed"], report["total"], report["elapsed"],
+            f" ({report['error']})" if report["error"] else "",
+        )
+
+    return reports
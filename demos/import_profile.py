@@ -0,0 +1,168 @@
+"""
+Demo 导入预算 - 测量每个 demo 的冷启动导入耗时与内存
+
+应用启动时会导入全部 demo（用于构建侧边栏菜单），因此每个 demo 模块
+顶层的导入都会直接计入服务冷启动与新会话的延迟。这里在独立的子进程中
+分别导入每个 demo，测量它在应用外壳（streamlit 与 demos 包）之上
+额外增加的导入耗时与常驻内存（RSS），并与预算比较。
+
+预算默认为 DEFAULT_IMPORT_BUDGET_MS / DEFAULT_IMPORT_BUDGET_MB，
+demo 可以用模块级的 IMPORT_BUDGET_MS / IMPORT_BUDGET_MB 覆盖；
+全部 demo 一起导入时的合计另受 TOTAL_IMPORT_BUDGET_MS / TOTAL_IMPORT_BUDGET_MB 约束。
+耗时取多次冷启动中的最小值，以减少机器负载带来的波动。
+
+耗时与内存受机器负载影响，不适合作为常规测试的断言；确定性的检查是
+导入 demo 之后 HEAVY_MODULES 中的重型库都不在 sys.modules 中
+（这些库只能在用到它们的函数内部延迟导入）。
+
+用法：
+    python -m demos.import_profile            # 打印每个 demo 的导入耗时、内存与导入的重型库
+    python -m demos.import_profile --check    # 导入了重型库或超出预算时以非零状态退出
+
+tests/test_import_profile.py 在全新的解释器中逐个导入 demo 并检查重型库；
+预算检查标记为 slow，默认不运行（python -m pytest -m slow 时运行）。
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# 单个 demo 的默认导入预算
+DEFAULT_IMPORT_BUDGET_MS = 100.0
+DEFAULT_IMPORT_BUDGET_MB = 20.0
+
+# 全部 demo 合计的导入预算
+TOTAL_IMPORT_BUDGET_MS = 150.0
+TOTAL_IMPORT_BUDGET_MB = 30.0
+
+# demo 模块顶层不允许导入的重型库（应用外壳 streamlit 本身不会导入它们）
+HEAVY_MODULES = ("plotly.express", "pandas", "pyarrow", "matplotlib", "altair", "scipy")
+
+# 子进程中表示"导入全部 demo"的名称
+ALL_DEMOS = "all"
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _rss_bytes() -> int:
+    """当前进程的常驻内存（字节）；无法获取时返回 0"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    # 峰值 RSS：Linux 以 KB 为单位，macOS 以字节为单位
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _measure_in_child(module_name: str) -> dict:
+    """（在子进程中运行）在应用外壳之上导入 demo，返回耗时、内存、预算与导入的重型库"""
+    import streamlit  # noqa: F401  应用外壳，所有 demo 共用
+    import demos
+
+    rss = _rss_bytes()
+    start = time.perf_counter()
+
+    if module_name == ALL_DEMOS:
+        demos.discover_demos()
+        budget_ms, budget_mb = TOTAL_IMPORT_BUDGET_MS, TOTAL_IMPORT_BUDGET_MB
+    else:
+        module = importlib.import_module(f"demos.{module_name}")
+        budget_ms = getattr(module, "IMPORT_BUDGET_MS", DEFAULT_IMPORT_BUDGET_MS)
+        budget_mb = getattr(module, "IMPORT_BUDGET_MB", DEFAULT_IMPORT_BUDGET_MB)
+
+    return {
+        "ms": (time.perf_counter() - start) * 1000,
+        "mb": (_rss_bytes() - rss) / 2**20,
+        "budget_ms": budget_ms,
+        "budget_mb": budget_mb,
+        "heavy": [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+
+
+def profile_import(module_name: str, repeat: int = 3) -> dict:
+    """
+    在全新的子进程中导入 demo 模块 repeat 次，取耗时最小的一次
+
+    参数:
+        module_name: demo 模块名（如 "01_double_slit"），或 ALL_DEMOS
+        repeat: 冷启动次数
+
+    返回:
+        {"ms", "mb", "budget_ms", "budget_mb", "heavy", "ok"} 字典；
+        heavy 为导入后出现在 sys.modules 中的重型库，
+        ok 表示没有导入重型库且耗时与内存都在预算之内
+    """
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-m", "demos.import_profile", "--child", module_name],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+
+    result = min(runs, key=lambda run: run["ms"])
+    result["ok"] = (
+        not result["heavy"]
+        and result["ms"] <= result["budget_ms"]
+        and result["mb"] <= result["budget_mb"]
+    )
+
+    return result
+
+
+def profile_demos(repeat: int = 3) -> dict[str, dict]:
+    """
+    测量每个 demo 以及全部 demo 合计的导入耗时与内存
+
+    返回:
+        {module_name: profile_import 的结果}，最后一项为 ALL_DEMOS
+    """
+    from demos import find_demo_files
+
+    names = [module_name for _, _, module_name in find_demo_files()] + [ALL_DEMOS]
+    return {name: profile_import(name, repeat) for name in names}
+
+
+def main() -> None:
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="测量各 demo 的冷启动导入耗时与内存")
+    parser.add_argument("--repeat", type=int, default=3, help="每个 demo 的冷启动次数")
+    parser.add_argument("--check", action="store_true", help="导入了重型库或超出预算时以非零状态退出")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_measure_in_child(args.child)))
+        return
+
+    profiles = profile_demos(args.repeat)
+    for name, p in profiles.items():
+        mark = "✅" if p["ok"] else "❌"
+        print(
+            f"{mark} {name:<32} {p['ms']:7.1f} ms / {p['budget_ms']:.0f} ms"
+            f"  {p['mb']:6.1f} MB / {p['budget_mb']:.0f} MB"
+            + (f"  重型库: {', '.join(p['heavy'])}" if p["heavy"] else "")
+        )
+
+    if args.check and not all(p["ok"] for p in profiles.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+响应式计算图 - 让 demo 只重算受输入变化影响的部分
+
+Streamlit 在任何控件变化时都会重新执行整个 show()。
+计算图把页面拆成若干节点，每个节点声明自己依赖的输入（控件值或其他节点），
+并记住上次的输出与各依赖的版本号；只有上游版本变化时才重新求值。
+纯视图设置（坐标轴范围、图例等）不作为计算节点的输入，
+改变它们时所有节点都直接返回记忆的结果。
+
+计算图按会话保存在 st.session_state 中，用 get_graph 获取；
+describe() 列出每个节点的依赖、版本、求值次数与耗时，便于调试。
+
+用法：
+    def build(graph):
+        graph.add_node("densities", compute_densities, inputs=["t_values"])
+        graph.add_node("figure", make_figure, inputs=["densities", "t_values"])
+
+    graph = get_graph("gaussian_wavepacket", build)
+    graph.set_inputs(t_values=(0, 1, 2))
+    fig = graph.get("figure")
+"""
+
+import time
+from typing import Any, Callable
+
+import numpy as np
+import streamlit as st
+
+
+def _same(a: Any, b: Any) -> bool:
+    """判断两个输入值是否相同（NumPy 数组按元素比较）"""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return isinstance(a, np.ndarray) and isinstance(b, np.ndarray) and np.array_equal(a, b)
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+class ReactiveGraph:
+    """
+    记忆化的依赖图
+
+    输入（set_inputs 设置的值）与节点（add_node 注册的函数）共用一个命名空间。
+    节点的依赖如果不是已注册的节点，就视为输入；节点不能与已有名字重名，
+    因此只能依赖先注册的节点，图总是无环的。
+
+    参数:
+        name: 图的名称，用于调试输出
+    """
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._inputs: dict[str, dict[str, Any]] = {}
+        self._nodes: dict[str, dict[str, Any]] = {}
+
+    def add_node(self, name: str, func: Callable[..., Any], inputs: list[str]) -> None:
+        """
+        注册计算节点
+
+        参数:
+            name: 节点名称
+            func: 计算函数，按 inputs 的顺序接收各依赖的当前值
+            inputs: 依赖的输入或节点名称；输入可以在之后才第一次 set_inputs
+        """
+        if name in self._nodes or name in self._inputs:
+            raise ValueError(f"名称 {name!r} 已存在")
+
+        for dependency in inputs:
+            if dependency not in self._nodes:
+                self._inputs.setdefault(dependency, {"value": None, "version": 0})
+
+        self._nodes[name] = {
+            "func": func,
+            "inputs": list(inputs),
+            "value": None,
+            "version": 0,
+            "seen": None,
+            "evaluations": 0,
+            "elapsed": 0.0,
+        }
+
+    def set_inputs(self, **values: Any) -> None:
+        """设置输入值；与上次相同的值不会使下游失效"""
+        for name, value in values.items():
+            if name in self._nodes:
+                raise ValueError(f"{name!r} 是计算节点，不能直接设置")
+
+            entry = self._inputs.setdefault(name, {"value": None, "version": 0})
+            if entry["version"] == 0 or not _same(entry["value"], value):
+                entry["value"] = value
+                entry["version"] += 1
+
+    def get(self, name: str) -> Any:
+        """返回输入或节点的当前值，必要时先重算过期的上游节点"""
+        if name in self._inputs:
+            return self._inputs[name]["value"]
+
+        self._refresh(name)
+        return self._nodes[name]["value"]
+
+    def _refresh(self, name: str) -> int:
+        """确保名称 name 的值是最新的，返回其版本号"""
+        if name in self._inputs:
+            return self._inputs[name]["version"]
+
+        node = self._nodes[name]
+        versions = tuple(self._refresh(dependency) for dependency in node["inputs"])
+
+        if node["seen"] != versions:
+            args = [self.get(dependency) for dependency in node["inputs"]]
+            start = time.perf_counter()
+            node["value"] = node["func"](*args)
+            node["elapsed"] = time.perf_counter() - start
+            node["evaluations"] += 1
+            node["version"] += 1
+            node["seen"] = versions
+
+        return node["version"]
+
+    def describe(self) -> list[dict[str, Any]]:
+        """
+        列出图中每个输入与节点的状态
+
+        返回:
+            字典列表，每项含 "name"、"kind"（input/node）、"inputs"、"version"、
+            "evaluations"、"elapsed_ms"、"stale"（上游已变化但尚未重算）
+        """
+        rows = [
+            {
+                "name": name,
+                "kind": "input",
+                "inputs": "",
+                "version": entry["version"],
+                "evaluations": 0,
+                "elapsed_ms": 0.0,
+                "stale": False,
+            }
+            for name, entry in self._inputs.items()
+        ]
+
+        for name, node in self._nodes.items():
+            rows.append({
+                "name": name,
+                "kind": "node",
+                "inputs": ", ".join(node["inputs"]),
+                "version": node["version"],
+                "evaluations": node["evaluations"],
+                "elapsed_ms": round(node["elapsed"] * 1000, 2),
+                "stale": self._is_stale(name),
+            })
+
+        return rows
+
+    def _is_stale(self, name: str) -> bool:
+        """节点的上游（直接或间接）是否有尚未传播的变化"""
+        if name in self._inputs:
+            return False
+
+        node = self._nodes[name]
+        if node["seen"] is None:
+            return True
+
+        current = tuple(
+            self._inputs[d]["version"] if d in self._inputs else self._nodes[d]["version"]
+            for d in node["inputs"]
+        )
+        return current != node["seen"] or any(self._is_stale(d) for d in node["inputs"])
+
+
+def get_graph(key: str, build: Callable[[ReactiveGraph], None]) -> ReactiveGraph:
+    """
+    获取当前会话中名为 key 的计算图，不存在时用 build(graph) 构建
+
+    计算图保存在 st.session_state["reactive_graphs"] 中，每个会话各自记忆。
+    """
+    graphs = st.session_state.setdefault("reactive_graphs", {})
+    if key not in graphs:
+        graph = ReactiveGraph(key)
+        build(graph)
+        graphs[key] = graph
+
+    return graphs[key]
+
+
+def list_graphs() -> dict[str, ReactiveGraph]:
+    """返回当前会话中已构建的全部计算图"""
+    return dict(st.session_state.get("reactive_graphs", {}))
@@ -0,0 +1,231 @@
+"""
+会话级结果存储 - 为每个浏览器会话缓存大型 NumPy 结果
+
+st.cache_data 在所有会话之间共享，适合参数空间固定的结果；
+只对某个用户有意义的结果（自定义时间点、高分辨率的渐进计算等）
+如果直接放进 st.session_state，空闲的标签页会无限期地占用内存。
+
+这里的存储按会话划分，并同时受两个字节预算约束：
+- 单个会话超出预算时，淘汰该会话中最久未使用的结果（LRU）
+- 所有会话合计超出全局预算时，淘汰全局最久未使用的结果
+- 超过空闲时限未访问的会话整体释放
+被淘汰的结果在下次访问时 get 返回 None，由调用方重新计算（通常是渐进计算）后 put。
+
+预算可通过环境变量 QR_SESSION_BUDGET_MB、QR_GLOBAL_BUDGET_MB、
+QR_SESSION_IDLE_SECONDS 设置默认值；无效的值会给出警告并使用内置默认值。
+"""
+
+import os
+import sys
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+import numpy as np
+
+
+def _env_positive_float(name: str, default: float) -> float:
+    """读取正数环境变量；未设置时返回 default，无效时警告并返回 default"""
+    value = os.environ.get(name, "").strip()
+    if value:
+        try:
+            number = float(value)
+        except ValueError:
+            number = 0.0
+        if number > 0 and np.isfinite(number):
+            return number
+        warnings.warn(f"忽略无效的 {name}={value!r}，使用默认值 {default:g}", RuntimeWarning)
+    return default
+
+
+# 每个会话的默认字节预算
+DEFAULT_SESSION_BUDGET = int(_env_positive_float("QR_SESSION_BUDGET_MB", 64) * 2**20)
+
+# 所有会话合计的默认字节预算
+DEFAULT_GLOBAL_BUDGET = int(_env_positive_float("QR_GLOBAL_BUDGET_MB", 1024) * 2**20)
+
+# 会话空闲多久（秒）后整体释放
+DEFAULT_IDLE_TIMEOUT = _env_positive_float("QR_SESSION_IDLE_SECONDS", 600)
+
+# 没有 Streamlit 会话上下文时（后台线程、脚本）使用的会话 ID
+DEFAULT_SESSION_ID = "default"
+
+
+def estimate_nbytes(value: Any) -> int:
+    """估算结果占用的字节数：NumPy 数组按 nbytes，容器递归累加"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def current_session_id() -> str:
+    """当前 Streamlit 会话的 ID；不在会话中运行时返回 DEFAULT_SESSION_ID"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else DEFAULT_SESSION_ID
+
+
+class SessionStore:
+    """
+    带字节预算的会话级 LRU 存储（线程安全）
+
+    参数:
+        session_budget: 每个会话的字节预算
+        global_budget: 所有会话合计的字节预算
+        idle_timeout: 会话空闲多少秒后整体释放
+        clock: 返回当前时间（秒）的函数，默认 time.monotonic
+    """
+
+    def __init__(
+        self,
+        session_budget: int = DEFAULT_SESSION_BUDGET,
+        global_budget: int = DEFAULT_GLOBAL_BUDGET,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.session_budget = session_budget
+        self.global_budget = global_budget
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # 会话 ID -> OrderedDict[key, (value, nbytes, last_used)]，按访问顺序排列
+        self._sessions: dict[str, OrderedDict] = {}
+        self._session_bytes: dict[str, int] = {}
+        self._last_seen: dict[str, float] = {}
+        self._total_bytes = 0
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "rejected": 0}
+
+    def get(self, key: Hashable, session_id: str | None = None) -> Any | None:
+        """读取结果并标记为最近使用；不存在（或已被淘汰）时返回 None"""
+        session_id = session_id or current_session_id()
+        now = self._clock()
+
+        with self._lock:
+            self._evict_idle(now)
+            self._last_seen[session_id] = now
+            entries = self._sessions.get(session_id)
+            if entries is None or key not in entries:
+                self._counters["misses"] += 1
+                return None
+
+            value, nbytes, _ = entries.pop(key)
+            entries[key] = (value, nbytes, now)
+            self._counters["hits"] += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, session_id: str | None = None) -> bool:
+        """
+        存入结果，必要时按 LRU 淘汰旧结果
+
+        返回:
+            是否存入；单个结果超过会话预算时不会存入
+        """
+        session_id = session_id or current_session_id()
+        nbytes = estimate_nbytes(value)
+        now = self._clock()
+
+        with self._lock:
+            self._evict_idle(now)
+            self._last_seen[session_id] = now
+
+            if nbytes > min(self.session_budget, self.global_budget):
+                self._counters["rejected"] += 1
+                return False
+
+            self._remove(session_id, key)
+            self._sessions.setdefault(session_id, OrderedDict())[key] = (value, nbytes, now)
+            self._session_bytes[session_id] = self._session_bytes.get(session_id, 0) + nbytes
+            self._total_bytes += nbytes
+
+            entries = self._sessions[session_id]
+            while self._session_bytes[session_id] > self.session_budget:
+                self._evict(session_id, next(iter(entries)))
+
+            while self._total_bytes > self.global_budget:
+                # 每个会话的第一项是该会话最久未使用的结果，取其中最旧的
+                oldest = min(
+                    (s for s in self._sessions if self._sessions[s]),
+                    key=lambda s: next(iter(self._sessions[s].values()))[2],
+                )
+                self._evict(oldest, next(iter(self._sessions[oldest])))
+
+            return True
+
+    def clear(self, session_id: str | None = None) -> None:
+        """释放一个会话的全部结果；session_id 为 None 时释放所有会话"""
+        with self._lock:
+            for sid in [session_id] if session_id is not None else list(self._sessions):
+                self._drop_session(sid)
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        返回内存使用情况
+
+        返回:
+            {"total_bytes", "session_budget", "global_budget", "hits", "misses",
+             "evictions", "rejected", "sessions": {会话 ID: {"bytes", "entries", "idle"}}}
+        """
+        now = self._clock()
+
+        with self._lock:
+            self._evict_idle(now)
+            return {
+                "total_bytes": self._total_bytes,
+                "session_budget": self.session_budget,
+                "global_budget": self.global_budget,
+                **self._counters,
+                "sessions": {
+                    sid: {
+                        "bytes": self._session_bytes.get(sid, 0),
+                        "entries": len(self._sessions.get(sid, ())),
+                        "idle": now - last_seen,
+                    }
+                    for sid, last_seen in self._last_seen.items()
+                },
+            }
+
+    def _remove(self, session_id: str, key: Hashable) -> None:
+        """删除一项（不计入淘汰次数）"""
+        entries = self._sessions.get(session_id)
+        if entries is None or key not in entries:
+            return
+
+        _, nbytes, _ = entries.pop(key)
+        self._session_bytes[session_id] -= nbytes
+        self._total_bytes -= nbytes
+
+    def _evict(self, session_id: str, key: Hashable) -> None:
+        """淘汰一项"""
+        self._remove(session_id, key)
+        self._counters["evictions"] += 1
+
+    def _drop_session(self, session_id: str) -> None:
+        """释放整个会话"""
+        for key in list(self._sessions.get(session_id, ())):
+            self._evict(session_id, key)
+        self._sessions.pop(session_id, None)
+        self._session_bytes.pop(session_id, None)
+        self._last_seen.pop(session_id, None)
+
+    def _evict_idle(self, now: float) -> None:
+        """释放空闲超时的会话"""
+        for session_id, last_seen in list(self._last_seen.items()):
+            if now - last_seen > self.idle_timeout:
+                self._drop_session(session_id)
+
+
+# 进程内共享的存储实例
+_store = SessionStore()
+
+
+def get_store() -> SessionStore:
+    """返回进程内共享的会话存储"""
+    return _store
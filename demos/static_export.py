@@ -0,0 +1,300 @@
+"""
+静态导出 - 把 demo 预渲染为无需 Python 的静态 HTML/JS 包
+
+遍历各 demo 已声明的参数空间（双缝干涉的滑块、高斯波包的预设时间点），
+在构建时用 core 中的计算内核预计算全部结果，量化为 uint16 后以 base64
+嵌入页面，参数切换完全在浏览器端完成。
+输出目录可以直接交给任何静态文件服务器托管，每次访问都不需要 Python。
+
+用法：
+    python -m demos.static_export --out dist/static
+
+输出：
+    index.html                 各 demo 的入口
+    plotly.min.js              所有页面共用的 Plotly.js
+    <slug>.html                每个 demo 一个自包含页面
+
+双缝干涉的强度 cos²(πx/Δx) 以条纹间距 Δx = λL/d 为周期，
+因此只需预计算一个周期的高分辨率强度表，
+页面按滑块位置把屏幕坐标折算到周期内查表，即可覆盖全部滑块组合。
+"""
+
+import argparse
+import base64
+import importlib
+import json
+from pathlib import Path
+from string import Template
+from typing import Callable
+
+import numpy as np
+from core.double_slit import double_slit_intensity
+from core.gaussian_wavepacket import compute_wavepacket_evolution
+
+# 双缝干涉单周期强度表的采样点数
+PERIOD_TABLE_SIZE = 4096
+
+UINT16_MAX = np.iinfo(np.uint16).max
+
+
+def _load_demo(module_name: str):
+    """按文件名导入 demo 模块（文件名以数字开头，不能直接 import）"""
+    return importlib.import_module(f"demos.{module_name}")
+
+
+def slider_values(spec: dict) -> list[float]:
+    """列出滑块定义 spec 可取的全部值"""
+    count = int(round((spec["max_value"] - spec["min_value"]) / spec["step"])) + 1
+    values = spec["min_value"] + spec["step"] * np.arange(count)
+    return [round(float(v), 10) for v in values]
+
+
+def _encode_uint16(values: np.ndarray, scale: float | np.ndarray) -> str:
+    """把 [0, scale] 范围的数据量化为小端 uint16，返回 base64 字符串"""
+    quantized = np.round(np.clip(values / scale, 0.0, 1.0) * UINT16_MAX)
+    return base64.b64encode(quantized.astype("<u2").tobytes()).decode("ascii")
+
+
+def _slider_html(name: str, spec: dict) -> str:
+    """生成与 st.slider 对应的 HTML range 控件"""
+    return (
+        f'<label title="{spec.get("help", "")}">{spec["label"]} '
+        f'<output id="{name}-value">{spec["value"]}</output>'
+        f'<input type="range" id="{name}" min="{spec["min_value"]}" '
+        f'max="{spec["max_value"]}" step="{spec["step"]}" value="{spec["value"]}">'
+        f"</label>"
+    )
+
+
+def export_double_slit() -> dict:
+    """预计算双缝干涉页面的数据"""
+    demo = _load_demo("01_double_slit")
+
+    # 条纹间距为 1 时，一个周期对应 x ∈ [0, 1)
+    u = np.arange(PERIOD_TABLE_SIZE) / PERIOD_TABLE_SIZE
+    table = double_slit_intensity(u, wavelength=1.0, slit_distance=1.0, screen_distance=1.0)
+
+    return {
+        "title": demo.get_name(),
+        "controls": "".join(_slider_html(name, spec) for name, spec in demo.SLIDERS.items()),
+        "meta": {
+            "num_points": demo.NUM_POINTS,
+            "sliders": list(demo.SLIDERS.keys()),
+        },
+        "data": _encode_uint16(table, 1.0),
+        "script": DOUBLE_SLIT_SCRIPT,
+    }
+
+
+def export_gaussian_wavepacket() -> dict:
+    """预计算高斯波包页面的全部 (预设, x 轴范围) 组合"""
+    demo = _load_demo("02_gaussian_wavepacket")
+    x_ranges = slider_values(demo.X_RANGE_SLIDER)
+
+    curves = []
+    for t_values in demo.PRESET_OPTIONS.values():
+        for x_range in x_ranges:
+            _, densities = compute_wavepacket_evolution(
+                t_values=sorted(t_values),
+                x_min=-x_range,
+                x_max=x_range,
+                num_points=demo.NUM_POINTS,
+            )
+            curves.extend(densities[t] for t in sorted(t_values))
+
+    curves = np.stack(curves)
+    scales = curves.max(axis=1)
+
+    preset_html = "".join(f"<option>{name}</option>" for name in demo.PRESET_OPTIONS)
+    controls = (
+        f'<label>选择预设<select id="preset">{preset_html}</select></label>'
+        + _slider_html("x_range", demo.X_RANGE_SLIDER)
+    )
+
+    return {
+        "title": demo.get_name(),
+        "controls": controls,
+        "meta": {
+            "num_points": demo.NUM_POINTS,
+            "x_ranges": x_ranges,
+            "presets": [sorted(t) for t in demo.PRESET_OPTIONS.values()],
+            "scales": scales.tolist(),
+        },
+        "data": _encode_uint16(curves, scales[:, np.newaxis]),
+        "script": GAUSSIAN_WAVEPACKET_SCRIPT,
+    }
+
+
+# slug -> 导出函数
+EXPORTERS: dict[str, Callable[[], dict]] = {
+    "double_slit": export_double_slit,
+    "gaussian_wavepacket": export_gaussian_wavepacket,
+}
+
+
+PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+<meta charset="utf-8">
+<title>$title - Quantum Playground</title>
+<script src="plotly.min.js"></script>
+<style>
+body { font-family: sans-serif; margin: 0; display: flex; }
+aside { width: 280px; padding: 16px; background: #f0f2f6; min-height: 100vh; }
+aside label { display: block; margin-bottom: 16px; }
+aside input, aside select { width: 100%; }
+main { flex: 1; padding: 16px 32px; }
+</style>
+</head>
+<body>
+<aside><a href="index.html">← 返回</a><h3>⚙️ 实验参数</h3>$controls</aside>
+<main><h1>$title</h1><div id="chart"></div></main>
+<script id="meta" type="application/json">$meta</script>
+<script id="data" type="application/octet-stream">$data</script>
+<script>
+const META = JSON.parse(document.getElementById("meta").textContent);
+const DATA = (() => {
+  const raw = atob(document.getElementById("data").textContent);
+  const bytes = new Uint8Array(raw.length);
+  for (let i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+  return new Uint16Array(bytes.buffer);
+})();
+const LAYOUT = {
+  hovermode: "x unified",
+  margin: {l: 60, r: 20, t: 40, b: 60},
+};
+function linspace(a, b, n) {
+  const out = new Float64Array(n);
+  for (let i = 0; i < n; i++) out[i] = a + (b - a) * i / (n - 1);
+  return out;
+}
+function bind(render) {
+  document.querySelectorAll("aside input, aside select").forEach(el => {
+    el.addEventListener("input", () => {
+      const label = document.getElementById(el.id + "-value");
+      if (label) label.textContent = el.value;
+      render();
+    });
+  });
+  render();
+}
+$script
+</script>
+</body>
+</html>
+""")
+
+
+DOUBLE_SLIT_SCRIPT = """
+bind(() => {
+  const v = Object.fromEntries(META.sliders.map(k => [k, +document.getElementById(k).value]));
+  const spacing = v.wavelength * v.screen_distance / v.slit_distance;
+  const x = linspace(-v.x_range, v.x_range, META.num_points);
+  const y = new Float64Array(x.length);
+  const size = DATA.length;
+  for (let i = 0; i < x.length; i++) {
+    const u = x[i] / spacing;
+    const pos = (u - Math.floor(u)) * size;
+    const j = Math.floor(pos), f = pos - j;
+    y[i] = (DATA[j % size] * (1 - f) + DATA[(j + 1) % size] * f) / 65535;
+  }
+  Plotly.react("chart", [{
+    x: x, y: y, mode: "lines", name: "光强分布",
+    line: {color: "#1f77b4", width: 1.5},
+    hovertemplate: "位置: %{x:.2f}<br>强度: %{y:.3f}<extra></extra>",
+  }], {...LAYOUT, height: 450, xaxis: {title: "屏幕位置 x"},
+       yaxis: {title: "归一化强度 I", range: [0, 1.05]},
+       title: "条纹间距 Δx = " + spacing.toFixed(2)});
+});
+"""
+
+
+GAUSSIAN_WAVEPACKET_SCRIPT = """
+bind(() => {
+  const preset = document.getElementById("preset").selectedIndex;
+  const xRange = +document.getElementById("x_range").value;
+  const r = META.x_ranges.findIndex(v => Math.abs(v - xRange) < 1e-9);
+  const n = META.num_points;
+  let curve = 0;
+  for (let p = 0; p < preset; p++) curve += META.presets[p].length * META.x_ranges.length;
+  curve += r * META.presets[preset].length;
+  const x = linspace(-xRange, xRange, n);
+  const traces = META.presets[preset].map((t, k) => {
+    const c = curve + k, scale = META.scales[c] / 65535;
+    const y = Array.from(DATA.subarray(c * n, (c + 1) * n), q => q * scale);
+    return {x: x, y: y, mode: "lines", name: "t = " + t, line: {width: 2},
+            hovertemplate: "t=" + t + "<br>x: %{x:.2f}<br>|Ψ|²: %{y:.4f}<extra></extra>"};
+  });
+  Plotly.react("chart", traces, {...LAYOUT, height: 500,
+    xaxis: {title: "位置 x"}, yaxis: {title: "概率密度 |Ψ(x,t)|²"},
+    legend: {title: {text: "时间 t"}, yanchor: "top", y: 0.99, xanchor: "right", x: 0.99}});
+});
+"""
+
+
+INDEX_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="zh-CN">
+<head><meta charset="utf-8"><title>Quantum Playground</title></head>
+<body style="font-family: sans-serif; margin: 32px;">
+<h1>Quantum Playground</h1>
+<p>量子物理交互实验室（静态版本）</p>
+<ul>$links</ul>
+</body>
+</html>
+""")
+
+
+def build(out_dir: str | Path) -> list[Path]:
+    """
+    生成静态包
+
+    参数:
+        out_dir: 输出目录（不存在时自动创建）
+
+    返回:
+        生成的文件路径列表
+    """
+    from plotly.offline import get_plotlyjs
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    written = [out_dir / "plotly.min.js"]
+    written[0].write_text(get_plotlyjs(), encoding="utf-8")
+
+    links = []
+    for slug, exporter in EXPORTERS.items():
+        page = exporter()
+        path = out_dir / f"{slug}.html"
+        path.write_text(
+            PAGE_TEMPLATE.substitute(
+                title=page["title"],
+                controls=page["controls"],
+                meta=json.dumps(page["meta"], ensure_ascii=False),
+                data=page["data"],
+                script=page["script"],
+            ),
+            encoding="utf-8",
+        )
+        links.append(f'<li><a href="{slug}.html">{page["title"]}</a></li>')
+        written.append(path)
+
+    index = out_dir / "index.html"
+    index.write_text(INDEX_TEMPLATE.substitute(links="".join(links)), encoding="utf-8")
+    written.append(index)
+
+    return written
+
+
+def main() -> None:
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="导出静态 HTML/JS 版本的 demo")
+    parser.add_argument("--out", default="dist/static", help="输出目录")
+    args = parser.parse_args()
+
+    for path in build(args.out):
+        print(f"{path}  ({path.stat().st_size / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# 驻相近似到底有多准：用 Filon 型求积直接计算传播子积分
+# 上：不同 t 下 |Ψ(x_t, t)| 的数值积分与驻相近似
+# 下：驻相近似的最大误差随 t 的变化（t 越小，相位转得越快，近似越准）
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import numpy as np
+import matplotlib.pyplot as plt
+from core.oscillatory import free_propagate
+from core.utils import set_chinese_font
+
+set_chinese_font()
+
+# ---------- 参数 ----------
+m = 1.0
+hbar = 1.0
+sigma = 1.0
+k0 = 2.0
+x_min, x_max = -10.0, 10.0
+
+
+def psi0(x):
+    """初始高斯波包（带平均波数 k0）"""
+    return (2 * np.pi * sigma**2) ** -0.25 * np.exp(-x**2 / (4 * sigma**2) + 1j * k0 * x)
+
+
+x_t = np.linspace(-6, 6, 600)
+
+fig, axes = plt.subplots(2, 1, figsize=(9, 10))
+
+# ---------- 图 1：数值积分 vs 驻相近似 ----------
+approx = np.abs(free_propagate(psi0, x_t, 0.01, x_min, x_max, m, hbar, stationary_phase=True))
+axes[0].plot(x_t, approx, linewidth=3, color="lightgray", label="驻相近似 = |Ψ(x, 0)|")
+
+for t in (0.01, 0.3, 1.0):
+    psi = free_propagate(psi0, x_t, t, x_min, x_max, m, hbar)
+    axes[0].plot(x_t, np.abs(psi), linewidth=1.5, label=f"数值积分 t = {t}")
+
+axes[0].set_xlabel("$x_t$")
+axes[0].set_ylabel(r"$|\Psi(x_t, t)|$")
+axes[0].set_title("传播子积分：数值结果与驻相近似")
+axes[0].grid(True, linewidth=0.5)
+axes[0].legend()
+
+# ---------- 图 2：驻相近似的误差 ----------
+times = np.logspace(-4, 0.5, 30)
+errors = [
+    np.max(np.abs(
+        free_propagate(psi0, x_t, t, x_min, x_max, m, hbar)
+        - free_propagate(psi0, x_t, t, x_min, x_max, m, hbar, stationary_phase=True)
+    ))
+    for t in times
+]
+
+axes[1].loglog(times, errors, "o-", linewidth=1.5)
+axes[1].set_xlabel("t")
+axes[1].set_ylabel("驻相近似的最大误差")
+axes[1].set_title("驻相近似的误差 ∝ t（每个 t 的求积点数相同）")
+axes[1].grid(True, which="both", linewidth=0.5)
+
+plt.tight_layout()
+plt.show()
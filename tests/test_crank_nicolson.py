@@ -0,0 +1,61 @@
+"""
+Crank–Nicolson 求解器：范数守恒、自由演化与解析高斯波包一致，分解缓存受字节预算约束
+"""
+
+import numpy as np
+import pytest
+
+from core import crank_nicolson
+from core.crank_nicolson import NORM_TOLERANCE, evolve_crank_nicolson
+from core.gaussian_wavepacket import compute_wavefunction
+
+
+@pytest.mark.parametrize(
+    "precision, complex_dtype", [("float64", np.complex128), ("float32", np.complex64)]
+)
+def test_norm_drift_within_tolerance(precision, complex_dtype):
+    x = np.linspace(-20.0, 20.0, 2001)
+    psi0 = np.stack([compute_wavefunction(x, 0.0, x0=x0, k0=2.0) for x0 in (-5.0, 0.0, 5.0)], axis=1)
+
+    # 谐振子势加一个势垒：反射与透射都会发生
+    potential = 0.05 * x**2 + 3.0 * (np.abs(x - 2.0) < 0.5)
+    frames = evolve_crank_nicolson(psi0, x, potential, 0.01, 2000, frame_every=100, precision=precision)
+
+    drifts = [np.max(np.abs(norms - 1.0)) for _, _, norms in frames]
+
+    assert len(drifts) == 21
+    assert max(drifts) < NORM_TOLERANCE[complex_dtype]
+
+
+def test_free_evolution_matches_analytic_gaussian():
+    x = np.linspace(-40.0, 40.0, 4001)
+    t_max, dt = 5.0, 0.005
+    psi0 = compute_wavefunction(x, 0.0, k0=1.0)
+
+    for t, psi, norm in evolve_crank_nicolson(psi0, x, np.zeros_like(x), dt, 1000, frame_every=250):
+        # 误差主要来自 Δx = 0.02 的二阶差分
+        np.testing.assert_allclose(psi, compute_wavefunction(x, t, k0=1.0), rtol=0, atol=1e-3)
+
+    assert t == pytest.approx(t_max)
+    assert norm == pytest.approx(1.0, abs=1e-10)
+
+
+def test_factorization_cache_bounded(monkeypatch):
+    x = np.linspace(-10.0, 10.0, 500)
+    psi0 = compute_wavefunction(x, 0.0)
+    monkeypatch.setattr(crank_nicolson, "FACTORIZATION_CACHE_BYTES", 2**20)
+
+    for strength in np.linspace(0.1, 2.0, 20):
+        # 每次 10 个势能同时分解，约 160 KB
+        potential = np.outer(x**2, strength * np.arange(1, 11))
+        psi = np.repeat(psi0[:, np.newaxis], 10, axis=1)
+        for _ in evolve_crank_nicolson(psi, x, potential, 0.01, 1):
+            pass
+
+        cache = crank_nicolson._factorization_cache
+        assert crank_nicolson._factorization_bytes == sum(
+            crank_nicolson._factorization_nbytes(f) for f in cache.values()
+        )
+        assert crank_nicolson._factorization_bytes <= 2**20 or len(cache) == 1
+
+    assert 1 < len(cache) < 20
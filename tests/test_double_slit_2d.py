@@ -0,0 +1,44 @@
+"""
+二维双缝求解器：挡板反射而不吸收，输出帧坐标与模拟网格一致
+"""
+
+import numpy as np
+import pytest
+
+from core.double_slit_2d import frame_coords, grid_coords, simulate_double_slit_2d
+
+NUM_POINTS = 128
+BOX_SIZE = 40.0
+
+
+def _last_frame(num_points=NUM_POINTS, **params):
+    for _, density in simulate_double_slit_2d(
+        num_points=num_points, box_size=BOX_SIZE, downsample=1, absorb_strength=0.0, **params
+    ):
+        pass
+    return density
+
+
+@pytest.mark.parametrize("dt", [0.01, 0.002])
+def test_norm_conserved_without_absorbing_layer(dt):
+    num_steps = int(round(3.0 / dt))
+    density = _last_frame(dt=dt, num_steps=num_steps, frame_every=num_steps)
+
+    assert density.sum() * (BOX_SIZE / NUM_POINTS) ** 2 == pytest.approx(1.0, abs=1e-4)
+
+
+def test_wall_without_slits_reflects():
+    # 演示页面的分辨率：挡板厚度覆盖多个格点
+    num_points = 256
+    density = _last_frame(num_points, slit_width=0.0, num_steps=300, frame_every=300)
+    y = grid_coords(num_points, BOX_SIZE)
+
+    assert density[y > 0.5].sum() * (BOX_SIZE / num_points) ** 2 < 1e-3
+
+
+def test_frame_coords_are_block_means():
+    coords = grid_coords(NUM_POINTS, BOX_SIZE)
+
+    np.testing.assert_array_equal(frame_coords(NUM_POINTS, BOX_SIZE, 1), coords)
+    np.testing.assert_allclose(frame_coords(NUM_POINTS, BOX_SIZE, 2), 0.5 * (coords[0::2] + coords[1::2]))
+    assert coords[NUM_POINTS // 2] == 0.0
@@ -0,0 +1,56 @@
+"""
+执行后端：分块结果与串行一致，共享线程池在交替与并发调用下保持不变
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from core import execution
+
+
+@pytest.fixture
+def small_chunks():
+    previous = execution.get_config()
+    execution.configure(chunk_size=1000, serial_threshold=0)
+    yield
+    execution.configure(
+        chunk_size=previous["chunk_size"],
+        serial_threshold=previous["serial_threshold"],
+    )
+
+
+def test_alternating_calls_reuse_pool(small_chunks):
+    x = np.linspace(0.0, 1.0, 200_000)
+    columns = x.reshape(1000, 200)
+
+    pools = set()
+    for num_threads in (2, 3, 4, 7):
+        assert np.array_equal(execution.evaluate_elementwise(np.cos, x, num_threads), np.cos(x))
+        pools.add(id(execution._get_executor()))
+        assert np.array_equal(execution.evaluate_columnwise(np.sin, columns, num_threads), np.sin(columns))
+        pools.add(id(execution._get_executor()))
+
+    assert len(pools) == 1
+
+
+def test_concurrent_calls(small_chunks):
+    x = np.linspace(0.0, 1.0, 200_000)
+    errors = []
+
+    def worker(num_threads):
+        try:
+            for _ in range(20):
+                assert np.array_equal(execution.evaluate_elementwise(np.exp, x, num_threads), np.exp(x))
+                execution.evaluate_columnwise(np.sqrt, x.reshape(1000, 200), num_threads)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in (1, 2, 3, 5, 8, 16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
@@ -0,0 +1,93 @@
+"""
+条纹分析：周期与 λL/d、可见度与 γ 一致，窗口内条纹不足时报告未分辨
+"""
+
+import numpy as np
+import pytest
+
+from core.double_slit import sample_double_slit_hits
+from core.fringe_analysis import StreamingFringeAnalyzer, analyze_fringes, analyze_fringes_2d
+
+NUM_BINS = 1000
+
+
+def _streamed(wavelength, slit_distance, screen_distance, x_range, coherence, num_hits=2_000_000):
+    analyzer = StreamingFringeAnalyzer(NUM_BINS, -x_range, x_range)
+    rng = np.random.default_rng(0)
+    for _ in range(4):
+        analyzer.add_hits(sample_double_slit_hits(
+            num_hits // 4, wavelength, slit_distance, screen_distance, x_range, coherence, rng
+        ))
+    return analyzer.estimate()
+
+
+@pytest.mark.parametrize(
+    "wavelength, slit_distance, screen_distance, x_range",
+    [
+        (0.5, 2.0, 10.0, 25.0),
+        (0.3, 10.0, 10.0, 50.0),
+        (1.0, 1.0, 10.0, 50.0),
+        (0.4, 5.0, 2.0, 5.0),
+        (1.0, 1.0, 20.0, 25.0),
+    ],
+)
+def test_period_matches_theory(wavelength, slit_distance, screen_distance, x_range):
+    result = _streamed(wavelength, slit_distance, screen_distance, x_range, coherence=0.8)
+
+    assert result["resolved"]
+    expected = wavelength * screen_distance / slit_distance
+    assert result["period"] == pytest.approx(expected, rel=5e-3)
+
+
+@pytest.mark.parametrize("coherence", [0.1, 0.3, 0.6, 1.0])
+@pytest.mark.parametrize("x_range", [5.0, 50.0])
+def test_visibility_matches_coherence(coherence, x_range):
+    # 周期 0.3：x_range = 50 时 bin 宽 0.1，bin 平均使振幅衰减到 sinc(1/3) ≈ 0.83
+    result = _streamed(0.3, 10.0, 10.0, x_range, coherence)
+
+    assert result["visibility"] == pytest.approx(coherence, abs=0.01)
+
+
+def test_binned_profile_visibility_corrected():
+    period, visibility, dx = 0.3, 0.3, 0.1
+    edges = -50.0 + dx * np.arange(NUM_BINS + 1)
+
+    # 每个 bin 上 1 + V cos(2πx/P) 的精确平均
+    integral = edges + visibility * period / (2 * np.pi) * np.sin(2 * np.pi * edges / period)
+    profile = np.diff(integral) / dx
+
+    raw = analyze_fringes(profile, dx=dx, x0=-50.0 + dx / 2)
+    corrected = analyze_fringes(profile, dx=dx, x0=-50.0 + dx / 2, binned=True)
+
+    assert raw["visibility"] == pytest.approx(visibility * np.sinc(dx / period), rel=1e-3)
+    assert corrected["visibility"] == pytest.approx(visibility, rel=1e-3)
+    assert corrected["period"] == pytest.approx(period, rel=1e-4)
+
+
+@pytest.mark.parametrize("x_range", [5.0, 15.0, 20.0])
+def test_too_few_periods_unresolved(x_range):
+    # 周期 λL/d = 20，窗口 2·x_range 内不足约两个周期
+    result = _streamed(1.0, 1.0, 20.0, x_range, coherence=0.5)
+
+    assert not result["resolved"]
+    assert np.isnan(result["period"]) and np.isnan(result["visibility"])
+    assert result["total"] > 0
+
+
+def test_unresolved_profile_and_image():
+    x = np.linspace(-5.0, 5.0, 500)
+    profile = 1 + 0.5 * np.cos(2 * np.pi * x / 20.0)
+
+    assert not analyze_fringes(profile, dx=x[1] - x[0])["resolved"]
+    assert not analyze_fringes_2d(np.tile(profile, (64, 1)), dx=x[1] - x[0])["resolved"]
+
+    profile = 1 + 0.5 * np.cos(2 * np.pi * x / 2.0)
+    result = analyze_fringes(profile, dx=x[1] - x[0], x0=x[0])
+    assert result["resolved"]
+    assert result["period"] == pytest.approx(2.0, rel=1e-3)
+
+
+def test_empty_analyzer():
+    result = StreamingFringeAnalyzer(NUM_BINS, -5.0, 5.0).estimate()
+
+    assert result["total"] == 0 and not result["resolved"]
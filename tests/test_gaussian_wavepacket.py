@@ -0,0 +1,39 @@
+"""
+高斯波包：解析可观测量与网格上的概率密度一致
+"""
+
+import numpy as np
+import pytest
+
+from core.gaussian_wavepacket import compute_observables, compute_probability_density
+
+PARAMETER_SETS = [
+    dict(),
+    dict(x0=-3.0, k0=1.5, sigma=0.7),
+    dict(x0=2.0, k0=-0.5, sigma=1.5, mass=2.0, hbar=0.5),
+]
+
+
+@pytest.mark.parametrize("params", PARAMETER_SETS)
+@pytest.mark.parametrize("t", [0.0, 1.0, 4.0, 10.0])
+def test_observables_match_density_moments(params, t):
+    x = np.linspace(-80.0, 80.0, 40_001)
+    dx = x[1] - x[0]
+
+    rho = compute_probability_density(x, t, **params)
+    observables = compute_observables(t, **params)
+
+    norm = rho.sum() * dx
+    mean_x = (x * rho).sum() * dx
+    delta_x = np.sqrt(((x - mean_x) ** 2 * rho).sum() * dx)
+
+    assert norm == pytest.approx(observables["norm"], rel=1e-9)
+    assert mean_x == pytest.approx(observables["mean_x"], abs=1e-9)
+    assert delta_x == pytest.approx(observables["delta_x"], rel=1e-9)
+
+
+def test_default_width_is_analytic():
+    t = np.linspace(0.0, 20.0, 41)
+
+    # σ = m = ℏ = 1：Δx(t) = √(1 + (t/2)²)
+    np.testing.assert_allclose(compute_observables(t)["delta_x"], np.sqrt(1 + (t / 2) ** 2))
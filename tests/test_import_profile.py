@@ -0,0 +1,32 @@
+"""
+Demo 导入检查：在全新的解释器中逐个导入 demo，重型库不应出现在 sys.modules 中
+
+耗时与内存预算受机器负载影响，标记为 slow，默认不运行：
+    python -m pytest -m slow
+"""
+
+import pytest
+
+from demos import find_demo_files
+from demos.import_profile import ALL_DEMOS, profile_demos, profile_import
+
+DEMO_MODULES = [module_name for _, _, module_name in find_demo_files()] + [ALL_DEMOS]
+
+
+@pytest.mark.parametrize("module_name", DEMO_MODULES)
+def test_demo_does_not_import_heavy_modules(module_name):
+    result = profile_import(module_name, repeat=1)
+
+    assert result["heavy"] == [], f"{module_name} 在顶层导入了重型库：{result['heavy']}"
+
+
+@pytest.mark.slow
+def test_demo_imports_within_budget():
+    profiles = profile_demos()
+
+    over = {
+        name: f"{p['ms']:.1f} ms / {p['budget_ms']:.0f} ms, {p['mb']:.1f} MB / {p['budget_mb']:.0f} MB"
+        for name, p in profiles.items()
+        if not p["ok"]
+    }
+    assert not over, f"导入预算超出：{over}"
@@ -0,0 +1,26 @@
+"""
+条纹间距公式与叠加波函数数值相位梯度的比较
+"""
+
+import numpy as np
+import pytest
+
+from core.gaussian_wavepacket import compute_wavefunction
+from core.interference import fringe_spacing
+
+
+@pytest.mark.parametrize("t", [0.5, 2.0, 8.0])
+@pytest.mark.parametrize("separation, k0", [(6.0, 0.0), (6.0, 2.0), (8.0, 1.0), (3.0, 3.0)])
+def test_fringe_spacing_matches_phase_gradient(t, separation, k0):
+    # 与双波包演示相同的布局：左侧波包波数 +k₀，右侧 -k₀
+    x = np.linspace(-2.0, 2.0, 4001)
+    left = compute_wavefunction(x, t, x0=-separation / 2, k0=k0)
+    right = compute_wavefunction(x, t, x0=separation / 2, k0=-k0)
+
+    phase = np.unwrap(np.angle(right * np.conj(left)))
+    gradient = np.gradient(phase, x)
+
+    # 等宽波包的相位差是 x 的线性函数，梯度处处相同
+    np.testing.assert_allclose(gradient, gradient.mean(), atol=1e-6)
+    expected = fringe_spacing(t, separation, delta_k=-2 * k0)
+    assert expected == pytest.approx(2 * np.pi / abs(gradient.mean()), rel=1e-6)
@@ -0,0 +1,180 @@
+"""
+float32 与 float64 结果的误差检查
+
+参数范围取自演示页面的滑块定义，误差界见 core.precision 的模块说明。
+"""
+
+import importlib
+import itertools
+
+import numpy as np
+import pytest
+
+from core.bohmian import compute_gaussian_trajectories
+from core.double_slit import compute_double_slit
+from core.double_slit_2d import simulate_double_slit_2d
+from core.gaussian_wavepacket import compute_probability_density, compute_wavefunction
+from core.interference import compute_interference_density
+from core.phase_space import (
+    compute_momentum_density,
+    compute_wigner,
+    sampled_momentum_density,
+    sampled_wigner,
+)
+from core.precision import get_precision, resolve_dtypes, set_precision
+
+# float32 单位舍入误差
+EPS = 2.0**-24
+
+double_slit_demo = importlib.import_module("demos.01_double_slit")
+wavepacket_demo = importlib.import_module("demos.02_gaussian_wavepacket")
+interference_demo = importlib.import_module("demos.04_wavepacket_interference")
+
+# 每个滑块在端点之外额外抽取的内部采样点数
+NUM_INTERIOR = 6
+
+
+def _slider_values(spec: dict, rng: np.random.Generator) -> list[float]:
+    """滑块的两个端点，加上按滑块步长取整的若干内部点"""
+    lo, hi, step = spec["min_value"], spec["max_value"], spec["step"]
+    interior = lo + step * rng.integers(1, round((hi - lo) / step), NUM_INTERIOR)
+    return [lo, hi, *np.round(interior, 10).tolist()]
+
+
+def _double_slit_points() -> list[tuple[float, ...]]:
+    """滑块范围的全部角点，加上在各滑块内部随机组合的参数点"""
+    names = ("wavelength", "slit_distance", "screen_distance", "x_range")
+    rng = np.random.default_rng(0)
+    values = [_slider_values(double_slit_demo.SLIDERS[name], rng) for name in names]
+
+    corners = list(itertools.product(*(v[:2] for v in values)))
+    interior = list(zip(*(v[2:] for v in values)))
+    return corners + interior
+
+
+@pytest.mark.parametrize("wavelength, slit_distance, screen_distance, x_range", _double_slit_points())
+@pytest.mark.parametrize("num_points", double_slit_demo.NUM_POINTS_OPTIONS)
+def test_double_slit_float32_bound(wavelength, slit_distance, screen_distance, x_range, num_points):
+    args = (wavelength, slit_distance, screen_distance, x_range, num_points)
+
+    x64, i64 = compute_double_slit(*args, precision="float64")
+    x32, i32 = compute_double_slit(*args, precision="float32")
+
+    assert i32.dtype == np.float32
+    delta = np.pi * slit_distance * x64 / (wavelength * screen_distance)
+    assert np.all(np.abs(i32 - i64) <= 4 * EPS * np.abs(delta) + 8 * EPS)
+
+
+# 预设时间点，以及预设之间（自定义输入）的时刻
+WAVEPACKET_TIMES = sorted(
+    {t for ts in wavepacket_demo.PRESET_OPTIONS.values() for t in ts} | {0.3, 3.7, 12.9, 17.5}
+)
+
+
+@pytest.mark.parametrize("t", WAVEPACKET_TIMES)
+@pytest.mark.parametrize(
+    "x_range", _slider_values(wavepacket_demo.X_RANGE_SLIDER, np.random.default_rng(1))[:4]
+)
+@pytest.mark.parametrize("num_points", wavepacket_demo.NUM_POINTS_OPTIONS)
+def test_probability_density_float32_bound(t, x_range, num_points):
+    x = np.linspace(-x_range, x_range, num_points)
+
+    rho64 = compute_probability_density(x, t, precision="float64")
+    rho32 = compute_probability_density(x, t, precision="float32")
+
+    assert rho32.dtype == np.float32
+    assert np.max(np.abs(rho32 - rho64)) <= 6 * EPS * rho64.max()
+
+
+@pytest.mark.parametrize(
+    "separation, k0, phase",
+    list(itertools.product((2.0, 16.0), (0.0, 3.0), (0.0, np.pi)))
+    + [(5.5, 0.75, 0.25 * np.pi), (9.0, 1.5, 1.5 * np.pi), (12.5, 2.25, np.pi)],
+)
+def test_interference_float32_bound(separation, k0, phase):
+    x_max, t_max = interference_demo.X_MAX, interference_demo.T_MAX
+    x = np.linspace(-x_max, x_max, interference_demo.NUM_X)
+    t = np.linspace(0.0, t_max, interference_demo.NUM_T)
+    packets = interference_demo._packets(separation, k0, phase)
+
+    rho64 = compute_interference_density(x, t, packets, precision="float64")
+    rho32 = compute_interference_density(x, t, packets, precision="float32")
+
+    assert rho32.dtype == np.float32
+    reach = x_max + separation / 2
+    theta = k0 * reach + reach**2 / 8
+    assert np.max(np.abs(rho32 - rho64)) <= (12 + 4 * theta) * EPS * rho64.max()
+
+
+def test_double_slit_2d_float32_bound():
+    num_steps, num_points = 200, 128
+    args = dict(num_points=num_points, num_steps=num_steps, frame_every=50, downsample=1)
+
+    frames64 = list(simulate_double_slit_2d(**args, precision="float64"))
+    frames32 = list(simulate_double_slit_2d(**args, precision="float32"))
+
+    for (_, rho64), (_, rho32) in zip(frames64, frames32):
+        bound = 2 * num_steps * EPS * np.log2(num_points) * rho64.max()
+        assert np.max(np.abs(rho32 - rho64)) <= bound
+
+
+@pytest.mark.parametrize("t", [0.0, 5.0, 20.0])
+def test_wigner_float32_bound(t):
+    x = np.linspace(-30, 30, 512)
+    p = np.linspace(-5, 5, 400)
+
+    w64 = compute_wigner(x, p, t, k0=2.0, precision="float64")
+    w32 = compute_wigner(x, p, t, k0=2.0, precision="float32")
+
+    assert w32.dtype == np.float32
+    bound = (2 * EPS * (np.abs(x).max() + np.abs(p).max() * t) + 6 * EPS) * w64.max()
+    assert np.max(np.abs(w32 - w64)) <= bound
+
+
+def test_momentum_density_float32_bound():
+    p = np.linspace(-5, 5, 1000)
+
+    phi64 = compute_momentum_density(p, k0=2.0, precision="float64")
+    phi32 = compute_momentum_density(p, k0=2.0, precision="float32")
+
+    assert phi32.dtype == np.float32
+    assert np.max(np.abs(phi32 - phi64)) <= 6 * EPS * phi64.max()
+
+
+@pytest.mark.parametrize("transform", [sampled_momentum_density, sampled_wigner])
+def test_sampled_phase_space_float32(transform):
+    x = np.linspace(-20, 20, 256)
+    psi = compute_wavefunction(x, 3.0, k0=1.0)
+
+    _, a64 = transform(psi, x, precision="float64")
+    _, a32 = transform(psi, x, precision="float32")
+
+    assert a32.dtype == np.float32
+    assert np.max(np.abs(a32 - a64)) <= 10 * EPS * np.log2(x.size) * np.abs(a64).max()
+
+
+@pytest.mark.parametrize("k0", [0.0, 3.0])
+def test_bohmian_float32_bound(k0):
+    num_steps = 1000
+    args = dict(num_particles=10_000, t_max=20.0, num_steps=num_steps, k0=k0)
+
+    r64 = compute_gaussian_trajectories(**args, precision="float64")
+    r32 = compute_gaussian_trajectories(**args, precision="float32")
+
+    bound = num_steps * EPS * np.abs(r64["trajectories"]).max()
+    assert np.max(np.abs(r32["trajectories"] - r64["trajectories"])) <= bound
+    assert np.max(np.abs(r32["std"] - r64["std"])) <= bound
+
+
+def test_global_precision_setting():
+    previous = get_precision()
+    try:
+        set_precision("float32")
+        assert resolve_dtypes() == (np.float32, np.complex64)
+        assert compute_probability_density(np.linspace(-5, 5, 100), 1.0).dtype == np.float32
+        assert resolve_dtypes("float64") == (np.float64, np.complex128)
+    finally:
+        set_precision(previous)
+
+    with pytest.raises(ValueError):
+        set_precision("float16")
@@ -0,0 +1,120 @@
+"""
+会话存储：单会话 LRU、全局预算与空闲释放（注入时钟），以及环境变量的回退
+"""
+
+import importlib
+
+import numpy as np
+import pytest
+
+from demos import session_store
+from demos.session_store import SessionStore
+
+KB = 1024
+
+
+class FakeClock:
+    """手动推进的时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _block(kb: int) -> np.ndarray:
+    return np.zeros(kb * KB, dtype=np.uint8)
+
+
+def test_session_lru_eviction():
+    clock = FakeClock()
+    store = SessionStore(session_budget=3 * KB, global_budget=100 * KB, clock=clock)
+
+    for key in "abc":
+        clock.now += 1
+        assert store.put(key, _block(1), session_id="s")
+
+    # 访问 a 后，最久未使用的是 b
+    clock.now += 1
+    assert store.get("a", session_id="s") is not None
+    clock.now += 1
+    store.put("d", _block(1), session_id="s")
+
+    assert store.get("b", session_id="s") is None
+    assert all(store.get(key, session_id="s") is not None for key in "acd")
+    assert store.metrics()["sessions"]["s"]["bytes"] == 3 * KB
+    assert store.metrics()["evictions"] == 1
+
+
+def test_oversized_result_rejected():
+    store = SessionStore(session_budget=2 * KB, global_budget=100 * KB, clock=FakeClock())
+
+    assert not store.put("big", _block(3), session_id="s")
+    assert store.metrics()["rejected"] == 1
+    assert store.metrics()["total_bytes"] == 0
+
+
+def test_global_budget_evicts_oldest_across_sessions():
+    clock = FakeClock()
+    store = SessionStore(session_budget=10 * KB, global_budget=4 * KB, clock=clock)
+
+    for session_id, key in [("s1", "a"), ("s2", "b"), ("s1", "c"), ("s2", "d")]:
+        clock.now += 1
+        store.put(key, _block(1), session_id=session_id)
+
+    # 超出全局预算：淘汰所有会话中最久未使用的 s1/a
+    clock.now += 1
+    store.put("e", _block(1), session_id="s3")
+
+    assert store.get("a", session_id="s1") is None
+    assert store.get("c", session_id="s1") is not None
+    assert store.get("b", session_id="s2") is not None
+    metrics = store.metrics()
+    assert metrics["total_bytes"] == 4 * KB
+    assert sum(s["bytes"] for s in metrics["sessions"].values()) == metrics["total_bytes"]
+
+
+def test_idle_sessions_released():
+    clock = FakeClock()
+    store = SessionStore(session_budget=10 * KB, global_budget=100 * KB, idle_timeout=60.0, clock=clock)
+
+    store.put("a", _block(1), session_id="idle")
+    clock.now = 30.0
+    store.put("b", _block(1), session_id="active")
+
+    # 恰好到时限时仍保留，超过后整体释放
+    clock.now = 60.0
+    assert set(store.metrics()["sessions"]) == {"idle", "active"}
+    clock.now = 61.0
+    metrics = store.metrics()
+
+    assert set(metrics["sessions"]) == {"active"}
+    assert metrics["total_bytes"] == KB
+    assert store.get("a", session_id="idle") is None
+    assert store.get("b", session_id="active") is not None
+
+
+@pytest.mark.parametrize("value", ["abc", "-5", "0", "nan", "inf"])
+def test_invalid_env_falls_back(monkeypatch, value):
+    monkeypatch.setenv("QR_SESSION_BUDGET_MB", value)
+    monkeypatch.setenv("QR_SESSION_IDLE_SECONDS", value)
+
+    try:
+        with pytest.warns(RuntimeWarning, match="QR_SESSION"):
+            module = importlib.reload(session_store)
+        assert module.DEFAULT_SESSION_BUDGET == 64 * 2**20
+        assert module.DEFAULT_IDLE_TIMEOUT == 600
+    finally:
+        monkeypatch.undo()
+        importlib.reload(session_store)
+
+
+def test_valid_env_used(monkeypatch):
+    monkeypatch.setenv("QR_GLOBAL_BUDGET_MB", "0.5")
+
+    try:
+        assert importlib.reload(session_store).DEFAULT_GLOBAL_BUDGET == 2**19
+    finally:
+        monkeypatch.undo()
+        importlib.reload(session_store)
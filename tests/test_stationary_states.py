@@ -0,0 +1,43 @@
+"""
+束缚态求解器与稠密对角化的比较
+
+双势阱的能级成对近简并，只请求奇数个能级时，
+第 k 个能级与未请求的第 k+1 个能级劈裂极小，是逆迭代子空间最容易出错的情形。
+"""
+
+import importlib
+
+import numpy as np
+import pytest
+
+from core.stationary_states import build_hamiltonian, solve_bound_states
+from core.tridiagonal import count_eigenvalues_below
+
+stationary_demo = importlib.import_module("demos.03_stationary_states")
+double_well = stationary_demo.POTENTIALS["双势阱"][0]
+
+
+@pytest.mark.parametrize("strength", [2.0, 6.0, 10.0])
+@pytest.mark.parametrize("num_states", [1, 2, 3, 10])
+def test_double_well_matches_dense(strength, num_states):
+    x = np.linspace(-8.0, 8.0, 1000)
+    diag, off = build_hamiltonian(x, double_well(x, strength))
+    exact = np.linalg.eigvalsh(np.diag(diag) + np.diag(off, 1) + np.diag(off, -1))
+
+    energies, wavefunctions = solve_bound_states(x, double_well(x, strength), num_states)
+
+    np.testing.assert_allclose(energies, exact[:num_states], rtol=0, atol=1e-9)
+    dx = x[1] - x[0]
+    np.testing.assert_allclose(wavefunctions @ wavefunctions.T * dx, np.eye(num_states), atol=1e-9)
+
+
+@pytest.mark.parametrize("strength", [6.0, 10.0])
+def test_double_well_ground_state_large_grid(strength):
+    x = np.linspace(-8.0, 8.0, 10_000)
+    diag, off = build_hamiltonian(x, double_well(x, strength))
+
+    energies, _ = solve_bound_states(x, double_well(x, strength), num_states=1)
+
+    # 基态之下没有本征值，基态与第一激发态之间恰有一个
+    assert count_eigenvalues_below(diag, off, [energies[0] - 1e-7])[0] == 0
+    assert count_eigenvalues_below(diag, off, [energies[0] + 1e-7])[0] == 1
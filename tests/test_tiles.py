@@ -0,0 +1,78 @@
+"""
+瓦片金字塔：视图与直接求值一致，并发请求时每块瓦片只计算一次
+"""
+
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+from core.interference import compute_interference_density
+from core.tiles import TilePyramid
+
+PACKETS = [dict(x0=-4.0, k0=0.0), dict(x0=4.0, k0=0.0)]
+
+
+def _kernel(t, x):
+    return compute_interference_density(x, t, PACKETS)
+
+
+def test_render_view_matches_direct_evaluation():
+    pyramid = TilePyramid(_kernel, (0.0, 10.0), (-30.0, 30.0))
+
+    for x_view in [(-30.0, 30.0), (-2.0, 2.0), (-1.5, 2.5)]:
+        view = pyramid.render_view((0.0, 10.0), x_view, 400, 1000)
+        direct = _kernel(view["t"], view["x"])
+        np.testing.assert_allclose(view["values"], direct, atol=1e-6)
+        assert view["x"].size >= 1000 and view["t"].size >= 400
+
+
+def test_panning_computes_only_new_tiles():
+    pyramid = TilePyramid(_kernel, (0.0, 10.0), (-30.0, 30.0))
+
+    first = pyramid.render_view((0.0, 10.0), (-15.0, 15.0), 400, 1000)
+    panned = pyramid.render_view((0.0, 10.0), (-14.0, 16.0), 400, 1000)
+
+    assert first["computed"] == first["tiles"]
+    assert panned["levels"] == first["levels"]
+    assert 0 < panned["computed"] < panned["tiles"]
+
+
+def test_concurrent_views_compute_each_tile_once():
+    calls = Counter()
+    lock = threading.Lock()
+
+    def slow_kernel(t, x):
+        with lock:
+            calls[(t[0], x[0])] += 1
+        time.sleep(0.01)
+        return _kernel(t, x)
+
+    pyramid = TilePyramid(slow_kernel, (0.0, 10.0), (-30.0, 30.0))
+    views = []
+
+    def render():
+        views.append(pyramid.render_view((0.0, 10.0), (-30.0, 30.0), 200, 500))
+
+    threads = [threading.Thread(target=render) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(calls.values()) == 1
+    assert sum(view["computed"] for view in views) == views[0]["tiles"] == len(calls)
+    assert pyramid.metrics()["misses"] == len(calls)
+
+
+def test_from_array_downsamples():
+    t = np.linspace(0.0, 10.0, 300)
+    x = np.linspace(-30.0, 30.0, 2000)
+    pyramid = TilePyramid.from_array(_kernel(t, x), t, x)
+
+    view = pyramid.render_view((0.0, 10.0), (-30.0, 30.0), 100, 200)
+
+    assert view["computed"] == 0
+    assert view["levels"] == (0, 1)
+    np.testing.assert_allclose(view["values"], _kernel(view["t"], view["x"]), atol=1e-3)
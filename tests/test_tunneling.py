@@ -0,0 +1,128 @@
+"""
+传递矩阵法：方势垒与势阶的解析结果，以及厚势垒的对数尺度归一
+"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from core.tunneling import RENORMALIZE_EVERY, transmission_spectrum
+
+
+def _barrier_log_transmission(energies, height, width, mass=1.0, hbar=1.0):
+    """方势垒透射系数的对数：T = 1 / (1 + V₀² s² / (4E|E - V₀|))，s = sin(ka) 或 sinh(κa)"""
+    q = np.sqrt(2 * mass * np.abs(energies - height)) / hbar
+    ratio = height**2 / (4 * energies * np.abs(energies - height))
+
+    # 势垒下方 log sinh²(κa) = 2κa + 2 log((1 - e^{-2κa}) / 2)，大 κa 时不溢出
+    log_s2 = np.where(
+        energies < height,
+        2 * q * width + 2 * np.log((1 - np.exp(-2 * q * width)) / 2),
+        np.log(np.sin(q * width) ** 2 + 1e-300),
+    )
+    return -np.logaddexp(0.0, np.log(ratio) + log_s2)
+
+
+@pytest.mark.parametrize("height, width", [(1.0, 1.0), (5.0, 0.5), (2.0, 3.0)])
+def test_rectangular_barrier(height, width):
+    energies = np.linspace(0.05, 4 * height, 400)
+    energies = energies[np.abs(energies - height) > 1e-6]
+
+    result = transmission_spectrum(energies, [height], [width])
+
+    expected = np.exp(_barrier_log_transmission(energies, height, width))
+    np.testing.assert_allclose(result["transmission"], expected, rtol=1e-10, atol=1e-14)
+    np.testing.assert_allclose(result["transmission"] + result["reflection"], 1.0)
+
+
+def test_rectangular_barrier_at_top():
+    # E = V₀：T = 1 / (1 + m a² V₀ / (2ℏ²))
+    result = transmission_spectrum([3.0], [3.0], [2.0], mass=0.5, hbar=1.5)
+
+    assert result["transmission"][0] == pytest.approx(1 / (1 + 0.5 * 4.0 * 3.0 / (2 * 1.5**2)))
+
+
+@pytest.mark.parametrize("step", [0.5, 2.0])
+def test_potential_step(step):
+    energies = np.linspace(0.01, 10.0, 500)
+
+    result = transmission_spectrum(energies, [], [], v_right=step)
+
+    above = energies > step
+    k_left = np.sqrt(2 * energies[above])
+    k_right = np.sqrt(2 * (energies[above] - step))
+    np.testing.assert_allclose(
+        result["transmission"][above], 4 * k_left * k_right / (k_left + k_right) ** 2, rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        result["reflection"][above], ((k_left - k_right) / (k_left + k_right)) ** 2, atol=1e-12
+    )
+    np.testing.assert_allclose(result["transmission"] + result["reflection"], 1.0)
+
+    # 低于势阶时全反射
+    assert np.all(result["transmission"][~above] == 0.0)
+    assert np.all(result["reflection"][~above] == 1.0)
+
+
+def test_below_left_potential_is_nan():
+    result = transmission_spectrum([0.5, 2.0], [3.0], [1.0], v_left=1.0, v_right=1.0)
+
+    assert np.isnan(result["transmission"][0]) and np.isnan(result["reflection"][0])
+    assert 0.0 < result["transmission"][1] < 1.0
+
+
+def test_thick_barrier_does_not_overflow():
+    height, width = 10.0, 80.0
+    energies = np.linspace(0.5, 9.5, 50)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = transmission_spectrum(energies, [height], [width])
+
+    # κa 最大约 349，T 低至 e^{-698}，仍应与解析结果的对数一致
+    transmission = result["transmission"]
+    assert np.all(transmission > 0)
+    np.testing.assert_allclose(
+        np.log(transmission), _barrier_log_transmission(energies, height, width), rtol=1e-9
+    )
+
+
+def test_periodic_barriers_renormalized():
+    # Kronig-Penney 结构：N 个周期的 (势垒 b, 势阱 w)，需要逐层连乘上千层并定期归一
+    height, b, w, num_periods = 10.0, 0.2, 1.0, 2000
+    energies = np.linspace(0.2, 9.5, 200)
+    assert 2 * num_periods > 100 * RENORMALIZE_EVERY
+
+    result = transmission_spectrum(
+        energies, np.tile([height, 0.0], num_periods), np.tile([b, w], num_periods)
+    )
+    transmission = result["transmission"]
+    assert np.all(np.isfinite(transmission))
+    assert np.all((transmission >= 0) & (transmission <= 1))
+
+    # 1/T_N = 1 + (1/T_1 - 1) U_{N-1}(ξ)²，ξ 为单个周期传递矩阵迹的一半；
+    # 能带内 U_{N-1} = sin Nθ / sin θ（cos θ = ξ），能隙中为 sinh Nθ / sinh θ
+    kappa, k = np.sqrt(2 * (height - energies)), np.sqrt(2 * energies)
+    xi = (
+        np.cosh(kappa * b) * np.cos(k * w)
+        + 0.5 * np.sinh(kappa * b) * np.sin(k * w) * (kappa / k - k / kappa)
+    )
+    band = np.abs(xi) < 1
+
+    with np.errstate(all="ignore"):
+        theta = np.arccos(np.clip(xi, -1, 1))
+        gap_theta = np.arccosh(np.maximum(np.abs(xi), 1))
+        log_u2 = np.where(
+            band,
+            np.log(np.sin(num_periods * theta) ** 2 / np.sin(theta) ** 2),
+            2 * (num_periods * gap_theta - np.log(2 * np.sinh(gap_theta))),
+        )
+    log_t1 = _barrier_log_transmission(energies, height, b)
+    expected = -np.logaddexp(0.0, np.log(-np.expm1(log_t1)) - log_t1 + log_u2)
+
+    representable = expected > np.log(np.finfo(float).tiny) + 10
+    assert representable[band].all()
+    np.testing.assert_allclose(
+        np.log(transmission[representable]), expected[representable], rtol=0, atol=1e-8
+    )